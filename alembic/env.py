@@ -13,6 +13,7 @@ from src.groups.models import *
 from src.buttons.models import *
 from src.inputs.models import *
 from src.actions.models import *
+from src.graph.models import *
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,57 @@
+"""action payload contract
+
+Revision ID: 1b9d7e4c2f68
+Revises: e8c3f5a1d906
+Create Date: 2026-10-18 19:12:03.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b9d7e4c2f68'
+down_revision: Union[str, None] = 'e8c3f5a1d906'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTION_TABLES = {
+    'text_message_actions': ('TEXT_MESSAGE', 'text'),
+    'image_message_actions': ('IMAGE_MESSAGE', 'image_path'),
+}
+
+
+def get_expand_revision():
+    # the sync triggers and their DDL live in the expand revision only
+    return context.script.get_revision(down_revision).module
+
+
+def upgrade() -> None:
+    # a validated check constraint lets SET NOT NULL skip the full table scan under an exclusive lock
+    op.execute('ALTER TABLE actions ADD CONSTRAINT actions_payload_not_null CHECK (payload IS NOT NULL) NOT VALID')
+    op.execute('ALTER TABLE actions VALIDATE CONSTRAINT actions_payload_not_null')
+    op.alter_column('actions', 'payload', nullable=False)
+    op.drop_constraint('actions_payload_not_null', 'actions', type_='check')
+
+    get_expand_revision().drop_sync_triggers()
+    for table in ACTION_TABLES:
+        op.drop_table(table)
+
+
+def downgrade() -> None:
+    for table, (action_type, field) in ACTION_TABLES.items():
+        op.create_table(
+            table,
+            sa.Column('action_id', sa.Uuid(), nullable=False),
+            sa.Column(field, sa.String(length=4096), nullable=False),
+            sa.ForeignKeyConstraint(['action_id'], ['actions.action_id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('action_id'),
+        )
+        op.execute(f'''
+            INSERT INTO {table} (action_id, {field})
+            SELECT action_id, payload ->> '{field}' FROM actions WHERE type = '{action_type}'
+        ''')
+    get_expand_revision().create_sync_triggers()
+    op.alter_column('actions', 'payload', nullable=True)
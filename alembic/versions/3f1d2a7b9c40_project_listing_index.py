@@ -0,0 +1,25 @@
+"""project listing index
+
+Revision ID: 3f1d2a7b9c40
+Revises: 9c67880a4e0e
+Create Date: 2026-10-18 16:05:41.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1d2a7b9c40'
+down_revision: Union[str, None] = '9c67880a4e0e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_projects_created_at_project_id', 'projects', ['created_at', 'project_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_projects_created_at_project_id', table_name='projects')
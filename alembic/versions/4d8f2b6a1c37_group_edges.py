@@ -0,0 +1,57 @@
+"""group edges
+
+Revision ID: 4d8f2b6a1c37
+Revises: 7a2c9e5b1f03
+Create Date: 2026-10-18 23:12:05.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d8f2b6a1c37'
+down_revision: Union[str, None] = '7a2c9e5b1f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EDGE_TABLES = {
+    'buttons': ('button_id', 'BUTTON'),
+    'inputs': ('input_id', 'INPUT'),
+}
+
+
+def upgrade() -> None:
+    op.create_table('group_edges',
+    sa.Column('ref_id', sa.Uuid(), nullable=False),
+    sa.Column('kind', sa.Enum('BUTTON', 'INPUT', name='graphedgekind'), nullable=False),
+    sa.Column('project_id', sa.Uuid(), nullable=False),
+    sa.Column('src_group_id', sa.Uuid(), nullable=False),
+    sa.Column('dst_group_id', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.project_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['src_group_id'], ['groups.group_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['dst_group_id'], ['groups.group_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ref_id')
+    )
+
+    # instances still running the previous release do not write edges,
+    # python -m src.graph.check_edges --repair catches up with what they changed meanwhile
+    for table, (id_column, kind) in EDGE_TABLES.items():
+        op.execute(f'''
+            INSERT INTO group_edges (ref_id, kind, project_id, src_group_id, dst_group_id)
+            SELECT {table}.{id_column}, '{kind}', groups.project_id, {table}.group_id, {table}.destination_group_id
+            FROM {table} JOIN groups ON groups.group_id = {table}.group_id
+            WHERE {table}.destination_group_id IS NOT NULL
+        ''')
+
+    # built after the backfill, which is faster than maintaining them row by row
+    op.create_index('ix_group_edges_project_id', 'group_edges', ['project_id'])
+    op.create_index('ix_group_edges_src_group_id', 'group_edges', ['src_group_id', 'dst_group_id'])
+    op.create_index('ix_group_edges_dst_group_id', 'group_edges', ['dst_group_id', 'src_group_id'])
+
+
+def downgrade() -> None:
+    op.drop_table('group_edges')
+    sa.Enum(name='graphedgekind').drop(op.get_bind())
@@ -0,0 +1,55 @@
+"""foreign key indexes
+
+Revision ID: 7a2c9e5b1f03
+Revises: 1b9d7e4c2f68
+Create Date: 2026-10-18 20:31:50.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2c9e5b1f03'
+down_revision: Union[str, None] = '1b9d7e4c2f68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# buttons.group_id, inputs.group_id and actions.group_id lead their unique constraints already
+
+
+def upgrade() -> None:
+    # CONCURRENTLY does not block writes but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_groups_project_id_created_at',
+            'groups',
+            ['project_id', 'created_at', 'group_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_buttons_destination_group_id',
+            'buttons',
+            ['destination_group_id'],
+            postgresql_where=sa.text('destination_group_id IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_inputs_destination_group_id',
+            'inputs',
+            ['destination_group_id'],
+            postgresql_where=sa.text('destination_group_id IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_inputs_destination_group_id', 'inputs', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_buttons_destination_group_id', 'buttons', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_groups_project_id_created_at', 'groups', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,26 @@
+"""project versions
+
+Revision ID: 9c67880a4e0e
+Revises: 05c12f3cb8f7
+Create Date: 2026-10-18 15:30:12.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c67880a4e0e'
+down_revision: Union[str, None] = '05c12f3cb8f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('projects', sa.Column('version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('projects', 'version')
@@ -0,0 +1,69 @@
+"""sparse sequence ranks
+
+Revision ID: b7e4c1d2a9f3
+Revises: 3f1d2a7b9c40
+Create Date: 2026-10-18 16:40:27.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c1d2a9f3'
+down_revision: Union[str, None] = '3f1d2a7b9c40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RANK_GAP = 2 ** 16
+
+
+def _renumber(table: str, id_column: str, step: int):
+    op.execute(f'''
+        UPDATE {table} SET sequence_number = numbered.position * {step}
+        FROM (
+            SELECT {id_column}, row_number() OVER (
+                PARTITION BY group_id ORDER BY sequence_number, created_at, {id_column}
+            ) AS position
+            FROM {table}
+        ) AS numbered
+        WHERE {table}.{id_column} = numbered.{id_column}
+    ''')
+
+
+def upgrade() -> None:
+    op.drop_constraint('buttons_group_id_sequence_number_key', 'buttons', type_='unique')
+    op.alter_column('buttons', 'sequence_number', type_=sa.BigInteger(), existing_nullable=False)
+    _renumber('buttons', 'button_id', RANK_GAP)
+    op.create_unique_constraint(
+        'buttons_group_id_sequence_number_key',
+        'buttons',
+        ['group_id', 'sequence_number'],
+        deferrable=True,
+        initially='DEFERRED',
+    )
+
+    op.drop_constraint('actions_action_id_sequence_number_key', 'actions', type_='unique')
+    op.alter_column('actions', 'sequence_number', type_=sa.BigInteger(), existing_nullable=False)
+    _renumber('actions', 'action_id', RANK_GAP)
+    op.create_unique_constraint(
+        'actions_group_id_sequence_number_key',
+        'actions',
+        ['group_id', 'sequence_number'],
+        deferrable=True,
+        initially='DEFERRED',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('actions_group_id_sequence_number_key', 'actions', type_='unique')
+    _renumber('actions', 'action_id', 1)
+    op.alter_column('actions', 'sequence_number', type_=sa.Integer(), existing_nullable=False)
+    op.create_unique_constraint('actions_action_id_sequence_number_key', 'actions', ['action_id', 'sequence_number'])
+
+    op.drop_constraint('buttons_group_id_sequence_number_key', 'buttons', type_='unique')
+    _renumber('buttons', 'button_id', 1)
+    op.alter_column('buttons', 'sequence_number', type_=sa.Integer(), existing_nullable=False)
+    op.create_unique_constraint('buttons_group_id_sequence_number_key', 'buttons', ['group_id', 'sequence_number'])
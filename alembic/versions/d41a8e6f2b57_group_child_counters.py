@@ -0,0 +1,48 @@
+"""group child counters
+
+Revision ID: d41a8e6f2b57
+Revises: b7e4c1d2a9f3
+Create Date: 2026-10-18 18:05:12.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a8e6f2b57'
+down_revision: Union[str, None] = 'b7e4c1d2a9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('groups', sa.Column('buttons_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('groups', sa.Column('last_button_rank', sa.BigInteger(), server_default='0', nullable=False))
+    op.add_column('groups', sa.Column('actions_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('groups', sa.Column('last_action_rank', sa.BigInteger(), server_default='0', nullable=False))
+    op.execute('''
+        UPDATE groups SET buttons_count = counters.count, last_button_rank = counters.last_rank
+        FROM (
+            SELECT group_id, count(*) AS count, max(sequence_number) AS last_rank
+            FROM buttons GROUP BY group_id
+        ) AS counters
+        WHERE groups.group_id = counters.group_id
+    ''')
+    op.execute('''
+        UPDATE groups SET actions_count = counters.count, last_action_rank = counters.last_rank
+        FROM (
+            SELECT group_id, count(*) AS count, max(sequence_number) AS last_rank
+            FROM actions GROUP BY group_id
+        ) AS counters
+        WHERE groups.group_id = counters.group_id
+    ''')
+
+
+def downgrade() -> None:
+    op.drop_column('groups', 'last_action_rank')
+    op.drop_column('groups', 'actions_count')
+    op.drop_column('groups', 'last_button_rank')
+    op.drop_column('groups', 'buttons_count')
@@ -0,0 +1,116 @@
+"""action payload expand
+
+Revision ID: e8c3f5a1d906
+Revises: d41a8e6f2b57
+Create Date: 2026-10-18 19:10:44.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c3f5a1d906'
+down_revision: Union[str, None] = 'd41a8e6f2b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# the old subtables keep serving the running application until the contract revision,
+# triggers mirror their writes into actions.payload meanwhile, and the writes of the new
+# application back into them, so both versions read the same actions during the rollout
+ACTION_TABLES = {
+    'text_message_actions': ('TEXT_MESSAGE', 'text'),
+    'image_message_actions': ('IMAGE_MESSAGE', 'image_path'),
+}
+BACKFILL_BATCH_SIZE = 5000
+
+
+def create_sync_triggers() -> None:
+    for table, (_, field) in ACTION_TABLES.items():
+        op.execute(f'''
+            CREATE FUNCTION sync_{table}_payload() RETURNS trigger AS $$
+            BEGIN
+                -- a write mirrored from actions.payload is not mirrored back
+                IF pg_trigger_depth() > 1 THEN
+                    RETURN NEW;
+                END IF;
+                UPDATE actions SET payload = jsonb_build_object('{field}', NEW.{field})
+                WHERE action_id = NEW.action_id;
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        ''')
+        op.execute(f'''
+            CREATE TRIGGER sync_{table}_payload AFTER INSERT OR UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION sync_{table}_payload()
+        ''')
+
+    # an action keeps one row in the subtable of its type, the rows of the other types go
+    statements = []
+    for table, (action_type, field) in ACTION_TABLES.items():
+        other_tables = [other_table for other_table in ACTION_TABLES if other_table != table]
+        deletes = ''.join(
+            f'''
+                    DELETE FROM {other_table} WHERE action_id = NEW.action_id;'''
+            for other_table in other_tables
+        )
+        statements.append(f'''
+                IF NEW.type = '{action_type}' AND NEW.payload ? '{field}' THEN
+                    INSERT INTO {table} (action_id, {field}) VALUES (NEW.action_id, NEW.payload ->> '{field}')
+                    ON CONFLICT (action_id) DO UPDATE SET {field} = EXCLUDED.{field};{deletes}
+                END IF;''')
+    # the old application inserts an action without a payload, before its subtable row,
+    # and an update from a missing payload is the backfill copying a subtable row
+    op.execute(f'''
+        CREATE FUNCTION sync_action_subtables() RETURNS trigger AS $$
+        BEGIN
+            IF pg_trigger_depth() > 1 OR NEW.payload IS NULL OR (TG_OP = 'UPDATE' AND OLD.payload IS NULL) THEN
+                RETURN NEW;
+            END IF;{''.join(statements)}
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    ''')
+    op.execute('''
+        CREATE TRIGGER sync_action_subtables AFTER INSERT OR UPDATE OF type, payload ON actions
+        FOR EACH ROW EXECUTE FUNCTION sync_action_subtables()
+    ''')
+
+
+def drop_sync_triggers() -> None:
+    op.execute('DROP TRIGGER sync_action_subtables ON actions')
+    op.execute('DROP FUNCTION sync_action_subtables()')
+    for table in ACTION_TABLES:
+        op.execute(f'DROP TRIGGER sync_{table}_payload ON {table}')
+        op.execute(f'DROP FUNCTION sync_{table}_payload()')
+
+
+def upgrade() -> None:
+    op.add_column('actions', sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    create_sync_triggers()
+
+    # short transactions, so the backfill never holds row locks on many actions at once
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        for table, (_, field) in ACTION_TABLES.items():
+            while True:
+                result = connection.execute(sa.text(f'''
+                    UPDATE actions SET payload = jsonb_build_object('{field}', batch.{field})
+                    FROM (
+                        SELECT {table}.action_id, {table}.{field}
+                        FROM {table} JOIN actions USING (action_id)
+                        WHERE actions.payload IS NULL
+                        LIMIT {BACKFILL_BATCH_SIZE}
+                    ) AS batch
+                    WHERE actions.action_id = batch.action_id
+                '''))
+                if result.rowcount == 0:
+                    break
+
+
+def downgrade() -> None:
+    drop_sync_triggers()
+    op.drop_column('actions', 'payload')
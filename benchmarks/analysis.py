@@ -0,0 +1,119 @@
+import argparse
+import random
+import time
+
+from src.analysis.analyzer import analyze_graph
+from src.analysis.paths import build_path_index, find_shortest_paths
+from src.analysis.reachability import ReachabilityState, EdgeSet
+from benchmarks.conversations import build_synthetic_graph
+
+
+def run_benchmark(
+        groups_count: int,
+        buttons_per_group: int,
+        repeats: int,
+        edits_count: int,
+        queries_count: int,
+        paths_count: int,
+        seed: int,
+) -> dict[str, float]:
+    graph = build_synthetic_graph(groups_count, buttons_per_group, actions_per_group=0, seed=seed)
+
+    timings = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        analysis = analyze_graph(graph)
+        timings.append(time.perf_counter() - started_at)
+    timings.sort()
+
+    started_at = time.perf_counter()
+    state = ReachabilityState(graph, version=0)
+    build_seconds = time.perf_counter() - started_at
+
+    # retargets of random edges, a tenth of them to no group
+    rnd = random.Random(seed)
+    edits = []
+    for _ in range(edits_count):
+        edge_id, kind, source_index = state.get_edge(rnd.randrange(len(graph.edge_targets)))
+        destination_group_id = graph.get_group_id(rnd.randrange(groups_count)) if rnd.random() < 0.9 else None
+        edits.append(EdgeSet(edge_id, kind, graph.get_group_id(source_index), destination_group_id))
+    edit_timings = []
+    for edit in edits:
+        started_at = time.perf_counter()
+        state.apply(edit)
+        edit_timings.append(time.perf_counter() - started_at)
+    edit_timings.sort()
+
+    started_at = time.perf_counter()
+    path_index = build_path_index(graph)
+    index_seconds = time.perf_counter() - started_at
+
+    # from the start group to random groups, as support staff ask. The synthetic graph drew its
+    # edge targets from the same seed, so targets from that sequence would all be reachable
+    rnd = random.Random(f'paths {seed}')
+    query_timings = []
+    found = 0
+    for _ in range(queries_count):
+        target = rnd.randrange(groups_count)
+        started_at = time.perf_counter()
+        paths = find_shortest_paths(path_index, graph.start_index, target, paths_count)
+        query_timings.append(time.perf_counter() - started_at)
+        found += len(paths)
+    query_timings.sort()
+
+    return {
+        'groups': groups_count,
+        'edges': len(graph.edge_targets),
+        'best_ms': timings[0] * 1e3,
+        'median_ms': timings[len(timings) // 2] * 1e3,
+        'unreachable': len(analysis.unreachable_groups),
+        'closed_cycles': len(analysis.closed_cycles),
+        'build_ms': build_seconds * 1e3,
+        'edits': edits_count,
+        'edit_p50_us': edit_timings[edits_count // 2] * 1e6,
+        'edit_p99_us': edit_timings[min(edits_count - 1, edits_count * 99 // 100)] * 1e6,
+        'index_ms': index_seconds * 1e3,
+        'queries': queries_count,
+        'paths': paths_count,
+        'found': found,
+        'query_p50_ms': query_timings[queries_count // 2] * 1e3,
+        'query_p99_ms': query_timings[min(queries_count - 1, queries_count * 99 // 100)] * 1e3,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Graph analysis benchmark on a synthetic graph')
+    parser.add_argument('--groups', type=int, default=50_000)
+    parser.add_argument('--buttons-per-group', type=int, default=2)
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--edits', type=int, default=10_000)
+    parser.add_argument('--queries', type=int, default=1_000)
+    parser.add_argument('--paths', type=int, default=3, help='shortest paths asked for per query')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    result = run_benchmark(
+        groups_count=args.groups,
+        buttons_per_group=args.buttons_per_group,
+        repeats=args.repeats,
+        edits_count=args.edits,
+        queries_count=args.queries,
+        paths_count=args.paths,
+        seed=args.seed,
+    )
+    print(
+        '{groups} groups, {edges} edges: best {best_ms:.1f}ms, median {median_ms:.1f}ms, '
+        '{unreachable} unreachable groups, {closed_cycles} closed cycles'.format(**result)
+    )
+    print(
+        'reachability state built in {build_ms:.1f}ms, {edits} edits: '
+        'p50 {edit_p50_us:.1f}us, p99 {edit_p99_us:.1f}us'.format(**result)
+    )
+    print(
+        'path index built in {index_ms:.1f}ms, {queries} queries for {paths} paths found {found}: '
+        'p50 {query_p50_ms:.2f}ms, p99 {query_p99_ms:.2f}ms'.format(**result)
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+import argparse
+import asyncio
+import random
+import time
+from uuid import uuid4
+
+from src.actions.enums import ActionType
+from src.conversations.engine import ConversationEngine
+from src.conversations.schemas import IncomingUpdate
+from src.graph.compiler import CompiledGraph, compile_graph
+from src.graph.enums import GraphEdgeKind
+from src.inputs.enums import InputType
+
+
+def build_synthetic_graph(
+        groups_count: int,
+        buttons_per_group: int,
+        actions_per_group: int,
+        seed: int,
+) -> CompiledGraph:
+    rnd = random.Random(seed)
+    group_ids = [uuid4() for _ in range(groups_count)]
+
+    edges = []
+    actions = []
+    for group_id in group_ids:
+        for i in range(buttons_per_group):
+            edges.append((uuid4(), GraphEdgeKind.BUTTON, group_id, rnd.choice(group_ids), f'button_{i}', None))
+        edges.append((uuid4(), GraphEdgeKind.INPUT, group_id, rnd.choice(group_ids), None, InputType.INT.value))
+        edges.append((uuid4(), GraphEdgeKind.INPUT, group_id, rnd.choice(group_ids), None, InputType.ANY.value))
+        for i in range(actions_per_group):
+            actions.append((group_id, ActionType.TEXT_MESSAGE.value, f'message {i}'))
+
+    return compile_graph(project_id=uuid4(), group_ids=group_ids, edges=edges, actions=actions)
+
+
+def build_synthetic_updates(
+        messages_count: int,
+        chats_count: int,
+        buttons_per_group: int,
+        seed: int,
+) -> list[IncomingUpdate]:
+    rnd = random.Random(seed)
+    texts = ('42', 'hello', 'user@example.com')
+    updates = []
+    for _ in range(messages_count):
+        chat_id = rnd.randrange(chats_count)
+        if rnd.random() < 0.8:
+            updates.append(IncomingUpdate(chat_id=chat_id, payload=f'button_{rnd.randrange(buttons_per_group)}'))
+        else:
+            updates.append(IncomingUpdate(chat_id=chat_id, text=rnd.choice(texts)))
+    return updates
+
+
+async def run_benchmark(
+        groups_count: int,
+        buttons_per_group: int,
+        actions_per_group: int,
+        messages_count: int,
+        chats_count: int,
+        seed: int,
+) -> dict[str, float]:
+    graph = build_synthetic_graph(groups_count, buttons_per_group, actions_per_group, seed)
+    updates = build_synthetic_updates(messages_count, chats_count, buttons_per_group, seed)
+    engine = ConversationEngine(graph)
+
+    latencies = [0] * messages_count
+    perf_counter_ns = time.perf_counter_ns
+    started_at = perf_counter_ns()
+    for i, update in enumerate(updates):
+        step_started_at = perf_counter_ns()
+        await engine.handle_update(update)
+        latencies[i] = perf_counter_ns() - step_started_at
+    elapsed = (perf_counter_ns() - started_at) / 1e9
+
+    latencies.sort()
+    return {
+        'messages': messages_count,
+        'seconds': elapsed,
+        'messages_per_second': messages_count / elapsed,
+        'p50_us': latencies[messages_count // 2] / 1e3,
+        'p99_us': latencies[min(messages_count - 1, messages_count * 99 // 100)] / 1e3,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Conversation engine benchmark on a synthetic graph')
+    parser.add_argument('--groups', type=int, default=10_000)
+    parser.add_argument('--buttons-per-group', type=int, default=4)
+    parser.add_argument('--actions-per-group', type=int, default=3)
+    parser.add_argument('--messages', type=int, default=200_000)
+    parser.add_argument('--chats', type=int, default=1_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(
+        groups_count=args.groups,
+        buttons_per_group=args.buttons_per_group,
+        actions_per_group=args.actions_per_group,
+        messages_count=args.messages,
+        chats_count=args.chats,
+        seed=args.seed,
+    ))
+    print(
+        '{messages} messages in {seconds:.2f}s: {messages_per_second:,.0f} messages/sec, '
+        'p50 {p50_us:.1f}us, p99 {p99_us:.1f}us'.format(**result)
+    )
+
+
+if __name__ == '__main__':
+    main()
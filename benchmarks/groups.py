@@ -0,0 +1,173 @@
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.actions.enums import ActionType
+from src.actions.models import ActionModel
+from src.actions.utils import validate_action_from_db
+from src.buttons.models import ButtonModel
+from src.core.db import async_session_maker
+from src.graph.utils import fill_group_edges
+from src.groups.models import GroupModel
+from src.groups.repositories import GroupRepository
+from src.groups.schemas import GroupReadSchema, groups_adapter
+from src.inputs.enums import InputType
+from src.inputs.models import InputModel
+from src.ordering.utils import RANK_GAP
+from src.projects.models import ProjectModel
+
+
+async def seed_project(
+        session: AsyncSession,
+        groups_count: int,
+        buttons_per_group: int,
+        actions_per_group: int,
+):
+    project_id = uuid4()
+    group_ids = [uuid4() for _ in range(groups_count)]
+    await session.execute(insert(ProjectModel), [{'project_id': project_id, 'name': 'benchmark'}])
+    await session.execute(insert(GroupModel), [
+        {'group_id': group_id, 'project_id': project_id, 'name': f'group {i}'}
+        for i, group_id in enumerate(group_ids)
+    ])
+    await session.execute(insert(ButtonModel), [
+        {
+            'group_id': group_id,
+            'destination_group_id': group_ids[(i + j + 1) % groups_count],
+            'text': f'button {j}',
+            'payload': f'payload_{j}',
+            'sequence_number': (j + 1) * RANK_GAP,
+        }
+        for i, group_id in enumerate(group_ids)
+        for j in range(buttons_per_group)
+    ])
+    await session.execute(insert(InputModel), [
+        {'group_id': group_id, 'destination_group_id': group_ids[0], 'type': InputType.ANY}
+        for group_id in group_ids
+    ])
+    await session.execute(insert(ActionModel), [
+        {
+            'group_id': group_id,
+            'type': ActionType.TEXT_MESSAGE,
+            'payload': {'text': f'message {j}'},
+            'sequence_number': (j + 1) * RANK_GAP,
+        }
+        for group_id in group_ids
+        for j in range(actions_per_group)
+    ])
+    await fill_group_edges(session, project_id)
+    return project_id
+
+
+async def get_groups_from_orm(session: AsyncSession, project_id) -> list[GroupReadSchema]:
+    # the listing before the row path: ORM objects validated one by one
+    groups = await session.execute(
+        select(GroupModel)
+        .options(
+            selectinload(GroupModel.buttons),
+            selectinload(GroupModel.inputs),
+            selectinload(GroupModel.actions),
+        )
+        .where(GroupModel.project_id == project_id)
+        .order_by(GroupModel.created_at)
+    )
+    return [
+        GroupReadSchema.model_validate({
+            'group_id': group.group_id,
+            'name': group.name,
+            'created_at': group.created_at,
+            'inputs': group.inputs,
+            'buttons': group.buttons,
+            'actions': [
+                validate_action_from_db(action, sequence_number=position)
+                for position, action in enumerate(group.actions, start=1)
+            ],
+        })
+        for group in groups.scalars().all()
+    ]
+
+
+async def measure(call: Callable[[], Awaitable], rounds: int) -> float:
+    best = float('inf')
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        await call()
+        best = min(best, time.perf_counter() - started_at)
+    return best
+
+
+async def run_benchmark(
+        groups_count: int,
+        buttons_per_group: int,
+        actions_per_group: int,
+        rounds: int,
+) -> dict[str, float]:
+    async with async_session_maker() as session:
+        # everything happens in one transaction that is rolled back, the database is left untouched
+        project_id = await seed_project(session, groups_count, buttons_per_group, actions_per_group)
+        repository = GroupRepository(session)
+
+        async def load_orm():
+            session.expunge_all()
+            return await get_groups_from_orm(session, project_id)
+
+        groups = await repository.get_groups(project_id)
+
+        # what FastAPI does with a response model: dump to JSON compatible python, then render
+        async def render_json():
+            JSONResponse(groups_adapter.dump_python(groups, mode='json'))
+
+        async def render_orjson():
+            ORJSONResponse(groups_adapter.dump_python(groups, mode='json'))
+
+        async def dump_adapter():
+            groups_adapter.dump_json(groups)
+
+        result = {
+            'orm_load': await measure(load_orm, rounds),
+            'rows_load': await measure(lambda: repository.get_groups(project_id), rounds),
+            'json_render': await measure(render_json, rounds),
+            'orjson_render': await measure(render_orjson, rounds),
+            'adapter_dump': await measure(dump_adapter, rounds),
+            'sql_json': await measure(lambda: repository.get_groups_json(project_id), rounds),
+            'response_bytes': len(groups_adapter.dump_json(groups)),
+        }
+        await session.rollback()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Group listing load and serialization benchmark')
+    parser.add_argument('--groups', type=int, default=5_000)
+    parser.add_argument('--buttons-per-group', type=int, default=3)
+    parser.add_argument('--actions-per-group', type=int, default=2)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(
+        groups_count=args.groups,
+        buttons_per_group=args.buttons_per_group,
+        actions_per_group=args.actions_per_group,
+        rounds=args.rounds,
+    ))
+    print(
+        'load: orm {orm_load:.3f}s, rows {rows_load:.3f}s ({load_speedup:.1f}x)\n'
+        'render {response_bytes:,} bytes: json {json_render:.3f}s, orjson {orjson_render:.3f}s ({render_speedup:.1f}x), '
+        'adapter dump_json {adapter_dump:.3f}s\n'
+        'rendered by postgres: {sql_json:.3f}s'.format(
+            load_speedup=result['orm_load'] / result['rows_load'],
+            render_speedup=result['json_render'] / result['orjson_render'],
+            **result,
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
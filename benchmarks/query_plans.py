@@ -0,0 +1,285 @@
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterator
+from uuid import UUID
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.actions.enums import ActionType
+from src.actions.repositories import ActionRepository
+from src.actions.schemas import ActionIdWithSeqNumber, TextMessageActionCreateSchema, ImageMessageActionUpdateSchema
+from src.buttons.models import ButtonModel
+from src.buttons.repositories import ButtonRepository
+from src.buttons.schemas import ButtonCreateSchema, ButtonUpdateSchema, ButtonIdWithSeqNumber
+from src.core.db import async_session_maker, engine
+from src.graph.repositories import GraphRepository
+from benchmarks.groups import seed_project
+from src.groups.enums import NeighborhoodDirection
+from src.groups.repositories import GroupRepository
+from src.groups.schemas import GroupCreateSchema
+from src.inputs.enums import InputType
+from src.inputs.repositories import InputRepository
+from src.inputs.schemas import InputCreateSchema
+from src.ordering.enums import MovePosition
+from src.ordering.schemas import MoveSchema
+from src.ordering.utils import rebalance_ranks, recount_group_counters
+from src.projects.repositories import ProjectRepository
+from src.scopes.repositories import ScopeRepository
+from src.transfers.repositories import TransferRepository
+
+SEEDED_TABLES = ('projects', 'groups', 'buttons', 'inputs', 'actions', 'group_edges')
+EXPLAINABLE_STATEMENTS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH')
+
+# foreign keys whose columns do not lead any index, deletes of the referenced row
+# make the referential action scan the whole referencing table, which EXPLAIN never shows
+UNINDEXED_FOREIGN_KEYS = text('''
+    SELECT c.conrelid::regclass::text AS table_name, c.conname AS constraint_name
+    FROM pg_constraint c
+    WHERE c.contype = 'f'
+      AND c.connamespace = 'public'::regnamespace
+      AND NOT EXISTS (
+          SELECT 1
+          FROM pg_index i
+          WHERE i.indrelid = c.conrelid
+            AND (string_to_array(i.indkey::text, ' ')::int2[])[1:cardinality(c.conkey)] @> c.conkey
+            AND (string_to_array(i.indkey::text, ' ')::int2[])[1:cardinality(c.conkey)] <@ c.conkey
+      )
+    ORDER BY 1, 2
+''')
+
+Scenario = Callable[[], Awaitable]
+
+
+@dataclass(frozen=True, slots=True)
+class SeededProject:
+    project_id: UUID
+    group_ids: list[UUID]
+    button_ids: list[UUID]
+    input_id: UUID
+    action_ids: list[UUID]
+
+
+async def seed_database(session: AsyncSession, projects_count: int, groups_count: int) -> SeededProject:
+    project_ids = [
+        await seed_project(session, groups_count, buttons_per_group=3, actions_per_group=2)
+        for _ in range(projects_count)
+    ]
+    # the planner only prefers indexes once it knows the tables are big
+    await session.execute(text('ANALYZE ' + ', '.join(SEEDED_TABLES)))
+
+    project_id = project_ids[len(project_ids) // 2]
+    groups = await GroupRepository(session).get_groups(project_id)
+    return SeededProject(
+        project_id=project_id,
+        group_ids=[group.group_id for group in groups],
+        button_ids=[button.button_id for button in groups[0].buttons],
+        input_id=groups[0].inputs[0].input_id,
+        action_ids=[action.action_id for action in groups[0].actions],
+    )
+
+
+def get_scenarios(session: AsyncSession, seeded: SeededProject) -> list[tuple[str, Scenario]]:
+    projects = ProjectRepository(session)
+    groups = GroupRepository(session)
+    buttons = ButtonRepository(session)
+    inputs = InputRepository(session)
+    actions = ActionRepository(session)
+    project_id, group_id, other_group_id = seeded.project_id, seeded.group_ids[0], seeded.group_ids[1]
+    first_button_id, last_button_id = seeded.button_ids[0], seeded.button_ids[-1]
+    first_action_id, last_action_id = seeded.action_ids[0], seeded.action_ids[-1]
+
+    async def get_next_projects_page():
+        page = await projects.get_projects(limit=20)
+        await projects.get_projects(limit=20, after=(page[-1].created_at, page[-1].project_id))
+
+    async def export_project():
+        async for _ in TransferRepository(session).stream_project_records(project_id):
+            pass
+
+    # creates go to another group than the reorders, deletes go last
+    return [
+        ('projects.get_projects', get_next_projects_page),
+        ('projects.get_project_by_id', lambda: projects.get_project_by_id(project_id)),
+        ('projects.get_project_version', lambda: projects.get_project_version(project_id)),
+        ('scopes.get_scope', lambda: ScopeRepository(session).get_scope(
+            project_id,
+            group_id=group_id,
+            child_model=ButtonModel,
+            child_id=first_button_id,
+            destination_group_id=other_group_id,
+        )),
+        ('groups.create_group', lambda: groups.create_group(project_id, GroupCreateSchema(name='plan check'))),
+        ('groups.get_groups', lambda: groups.get_groups(project_id)),
+        ('groups.get_groups_json', lambda: groups.get_groups_json(project_id)),
+        ('groups.get_group_by_id', lambda: groups.get_group_by_id(group_id)),
+        ('groups.get_neighborhood', lambda: groups.get_neighborhood(
+            project_id,
+            group_id,
+            depth=3,
+            direction=NeighborhoodDirection.BOTH,
+            limit=500,
+        )),
+        ('buttons.create_button', lambda: buttons.create_button(
+            project_id,
+            other_group_id,
+            ButtonCreateSchema(text='plan check', payload='plan_check'),
+        )),
+        ('buttons.get_buttons', lambda: buttons.get_buttons(group_id)),
+        ('buttons.update_button', lambda: buttons.update_button(
+            project_id,
+            first_button_id,
+            ButtonUpdateSchema(text='plan check', payload='plan_check'),
+        )),
+        ('buttons.set_button_destination_group', lambda: buttons.set_button_destination_group(
+            project_id,
+            first_button_id,
+            other_group_id,
+        )),
+        ('buttons.move_button', lambda: buttons.move_button(
+            project_id,
+            group_id,
+            last_button_id,
+            MoveSchema(anchor_id=first_button_id, position=MovePosition.BEFORE),
+        )),
+        ('buttons.change_button_sequence', lambda: buttons.change_button_sequence(
+            project_id,
+            group_id,
+            [
+                ButtonIdWithSeqNumber(button_id=button_id, sequence_number=i + 1)
+                for i, button_id in enumerate(reversed(seeded.button_ids))
+            ],
+        )),
+        ('inputs.create_input', lambda: inputs.create_input(project_id, group_id, InputCreateSchema(type=InputType.INT))),
+        ('inputs.get_inputs', lambda: inputs.get_inputs(group_id)),
+        ('inputs.get_input_by_id', lambda: inputs.get_input_by_id(seeded.input_id)),
+        ('inputs.set_input_destination_group', lambda: inputs.set_input_destination_group(
+            project_id,
+            seeded.input_id,
+            other_group_id,
+        )),
+        ('actions.create_action', lambda: actions.create_action(
+            project_id,
+            other_group_id,
+            TextMessageActionCreateSchema(type=ActionType.TEXT_MESSAGE, text='plan check'),
+        )),
+        ('actions.get_actions', lambda: actions.get_actions(group_id)),
+        ('actions.update_action', lambda: actions.update_action(
+            project_id,
+            first_action_id,
+            ImageMessageActionUpdateSchema(type=ActionType.IMAGE_MESSAGE, image_path='plan_check.png'),
+        )),
+        ('actions.move_action', lambda: actions.move_action(
+            project_id,
+            group_id,
+            last_action_id,
+            MoveSchema(anchor_id=first_action_id, position=MovePosition.BEFORE),
+        )),
+        ('actions.change_action_sequence', lambda: actions.change_action_sequence(
+            project_id,
+            group_id,
+            [
+                ActionIdWithSeqNumber(action_id=action_id, sequence_number=i + 1)
+                for i, action_id in enumerate(reversed(seeded.action_ids))
+            ],
+        )),
+        ('ordering.rebalance_ranks', lambda: rebalance_ranks(session, ButtonModel, group_id)),
+        ('ordering.recount_group_counters', lambda: recount_group_counters(session, project_id)),
+        ('graph.get_graph', lambda: GraphRepository(session).get_graph(project_id)),
+        ('graph.get_compiled_graph', lambda: GraphRepository(session).get_compiled_graph(project_id)),
+        ('transfers.stream_project_records', export_project),
+        ('buttons.delete_button', lambda: buttons.delete_button(project_id, first_button_id)),
+        ('inputs.delete_input', lambda: inputs.delete_input(project_id, seeded.input_id)),
+        ('actions.delete_action', lambda: actions.delete_action(project_id, first_action_id)),
+        ('groups.delete_group', lambda: groups.delete_group(project_id, other_group_id)),
+        ('projects.delete_project', lambda: projects.delete_project(project_id)),
+    ]
+
+
+async def capture_statements(scenario: Scenario) -> list[tuple[str, tuple]]:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(EXPLAINABLE_STATEMENTS):
+            statements.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        await scenario()
+    finally:
+        event.remove(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    return statements
+
+
+def find_seq_scans(plan: dict) -> Iterator[str]:
+    if plan['Node Type'] == 'Seq Scan':
+        yield plan['Relation Name']
+    for child_plan in plan.get('Plans', ()):
+        yield from find_seq_scans(child_plan)
+
+
+async def get_seq_scanned_tables(session: AsyncSession, statement: str, parameters: tuple) -> set[str]:
+    connection = await session.connection()
+    plan = await connection.exec_driver_sql('EXPLAIN (FORMAT JSON) ' + statement, parameters)
+    return set(find_seq_scans(plan.scalar()[0]['Plan']))
+
+
+async def get_table_sizes(session: AsyncSession) -> dict[str, float]:
+    sizes = await session.execute(
+        text('SELECT relname, reltuples FROM pg_class WHERE relname = ANY(:tables)'),
+        {'tables': list(SEEDED_TABLES)},
+    )
+    return dict(sizes.all())
+
+
+async def run_check(projects_count: int, groups_count: int, min_rows: int) -> bool:
+    failures = 0
+    try:
+        async with async_session_maker() as session:
+            # repositories only flush, so the seeded rows and every write are rolled back at the end
+            seeded = await seed_database(session, projects_count, groups_count)
+            large_tables = {table for table, size in (await get_table_sizes(session)).items() if size >= min_rows}
+
+            for name, scenario in get_scenarios(session, seeded):
+                for statement, parameters in await capture_statements(scenario):
+                    seq_scanned_tables = await get_seq_scanned_tables(session, statement, parameters) & large_tables
+                    if seq_scanned_tables:
+                        failures += 1
+                        print(f'{name}: sequential scan on {", ".join(sorted(seq_scanned_tables))}')
+                        print('    ' + ' '.join(statement.split()))
+
+            unindexed_foreign_keys = (await session.execute(UNINDEXED_FOREIGN_KEYS)).all()
+            for table_name, constraint_name in unindexed_foreign_keys:
+                failures += 1
+                print(f'{table_name}: foreign key {constraint_name} has no index')
+
+            await session.rollback()
+    finally:
+        async with async_session_maker() as session:
+            # ANALYZE writes row estimates in place, the rollback does not undo them
+            await session.execute(text('ANALYZE ' + ', '.join(SEEDED_TABLES)))
+            await session.commit()
+
+    print(f'{failures} plan regressions, large tables: {", ".join(sorted(large_tables)) or "none"}')
+    return failures == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fail when a repository query plans a sequential scan on a large table')
+    parser.add_argument('--projects', type=int, default=1_000)
+    parser.add_argument('--groups-per-project', type=int, default=50)
+    parser.add_argument('--min-rows', type=int, default=10_000, help='tables with fewer rows may be scanned')
+    args = parser.parse_args()
+
+    if not asyncio.run(run_check(
+            projects_count=args.projects,
+            groups_count=args.groups_per_project,
+            min_rows=args.min_rows,
+    )):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
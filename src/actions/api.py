@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, status, Depends
 
 from src.actions.dependencies.services_dependencies import ActionServiceDI
 from src.actions.exceptions.http_exceptions import (
@@ -23,6 +23,10 @@ from src.actions.schemas import (
 )
 from src.groups.exceptions.http_exceptions import GroupNotFoundHTTPException
 from src.groups.exceptions.services_exceptions import GroupNotFoundError
+from src.ordering.exceptions.http_exceptions import InvalidMoveHTTPException
+from src.ordering.exceptions.services_exceptions import InvalidMoveError
+from src.ordering.schemas import MoveSchema
+from src.projects.dependencies.etag_dependencies import check_project_etag
 from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException
 from src.projects.exceptions.services_exceptions import ProjectNotFoundError
 
@@ -58,6 +62,7 @@ async def create_action(
 @router.get(
     '',
     response_model=list[UnionActionReadSchema],
+    dependencies=[Depends(check_project_etag)],
 )
 async def get_actions(
         action_service: ActionServiceDI,
@@ -127,6 +132,34 @@ async def update_action(
         raise IncorrectActionTypeHTTPException
 
 
+@router.post(
+    '/{action_id}/move',
+    response_model=UnionActionReadSchema,
+)
+async def move_action(
+        action_service: ActionServiceDI,
+        project_id: UUID,
+        group_id: UUID,
+        action_id: UUID,
+        move: MoveSchema,
+):
+    try:
+        return await action_service.move_action(
+            project_id=project_id,
+            group_id=group_id,
+            action_id=action_id,
+            move=move,
+        )
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+    except GroupNotFoundError:
+        raise GroupNotFoundHTTPException
+    except ActionNotFoundError:
+        raise ActionNotFoundHTTPException
+    except InvalidMoveError:
+        raise InvalidMoveHTTPException
+
+
 @router.post(
     '/sequence',
     response_model=list[ActionIdWithSeqNumber],
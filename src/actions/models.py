@@ -1,11 +1,13 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, DateTime, UniqueConstraint, ForeignKey, String, Enum
+from sqlalchemy import func, DateTime, UniqueConstraint, ForeignKey, Enum, BigInteger
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.actions.enums import ActionType
 from src.core.db import Base
+from src.core.utils import uuid7, utc_now
 
 
 class ActionModel(Base):
@@ -13,12 +15,15 @@ class ActionModel(Base):
 
     action_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=func.gen_random_uuid(),
     )
 
-    sequence_number: Mapped[int]
+    # sparse rank, see src.ordering
+    sequence_number: Mapped[int] = mapped_column(BigInteger)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utc_now,
         server_default=func.now(),
     )
 
@@ -26,41 +31,9 @@ class ActionModel(Base):
     group: Mapped['GroupModel'] = relationship(back_populates='actions')
 
     type: Mapped[ActionType] = mapped_column(Enum(ActionType).values_callable)
+    # fields of the action type, validated with the action schemas before they are written
+    payload: Mapped[dict] = mapped_column(JSONB)
 
-    __mapper_args__ = {
-        'polymorphic_identity': 'actions',
-        'polymorphic_on': 'type',
-    }
     __table_args__ = (
-        UniqueConstraint('action_id', 'sequence_number'),
+        UniqueConstraint('group_id', 'sequence_number', deferrable=True, initially='DEFERRED'),
     )
-
-
-class TextMessageActionModel(ActionModel):
-    __tablename__ = 'text_message_actions'
-
-    action_id: Mapped[UUID] = mapped_column(
-        ForeignKey('actions.action_id', ondelete='CASCADE'),
-        primary_key=True,
-    )
-
-    text: Mapped[str] = mapped_column(String(4096))
-
-    __mapper_args__ = {
-        'polymorphic_identity': ActionType.TEXT_MESSAGE,
-    }
-
-
-class ImageMessageActionModel(ActionModel):
-    __tablename__ = 'image_message_actions'
-
-    action_id: Mapped[UUID] = mapped_column(
-        ForeignKey('actions.action_id', ondelete='CASCADE'),
-        primary_key=True,
-    )
-
-    image_path: Mapped[str] = mapped_column(String(4096))
-
-    __mapper_args__ = {
-        'polymorphic_identity': ActionType.IMAGE_MESSAGE,
-    }
@@ -1,8 +1,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, delete
-from sqlalchemy.orm import selectin_polymorphic
+from sqlalchemy import select
 
 from src.actions.models import ActionModel
 from src.actions.schemas import (
@@ -10,66 +9,75 @@ from src.actions.schemas import (
     UnionActionReadSchema,
     UnionActionUpdateSchema,
     ActionIdWithSeqNumber,
+    actions_adapter,
 )
-from src.actions.utils import get_action_model_by_type, validate_action_from_db, UnionActionModel
+from src.actions.utils import get_action_payload, get_action_fields, validate_action_from_db
+from src.core.db import get_row_dicts
 from src.core.dependencies.db_dependencies import AsyncSessionDI
+from src.ordering.schemas import MoveSchema
+from src.ordering.utils import (
+    allocate_rank,
+    delete_item,
+    get_rank_by_position,
+    move_item,
+)
+from src.projects.utils import bump_project_version
 
 
 class ActionRepository:
     def __init__(self, session: AsyncSessionDI):
         self._session = session
 
-    async def create_action(self, group_id: UUID, action: UnionActionCreateSchema) -> UnionActionReadSchema:
-        action_count = await self._session.scalar(
-            select(func.count())
-            .select_from(ActionModel)
-            .where(ActionModel.group_id == group_id)
-        )
-        action_model = get_action_model_by_type(action.type)
-        action = action_model(
-            **action.model_dump(),
+    async def create_action(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            action: UnionActionCreateSchema,
+    ) -> UnionActionReadSchema:
+        await bump_project_version(self._session, project_id)
+        action = ActionModel(
+            type=action.type,
+            payload=get_action_payload(action),
             group_id=group_id,
-            sequence_number=action_count + 1,
+            sequence_number=await allocate_rank(self._session, ActionModel, group_id),
         )
         self._session.add(action)
-        await self._session.commit()
-        return validate_action_from_db(action)
+        await self._session.flush()
+        return validate_action_from_db(action, sequence_number=action.sequence_number)
 
     async def get_actions(self, group_id: UUID) -> list[UnionActionReadSchema]:
-        actions = await self._get_action_model_instances(group_id)
-        return [validate_action_from_db(action) for action in actions]
-
-    async def _get_action_model_instances(self, group_id: UUID) -> list[UnionActionModel]:
         actions = await self._session.execute(
-            select(ActionModel)
-            .options(
-                selectin_polymorphic(ActionModel, ActionModel.__subclasses__()),
+            select(
+                ActionModel.action_id,
+                ActionModel.type,
+                ActionModel.payload,
+                ActionModel.sequence_number,
+                ActionModel.created_at,
             )
             .where(ActionModel.group_id == group_id)
             .order_by(ActionModel.sequence_number)
         )
-        return actions.unique().scalars().all()
+        actions = get_row_dicts(actions)
+        for position, action in enumerate(actions, start=1):
+            action['sequence_number'] = position
+        return actions_adapter.validate_python([get_action_fields(action) for action in actions])
 
     async def get_action_by_id(self, action_id: UUID) -> Optional[UnionActionReadSchema]:
         action = await self._get_action_model_instance(action_id)
         if action is None:
             return
-        return validate_action_from_db(action)
+        return validate_action_from_db(action, sequence_number=action.sequence_number)
 
-    async def _get_action_model_instance(self, action_id: UUID) -> Optional[UnionActionModel]:
+    async def _get_action_model_instance(self, action_id: UUID) -> Optional[ActionModel]:
         action = await self._session.execute(
             select(ActionModel)
-            .options(
-                selectin_polymorphic(ActionModel, ActionModel.__subclasses__()),
-            )
             .where(ActionModel.action_id == action_id)
         )
-        if action is None:
-            return
         return action.scalar()
 
     async def update_action(
             self,
+            project_id: UUID,
             action_id: UUID,
             action_update: UnionActionUpdateSchema,
     ) -> Optional[UnionActionReadSchema]:
@@ -77,21 +85,43 @@ class ActionRepository:
         if action is None:
             return
 
-        for key, value in action_update.model_dump().items():
-            setattr(action, key, value)
-        await self._session.commit()
+        await bump_project_version(self._session, project_id)
+        action.type = action_update.type
+        action.payload = get_action_payload(action_update)
+        await self._session.flush()
 
-        return validate_action_from_db(action)
+        return validate_action_from_db(action, sequence_number=action.sequence_number)
 
-    async def delete_action(self, action_id: UUID) -> Optional[UnionActionReadSchema]:
-        await self._session.execute(
-            delete(ActionModel)
-            .where(ActionModel.action_id == action_id)
+    async def delete_action(self, project_id: UUID, action_id: UUID):
+        await bump_project_version(self._session, project_id)
+        await delete_item(self._session, ActionModel, action_id)
+        await self._session.flush()
+
+    async def move_action(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            action_id: UUID,
+            move: MoveSchema,
+    ) -> Optional[UnionActionReadSchema]:
+        await bump_project_version(self._session, project_id)
+        rank = await move_item(
+            self._session,
+            ActionModel,
+            group_id=group_id,
+            item_id=action_id,
+            anchor_id=move.anchor_id,
+            position=move.position,
         )
-        await self._session.commit()
+        if rank is None:
+            return
+        await self._session.flush()
+
+        return await self.get_action_by_id(action_id)
 
     async def change_action_sequence(
             self,
+            project_id: UUID,
             group_id: UUID,
             action_ids_with_seq_numbers: list[ActionIdWithSeqNumber],
     ) -> list[ActionIdWithSeqNumber]:
@@ -100,6 +130,7 @@ class ActionRepository:
             for action in action_ids_with_seq_numbers
         }
 
+        await bump_project_version(self._session, project_id)
         actions = await self._session.execute(
             select(ActionModel)
             .where(ActionModel.group_id == group_id)
@@ -107,10 +138,10 @@ class ActionRepository:
         actions = actions.scalars().all()
 
         for action in actions:
-            action.sequence_number = id_to_seq_number[action.action_id]
-        await self._session.commit()
+            action.sequence_number = get_rank_by_position(id_to_seq_number[action.action_id])
+        await self._session.flush()
 
         return [
-            ActionIdWithSeqNumber.model_validate(action)
+            ActionIdWithSeqNumber(action_id=action.action_id, sequence_number=id_to_seq_number[action.action_id])
             for action in actions
         ]
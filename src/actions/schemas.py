@@ -2,7 +2,7 @@ import datetime
 from typing import Literal, Annotated, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from src.actions.enums import ActionType
 
@@ -18,6 +18,8 @@ class ActionIdWithSeqNumber(BaseModel):
 
 class ActionReadSchema(BaseModel):
     action_id: UUID
+    # listings number the actions of a group 1..n, a single action carries its stored rank,
+    # which orders the same way without counting the actions before it
     sequence_number: int = Field(ge=1)
     created_at: datetime.datetime
 
@@ -85,3 +87,6 @@ UnionActionUpdateSchema = Annotated[
     ],
     Field(discriminator='type')
 ]
+
+
+actions_adapter = TypeAdapter(list[UnionActionReadSchema])
@@ -14,22 +14,19 @@ from src.actions.schemas import (
     ActionIdWithSeqNumber,
 )
 from src.actions.utils import get_action_schema_by_type
-from src.groups.dependencies.repositories_dependencies import GroupRepositoryDI
-from src.groups.exceptions.services_exceptions import GroupNotFoundError
-from src.projects.dependencies.repositories_dependencies import ProjectRepositoryDI
-from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+from src.ordering.exceptions.services_exceptions import InvalidMoveError
+from src.ordering.schemas import MoveSchema
+from src.scopes.dependencies.services_dependencies import ScopeServiceDI
 
 
 class ActionService:
     def __init__(
             self,
             action_repository: ActionRepositoryDI,
-            project_repository: ProjectRepositoryDI,
-            group_repository: GroupRepositoryDI,
+            scope_service: ScopeServiceDI,
     ):
         self._action_repository = action_repository
-        self._project_repository = project_repository
-        self._group_repository = group_repository
+        self._scope_service = scope_service
 
     async def create_action(
             self,
@@ -37,46 +34,25 @@ class ActionService:
             group_id: UUID,
             action: UnionActionCreateSchema,
     ) -> UnionActionReadSchema:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_group_scope(project_id, group_id)
 
         return await self._action_repository.create_action(
+            project_id=project_id,
             group_id=group_id,
             action=action,
         )
 
     async def get_actions(self, project_id: UUID, group_id: UUID) -> list[UnionActionReadSchema]:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_group_scope(project_id, group_id)
 
         return await self._action_repository.get_actions(group_id)
 
+    # positions are counted from the ranks, the remaining actions need no renumbering
     async def delete_action(self, project_id: UUID, group_id: UUID, action_id: UUID):
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
-
-        action = await self._action_repository.get_action_by_id(action_id)
-        if action is None:
-            raise ActionNotFoundError
+        await self._scope_service.get_action_scope(project_id, group_id, action_id)
 
-        await self._action_repository.delete_action(action_id)
+        await self._action_repository.delete_action(project_id, action_id)
 
-    # TODO: update the sequence numbers of remaining actions after deletion
     async def update_action(
             self,
             project_id: UUID,
@@ -84,39 +60,46 @@ class ActionService:
             action_id: UUID,
             action_update: UnionActionUpdateSchema,
     ) -> UnionActionReadSchema:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_action_scope(project_id, group_id, action_id)
 
         action = await self._action_repository.get_action_by_id(action_id)
-        if action is None:
-            raise ActionNotFoundError
-
         if not isinstance(action, get_action_schema_by_type(action_update.type)):
             raise IncorrectActionTypeError
 
         return await self._action_repository.update_action(
+            project_id=project_id,
             action_id=action_id,
             action_update=action_update,
         )
 
+    async def move_action(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            action_id: UUID,
+            move: MoveSchema,
+    ) -> UnionActionReadSchema:
+        await self._scope_service.get_action_scope(project_id, group_id, action_id)
+        if move.anchor_id == action_id:
+            raise InvalidMoveError
+
+        action = await self._action_repository.move_action(
+            project_id=project_id,
+            group_id=group_id,
+            action_id=action_id,
+            move=move,
+        )
+        if action is None:
+            raise ActionNotFoundError
+        return action
+
     async def change_action_sequence(
             self,
             project_id: UUID,
             group_id: UUID,
             action_ids_with_seq_numbers: list[ActionIdWithSeqNumber],
     ) -> list[ActionIdWithSeqNumber]:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_group_scope(project_id, group_id)
 
         actions = await self._action_repository.get_actions(group_id)
         actions_len = len(actions)
@@ -138,6 +121,7 @@ class ActionService:
             raise IncorrectActionSeqNumbersError
 
         return await self._action_repository.change_action_sequence(
+            project_id=project_id,
             group_id=group_id,
             action_ids_with_seq_numbers=action_ids_with_seq_numbers,
         )
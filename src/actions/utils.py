@@ -1,21 +1,14 @@
 from typing import Type, Union
 
 from src.actions.enums import ActionType
-from src.actions.models import TextMessageActionModel, ImageMessageActionModel
-from src.actions.schemas import UnionActionReadSchema, TextMessageActionReadSchema, ImageMessageActionReadSchema
-
-UnionActionModel = Union[
-    TextMessageActionModel,
-    ImageMessageActionModel,
-]
-
-
-def get_action_model_by_type(action_type: ActionType) -> Type[UnionActionModel]:
-    types_to_models = {
-        ActionType.TEXT_MESSAGE: TextMessageActionModel,
-        ActionType.IMAGE_MESSAGE: ImageMessageActionModel,
-    }
-    return types_to_models[action_type]
+from src.actions.models import ActionModel
+from src.actions.schemas import (
+    UnionActionReadSchema,
+    UnionActionCreateSchema,
+    UnionActionUpdateSchema,
+    TextMessageActionReadSchema,
+    ImageMessageActionReadSchema,
+)
 
 
 def get_action_schema_by_type(action_type: ActionType) -> Type[UnionActionReadSchema]:
@@ -26,6 +19,30 @@ def get_action_schema_by_type(action_type: ActionType) -> Type[UnionActionReadSc
     return types_to_schemas[action_type]
 
 
-def validate_action_from_db(action: UnionActionModel) -> UnionActionReadSchema:
+def get_action_payload(action: Union[UnionActionCreateSchema, UnionActionUpdateSchema]) -> dict:
+    return action.model_dump(mode='json', exclude={'type'})
+
+
+def validate_action_from_db(action: ActionModel, sequence_number: int) -> UnionActionReadSchema:
+    # listings pass the position of the action in its group, single actions keep their stored rank
     action_schema = get_action_schema_by_type(action.type)
-    return action_schema.model_validate(action)
+    return action_schema.model_validate({
+        'action_id': action.action_id,
+        'sequence_number': sequence_number,
+        'created_at': action.created_at,
+        'type': action.type,
+        **action.payload,
+    })
+
+
+def get_action_fields(row: dict) -> dict:
+    row.update(row.pop('payload'))
+    return row
+
+
+def get_action_content_field_by_type(action_type: ActionType) -> str:
+    types_to_fields = {
+        ActionType.TEXT_MESSAGE: 'text',
+        ActionType.IMAGE_MESSAGE: 'image_path',
+    }
+    return types_to_fields[action_type]
@@ -0,0 +1,151 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.graph.compiler import CompiledGraph, NO_GROUP
+
+
+@dataclass(frozen=True, slots=True)
+class GraphAnalysis:
+    # group and edge indexes of the compiled graph, in compiled order
+    unreachable_groups: list[int]
+    dead_end_groups: list[int]
+    # (source group, edge)
+    dangling_edges: list[tuple[int, int]]
+    closed_cycles: list[list[int]]
+
+
+def analyze_graph(graph: CompiledGraph) -> GraphAnalysis:
+    # plain lists index several times faster than the typed memoryviews
+    offsets = graph.edge_offsets.tolist()
+    targets = graph.edge_targets.tolist()
+    start_index = graph.start_index
+
+    # edges are stored by source group, so the source of an edge is found by bisecting the offsets
+    dangling_edges = [
+        (bisect_right(offsets, edge_index) - 1, edge_index)
+        for edge_index in find_all(targets, NO_GROUP)
+    ]
+    dead_end_groups = [
+        group_index
+        for group_index, (edges_start, edges_end) in enumerate(zip(offsets, offsets[1:]))
+        if edges_start == edges_end
+    ]
+    for group_index in sorted({group_index for group_index, _ in dangling_edges}):
+        if all(target == NO_GROUP for target in targets[offsets[group_index]:offsets[group_index + 1]]):
+            dead_end_groups.append(group_index)
+    dead_end_groups.sort()
+
+    return GraphAnalysis(
+        unreachable_groups=list(find_all(find_reachable_groups(offsets, targets, start_index), 0)),
+        dead_end_groups=dead_end_groups,
+        dangling_edges=dangling_edges,
+        closed_cycles=sorted(
+            sorted(cycle)
+            for cycle in find_closed_cycles(offsets, targets)
+            # every conversation may return to the start group, that loop is the bot itself
+            if start_index not in cycle
+        ),
+    )
+
+
+def find_all(values: list[int] | bytearray, value: int) -> Iterator[int]:
+    # index() scans in C, which matters when the value is rare and the sequence is long
+    find = values.find if isinstance(values, bytearray) else values.index
+    position = -1
+    try:
+        while True:
+            position = find(value, position + 1)
+            if position == -1:
+                return
+            yield position
+    except ValueError:
+        return
+
+
+def find_reachable_groups(offsets: list[int], targets: list[int], start_index: int) -> bytearray:
+    reached = bytearray(len(offsets) - 1)
+    if start_index == NO_GROUP:
+        return reached
+
+    reached[start_index] = 1
+    queue = [start_index]
+    # the queue only grows while it is iterated, which makes this a breadth first search without pops
+    for group_index in queue:
+        for target in targets[offsets[group_index]:offsets[group_index + 1]]:
+            if target != NO_GROUP and not reached[target]:
+                reached[target] = 1
+                queue.append(target)
+    return reached
+
+
+def find_closed_cycles(offsets: list[int], targets: list[int]) -> list[list[int]]:
+    # strongly connected components that are cycles without an edge leaving them, found by Tarjan's
+    # algorithm with a stack of (group, next edge) frames. An edge leaves its source's component
+    # when its target belongs to a finished component, visited earlier or a child just closed
+    groups_count = len(offsets) - 1
+    order = [-1] * groups_count
+    low = [0] * groups_count
+    on_stack = bytearray(groups_count)
+    has_exit = bytearray(groups_count)
+    has_self_loop = bytearray(groups_count)
+    stack = []
+    closed_cycles = []
+    counter = 0
+
+    for root in range(groups_count):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        frames = [[root, offsets[root]]]
+
+        while frames:
+            frame = frames[-1]
+            group_index, edge_index = frame
+            edges_end = offsets[group_index + 1]
+            while edge_index < edges_end:
+                target = targets[edge_index]
+                edge_index += 1
+                if target == NO_GROUP:
+                    continue
+                if order[target] == -1:
+                    frame[1] = edge_index
+                    order[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    frames.append([target, offsets[target]])
+                    break
+                if on_stack[target]:
+                    if order[target] < low[group_index]:
+                        low[group_index] = order[target]
+                    if target == group_index:
+                        has_self_loop[group_index] = 1
+                else:
+                    has_exit[group_index] = 1
+            else:
+                frames.pop()
+                is_component_root = low[group_index] == order[group_index]
+                if is_component_root:
+                    # the members are the stack above the root
+                    component_start = len(stack) - 1
+                    while stack[component_start] != group_index:
+                        component_start -= 1
+                    component = stack[component_start:]
+                    del stack[component_start:]
+                    for member in component:
+                        on_stack[member] = 0
+                    is_cycle = len(component) > 1 or has_self_loop[group_index]
+                    if is_cycle and not any(has_exit[member] for member in component):
+                        closed_cycles.append(component)
+                if frames:
+                    parent_index = frames[-1][0]
+                    if is_component_root:
+                        has_exit[parent_index] = 1
+                    elif low[group_index] < low[parent_index]:
+                        low[parent_index] = low[group_index]
+
+    return closed_cycles
@@ -0,0 +1,79 @@
+from typing import Annotated, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from src.analysis.dependencies.services_dependencies import AnalysisServiceDI
+from src.analysis.schemas import GraphAnalysisSchema, ReachabilitySchema, PathsSchema
+from src.groups.exceptions.http_exceptions import GroupNotFoundHTTPException
+from src.groups.exceptions.services_exceptions import GroupNotFoundError
+from src.projects.dependencies.etag_dependencies import check_project_etag, ProjectVersionDI
+from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException
+from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+
+PATHS_DEFAULT_COUNT = 3
+PATHS_MAX_COUNT = 10
+
+router = APIRouter(
+    prefix='/projects',
+    tags=['Analysis'],
+)
+
+
+@router.get(
+    '/{project_id}/analysis',
+    response_model=GraphAnalysisSchema,
+    dependencies=[Depends(check_project_etag)],
+)
+async def analyze_project(
+        analysis_service: AnalysisServiceDI,
+        project_id: UUID,
+        project_version: ProjectVersionDI,
+):
+    try:
+        return await analysis_service.analyze_project(project_id, project_version)
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+
+
+@router.get(
+    '/{project_id}/analysis/reachability',
+    response_model=ReachabilitySchema,
+    dependencies=[Depends(check_project_etag)],
+)
+async def get_reachability(
+        analysis_service: AnalysisServiceDI,
+        project_id: UUID,
+        project_version: ProjectVersionDI,
+):
+    try:
+        return await analysis_service.get_reachability(project_id, project_version)
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+
+
+@router.get(
+    '/{project_id}/paths',
+    response_model=PathsSchema,
+    dependencies=[Depends(check_project_etag)],
+)
+async def find_paths(
+        analysis_service: AnalysisServiceDI,
+        project_id: UUID,
+        project_version: ProjectVersionDI,
+        to_group_id: Annotated[UUID, Query(alias='to')],
+        from_group_id: Annotated[Optional[UUID], Query(alias='from')] = None,
+        k: Annotated[int, Query(ge=1, le=PATHS_MAX_COUNT)] = PATHS_DEFAULT_COUNT,
+):
+    try:
+        return await analysis_service.find_paths(
+            project_id=project_id,
+            version=project_version,
+            from_group_id=from_group_id,
+            to_group_id=to_group_id,
+            count=k,
+        )
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+    except GroupNotFoundError:
+        raise GroupNotFoundHTTPException
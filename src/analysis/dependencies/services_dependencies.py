@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.analysis.services import AnalysisService
+
+AnalysisServiceDI = Annotated[AnalysisService, Depends(AnalysisService)]
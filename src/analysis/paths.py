@@ -0,0 +1,184 @@
+import heapq
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Optional
+
+from src.graph.compiler import CompiledGraph, NO_GROUP
+
+# the edge a search starts from
+NO_EDGE = -1
+
+# rough memory cost of one element of the index tuples, charged to the project cache budget
+_ELEMENT_SIZE = 40
+# rough memory cost of one entry of the group index dict
+_GROUP_INDEX_ENTRY_SIZE = 120
+
+
+@dataclass(frozen=True, slots=True)
+class PathIndex:
+    graph: CompiledGraph
+
+    # plain tuples are several times faster to index in a search loop than the compiled memoryviews.
+    # Edges of group i are edge_offsets[i]:edge_offsets[i + 1], edges leading into it are
+    # in_edges[in_offsets[i]:in_offsets[i + 1]]
+    edge_offsets: tuple[int, ...]
+    edge_sources: tuple[int, ...]
+    edge_targets: tuple[int, ...]
+    in_offsets: tuple[int, ...]
+    in_edges: tuple[int, ...]
+
+    @property
+    def size(self) -> int:
+        elements = len(self.edge_offsets) + len(self.edge_sources) + len(self.edge_targets)
+        elements += len(self.in_offsets) + len(self.in_edges)
+        return (
+            len(self.graph.group_ids) + len(self.graph.edge_ids)
+            + len(self.graph) * _GROUP_INDEX_ENTRY_SIZE
+            + elements * _ELEMENT_SIZE
+        )
+
+
+def build_path_index(graph: CompiledGraph) -> PathIndex:
+    groups_count = len(graph)
+    edge_offsets = graph.edge_offsets.tolist()
+    edge_targets = graph.edge_targets.tolist()
+    edge_sources = []
+    for group_index in range(groups_count):
+        edge_sources += [group_index] * (edge_offsets[group_index + 1] - edge_offsets[group_index])
+
+    # counting sort of the edges by target
+    in_counts = [0] * (groups_count + 1)
+    for target in edge_targets:
+        if target != NO_GROUP:
+            in_counts[target + 1] += 1
+    in_offsets = list(accumulate(in_counts))
+    positions = in_offsets[:groups_count]
+    in_edges = [0] * in_offsets[groups_count]
+    for edge_index, target in enumerate(edge_targets):
+        if target != NO_GROUP:
+            in_edges[positions[target]] = edge_index
+            positions[target] += 1
+
+    return PathIndex(
+        graph=graph,
+        edge_offsets=tuple(edge_offsets),
+        edge_sources=tuple(edge_sources),
+        edge_targets=tuple(edge_targets),
+        in_offsets=tuple(in_offsets),
+        in_edges=tuple(in_edges),
+    )
+
+
+def find_shortest_paths(index: PathIndex, source: int, target: int, count: int) -> list[list[int]]:
+    # up to `count` shortest paths as lists of edge indexes, shortest first. Paths never visit
+    # a group twice, buttons leading to the same group make different paths
+    path = find_shortest_path(index, source, target, blocked_groups=set(), blocked_edges=set())
+    if path is None:
+        return []
+
+    # Yen's algorithm: every next path leaves one of the found ones at some group,
+    # through an edge none of the found paths sharing its beginning took
+    paths = [path]
+    seen = {tuple(path)}
+    candidates: list[tuple[int, tuple[int, ...]]] = []
+    while len(paths) < count:
+        previous = paths[-1]
+        groups = [source] + [index.edge_targets[edge_index] for edge_index in previous]
+        for i in range(len(previous)):
+            root = previous[:i]
+            spur = find_shortest_path(
+                index,
+                groups[i],
+                target,
+                blocked_groups=set(groups[:i]),
+                blocked_edges={found[i] for found in paths if len(found) > i and found[:i] == root},
+            )
+            if spur is None:
+                continue
+            candidate = tuple(root + spur)
+            if candidate not in seen:
+                seen.add(candidate)
+                heapq.heappush(candidates, (len(candidate), candidate))
+        if not candidates:
+            break
+        paths.append(list(heapq.heappop(candidates)[1]))
+    return paths
+
+
+def find_shortest_path(
+        index: PathIndex,
+        source: int,
+        target: int,
+        blocked_groups: set[int],
+        blocked_edges: set[int],
+) -> Optional[list[int]]:
+    if source == target:
+        return []
+
+    edge_offsets, edge_sources, edge_targets = index.edge_offsets, index.edge_sources, index.edge_targets
+    in_offsets, in_edges = index.in_offsets, index.in_edges
+    # the edge each group was reached by from the source, and the edge it leads on by towards the target
+    forward_edges = {source: NO_EDGE}
+    backward_edges = {target: NO_EDGE}
+    forward_frontier = [source]
+    backward_frontier = [target]
+
+    # Whole levels are expanded from the smaller side. No group was reached from both sides
+    # before a level, so every path is longer than both searched depths together, and the first
+    # group reached from both sides during the level lies on a shortest path.
+    meeting = NO_GROUP
+    while forward_frontier and backward_frontier and meeting == NO_GROUP:
+        next_frontier = []
+        if len(forward_frontier) <= len(backward_frontier):
+            for group_index in forward_frontier:
+                for edge_index in range(edge_offsets[group_index], edge_offsets[group_index + 1]):
+                    next_group = edge_targets[edge_index]
+                    if (
+                            next_group == NO_GROUP
+                            or next_group in forward_edges
+                            or next_group in blocked_groups
+                            or edge_index in blocked_edges
+                    ):
+                        continue
+                    forward_edges[next_group] = edge_index
+                    if next_group in backward_edges:
+                        meeting = next_group
+                        break
+                    next_frontier.append(next_group)
+                if meeting != NO_GROUP:
+                    break
+            forward_frontier = next_frontier
+        else:
+            for group_index in backward_frontier:
+                for edge_index in in_edges[in_offsets[group_index]:in_offsets[group_index + 1]]:
+                    previous_group = edge_sources[edge_index]
+                    if (
+                            previous_group in backward_edges
+                            or previous_group in blocked_groups
+                            or edge_index in blocked_edges
+                    ):
+                        continue
+                    backward_edges[previous_group] = edge_index
+                    if previous_group in forward_edges:
+                        meeting = previous_group
+                        break
+                    next_frontier.append(previous_group)
+                if meeting != NO_GROUP:
+                    break
+            backward_frontier = next_frontier
+
+    if meeting == NO_GROUP:
+        return
+
+    path = []
+    edge_index = forward_edges[meeting]
+    while edge_index != NO_EDGE:
+        path.append(edge_index)
+        edge_index = forward_edges[edge_sources[edge_index]]
+    path.reverse()
+
+    edge_index = backward_edges[meeting]
+    while edge_index != NO_EDGE:
+        path.append(edge_index)
+        edge_index = backward_edges[edge_targets[edge_index]]
+    return path
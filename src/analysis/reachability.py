@@ -0,0 +1,333 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Union
+from uuid import UUID
+
+from src.core import settings
+from src.graph.compiler import CompiledGraph, NO_GROUP, EDGE_KINDS, UUID_SIZE
+from src.graph.enums import GraphEdgeKind
+
+# an edge in the state that was deleted, its slot is never reused
+NO_EDGE = -2
+
+
+@dataclass(frozen=True, slots=True)
+class GroupAdded:
+    group_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class GroupDeleted:
+    group_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class EdgeSet:
+    edge_id: UUID
+    kind: GraphEdgeKind
+    source_group_id: UUID
+    destination_group_id: Optional[UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class EdgeDeleted:
+    edge_id: UUID
+
+
+GraphChange = Union[GroupAdded, GroupDeleted, EdgeSet, EdgeDeleted]
+
+
+class UnknownGraphChangeError(Exception):
+    pass
+
+
+# reachability from the start group and dead ends of one project version, updated edit by edit.
+# A reached group has a lower ranked reached group leading to it, so an added edge only extends
+# from its target and a removed edge only searches again the groups that lost their last support
+class ReachabilityState:
+    def __init__(self, graph: CompiledGraph, version: int):
+        self.version = version
+
+        groups_count = len(graph)
+        self._group_ids: list[Optional[bytes]] = [
+            graph.group_ids[offset:offset + UUID_SIZE]
+            for offset in range(0, groups_count * UUID_SIZE, UUID_SIZE)
+        ]
+        self._group_indexes = dict(graph.group_indexes)
+        self._out_edges: list[set[int]] = [set() for _ in range(groups_count)]
+        self._in_edges: list[set[int]] = [set() for _ in range(groups_count)]
+        self._linked_out_counts = [0] * groups_count
+
+        self._edge_ids: list[bytes] = [
+            graph.edge_ids[offset:offset + UUID_SIZE]
+            for offset in range(0, len(graph.edge_ids), UUID_SIZE)
+        ]
+        self._edge_indexes = {edge_id: edge_index for edge_index, edge_id in enumerate(self._edge_ids)}
+        self._edge_kinds = graph.edge_kinds.tolist()
+        self._edge_sources = [NO_GROUP] * len(self._edge_ids)
+        self._edge_targets = graph.edge_targets.tolist()
+        self.dangling_edges: set[int] = set()
+
+        offsets = graph.edge_offsets.tolist()
+        for group_index in range(groups_count):
+            out_edges = self._out_edges[group_index]
+            for edge_index in range(offsets[group_index], offsets[group_index + 1]):
+                self._edge_sources[edge_index] = group_index
+                out_edges.add(edge_index)
+                target = self._edge_targets[edge_index]
+                if target == NO_GROUP:
+                    self.dangling_edges.add(edge_index)
+                else:
+                    self._in_edges[target].add(edge_index)
+                    self._linked_out_counts[group_index] += 1
+
+        self.dead_end_groups = {
+            group_index
+            for group_index, linked_out_count in enumerate(self._linked_out_counts)
+            if linked_out_count == 0
+        }
+        self.start_index = graph.start_index
+        self._ranks = [-1] * groups_count
+        self._next_rank = 0
+        self.unreachable_groups: set[int] = set()
+        self._reach_all()
+
+    def __len__(self) -> int:
+        return len(self._group_indexes)
+
+    def get_group_id(self, group_index: int) -> UUID:
+        return UUID(bytes=self._group_ids[group_index])
+
+    def get_edge(self, edge_index: int) -> tuple[UUID, GraphEdgeKind, int]:
+        return UUID(bytes=self._edge_ids[edge_index]), EDGE_KINDS[self._edge_kinds[edge_index]], self._edge_sources[edge_index]
+
+    def apply(self, change: GraphChange):
+        if isinstance(change, EdgeSet):
+            self._set_edge(change)
+        elif isinstance(change, EdgeDeleted):
+            self._delete_edge(self._get_edge_index(change.edge_id))
+        elif isinstance(change, GroupAdded):
+            self._add_group(change.group_id)
+        else:
+            self._delete_group(self._get_group_index(change.group_id))
+
+    def _get_group_index(self, group_id: UUID) -> int:
+        group_index = self._group_indexes.get(group_id.bytes)
+        if group_index is None:
+            raise UnknownGraphChangeError
+        return group_index
+
+    def _get_edge_index(self, edge_id: UUID) -> int:
+        edge_index = self._edge_indexes.get(edge_id.bytes)
+        if edge_index is None:
+            raise UnknownGraphChangeError
+        return edge_index
+
+    def _add_group(self, group_id: UUID):
+        if group_id.bytes in self._group_indexes:
+            raise UnknownGraphChangeError
+        # groups are created with the current time, so a new group is the last one in creation order
+        group_index = len(self._group_ids)
+        self._group_ids.append(group_id.bytes)
+        self._group_indexes[group_id.bytes] = group_index
+        self._out_edges.append(set())
+        self._in_edges.append(set())
+        self._linked_out_counts.append(0)
+        self._ranks.append(-1)
+        self.dead_end_groups.add(group_index)
+        if self.start_index == NO_GROUP:
+            self.start_index = group_index
+            self._reach_all()
+        else:
+            self.unreachable_groups.add(group_index)
+
+    def _delete_group(self, group_index: int):
+        # the group's buttons and inputs are deleted with it, edges into it are set to null
+        for edge_index in list(self._out_edges[group_index]):
+            self._delete_edge(edge_index)
+        for edge_index in list(self._in_edges[group_index]):
+            self._set_edge_target(edge_index, NO_GROUP)
+
+        del self._group_indexes[self._group_ids[group_index]]
+        self._group_ids[group_index] = None
+        self._ranks[group_index] = -1
+        self.unreachable_groups.discard(group_index)
+        self.dead_end_groups.discard(group_index)
+        if group_index == self.start_index:
+            # the next group in creation order becomes the start group, every rank changes
+            self.start_index = next(
+                (index for index in range(group_index + 1, len(self._group_ids)) if self._group_ids[index] is not None),
+                NO_GROUP,
+            )
+            self._reach_all()
+
+    def _set_edge(self, change: EdgeSet):
+        source = self._get_group_index(change.source_group_id)
+        target = NO_GROUP if change.destination_group_id is None else self._get_group_index(change.destination_group_id)
+
+        edge_index = self._edge_indexes.get(change.edge_id.bytes)
+        if edge_index is None:
+            edge_index = len(self._edge_ids)
+            self._edge_ids.append(change.edge_id.bytes)
+            self._edge_indexes[change.edge_id.bytes] = edge_index
+            self._edge_kinds.append(EDGE_KINDS.index(change.kind))
+            self._edge_sources.append(source)
+            self._edge_targets.append(NO_GROUP)
+            self._out_edges[source].add(edge_index)
+            self.dangling_edges.add(edge_index)
+        elif self._edge_sources[edge_index] != source:
+            raise UnknownGraphChangeError
+
+        self._set_edge_target(edge_index, target)
+
+    def _delete_edge(self, edge_index: int):
+        self._set_edge_target(edge_index, NO_GROUP)
+        self._out_edges[self._edge_sources[edge_index]].discard(edge_index)
+        self.dangling_edges.discard(edge_index)
+        self._edge_sources[edge_index] = NO_EDGE
+        del self._edge_indexes[self._edge_ids[edge_index]]
+
+    def _set_edge_target(self, edge_index: int, target: int):
+        source = self._edge_sources[edge_index]
+        old_target = self._edge_targets[edge_index]
+        if old_target == target:
+            return
+
+        self._edge_targets[edge_index] = target
+        if old_target != NO_GROUP:
+            self._in_edges[old_target].discard(edge_index)
+            self._linked_out_counts[source] -= 1
+            if self._linked_out_counts[source] == 0:
+                self.dead_end_groups.add(source)
+        else:
+            self.dangling_edges.discard(edge_index)
+
+        if target != NO_GROUP:
+            self._in_edges[target].add(edge_index)
+            self._linked_out_counts[source] += 1
+            self.dead_end_groups.discard(source)
+            if self._ranks[source] != -1 and self._ranks[target] == -1:
+                self._reach_from([target])
+        else:
+            self.dangling_edges.add(edge_index)
+
+        if old_target != NO_GROUP:
+            self._check_support(old_target)
+
+    def _is_supported(self, group_index: int, excluded: set[int]) -> bool:
+        rank = self._ranks[group_index]
+        for edge_index in self._in_edges[group_index]:
+            source = self._edge_sources[edge_index]
+            if source not in excluded and -1 < self._ranks[source] < rank:
+                return True
+        return False
+
+    def _check_support(self, group_index: int):
+        if self._ranks[group_index] == -1 or group_index == self.start_index:
+            return
+        if self._is_supported(group_index, excluded=set()):
+            return
+
+        # groups whose every support is lost with this one
+        unsupported = {group_index}
+        queue = [group_index]
+        for unsupported_index in queue:
+            for edge_index in self._out_edges[unsupported_index]:
+                target = self._edge_targets[edge_index]
+                if (
+                        target == NO_GROUP
+                        or target in unsupported
+                        or target == self.start_index
+                        or self._ranks[target] == -1
+                ):
+                    continue
+                if not self._is_supported(target, excluded=unsupported):
+                    unsupported.add(target)
+                    queue.append(target)
+
+        # some of them may still be led to from a reached group with a greater rank
+        seeds = [
+            unsupported_index
+            for unsupported_index in queue
+            if any(
+                self._edge_sources[edge_index] not in unsupported and self._ranks[self._edge_sources[edge_index]] != -1
+                for edge_index in self._in_edges[unsupported_index]
+            )
+        ]
+        for unsupported_index in queue:
+            self._ranks[unsupported_index] = -1
+            self.unreachable_groups.add(unsupported_index)
+        self._reach_from(seeds)
+
+    def _reach_all(self):
+        self._ranks = [-1] * len(self._group_ids)
+        self.unreachable_groups = {
+            group_index
+            for group_index, group_id in enumerate(self._group_ids)
+            if group_id is not None
+        }
+        if self.start_index != NO_GROUP:
+            self._reach_from([self.start_index])
+
+    def _reach_from(self, seeds: list[int]):
+        # fresh ranks are greater than every existing one, so each group keeps a lower ranked support
+        queue = []
+        for seed in seeds:
+            if self._ranks[seed] == -1:
+                self._ranks[seed] = self._next_rank
+                self._next_rank += 1
+                self.unreachable_groups.discard(seed)
+                queue.append(seed)
+        for group_index in queue:
+            for edge_index in self._out_edges[group_index]:
+                target = self._edge_targets[edge_index]
+                if target != NO_GROUP and self._ranks[target] == -1:
+                    self._ranks[target] = self._next_rank
+                    self._next_rank += 1
+                    self.unreachable_groups.discard(target)
+                    queue.append(target)
+
+
+class ReachabilityStates:
+    def __init__(self, max_projects: int):
+        self.max_projects = max_projects
+        self._states: OrderedDict[UUID, ReachabilityState] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, project_id: UUID, version: int) -> Optional[ReachabilityState]:
+        state = self._states.get(project_id)
+        if state is None or state.version != version:
+            return
+        self._states.move_to_end(project_id)
+        return state
+
+    def put(self, project_id: UUID, state: ReachabilityState):
+        self._states[project_id] = state
+        self._states.move_to_end(project_id)
+        while len(self._states) > self.max_projects:
+            self._states.popitem(last=False)
+
+    def advance(self, project_id: UUID, version: int, changes: list[GraphChange]):
+        # called after a commit that moved the project to `version`, a state that missed
+        # another commit in between can not be updated and is rebuilt on the next read
+        state = self._states.get(project_id)
+        if state is None:
+            return
+        if state.version != version - 1:
+            del self._states[project_id]
+            return
+        try:
+            for change in changes:
+                state.apply(change)
+        except UnknownGraphChangeError:
+            del self._states[project_id]
+            return
+        state.version = version
+
+    def forget(self, project_id: UUID):
+        self._states.pop(project_id, None)
+
+
+reachability_states = ReachabilityStates(max_projects=settings.REACHABILITY_MAX_PROJECTS)
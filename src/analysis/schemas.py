@@ -0,0 +1,49 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.graph.enums import GraphEdgeKind
+
+
+class DanglingEdgeSchema(BaseModel):
+    edge_id: UUID
+    kind: GraphEdgeKind
+    source_group_id: UUID
+
+
+class GraphAnalysisSchema(BaseModel):
+    project_id: UUID
+    start_group_id: Optional[UUID]
+    # groups the start group has no path to
+    unreachable_group_ids: list[UUID]
+    # groups without a button or input leading to another group
+    dead_end_group_ids: list[UUID]
+    # buttons and inputs without a destination, never set or nulled by a group deletion
+    dangling_edges: list[DanglingEdgeSchema]
+    # groups that lead only to each other, a conversation entering them never leaves
+    closed_cycles: list[list[UUID]]
+
+
+class ReachabilitySchema(BaseModel):
+    project_id: UUID
+    version: int
+    start_group_id: Optional[UUID]
+    unreachable_group_ids: list[UUID]
+    dead_end_group_ids: list[UUID]
+    dangling_edges: list[DanglingEdgeSchema]
+
+
+class PathTransitionSchema(BaseModel):
+    edge_id: UUID
+    kind: GraphEdgeKind
+    source_group_id: UUID
+    destination_group_id: UUID
+
+
+class PathsSchema(BaseModel):
+    project_id: UUID
+    from_group_id: UUID
+    to_group_id: UUID
+    # shortest first, each one is the buttons and inputs to follow in order
+    paths: list[list[PathTransitionSchema]]
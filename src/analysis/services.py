@@ -0,0 +1,130 @@
+from typing import Optional
+from uuid import UUID
+
+from src.analysis.analyzer import analyze_graph
+from src.analysis.paths import PathIndex, build_path_index, find_shortest_paths
+from src.analysis.reachability import ReachabilityState, reachability_states
+from src.analysis.schemas import (
+    GraphAnalysisSchema,
+    DanglingEdgeSchema,
+    ReachabilitySchema,
+    PathsSchema,
+    PathTransitionSchema,
+)
+from src.core.cache import project_cache, ProjectCacheKey
+from src.core.single_flight import read_flights
+from src.graph.compiler import NO_GROUP
+from src.graph.dependencies.services_dependencies import GraphServiceDI
+from src.groups.exceptions.services_exceptions import GroupNotFoundError
+
+
+class AnalysisService:
+    def __init__(
+            self,
+            graph_service: GraphServiceDI,
+    ):
+        self._graph_service = graph_service
+
+    async def analyze_project(self, project_id: UUID, version: int) -> GraphAnalysisSchema:
+        # the compiled graph is cached per project version and already holds the adjacency as arrays
+        graph = await self._graph_service.compile_project(project_id, version)
+        analysis = analyze_graph(graph)
+
+        return GraphAnalysisSchema(
+            project_id=project_id,
+            start_group_id=None if graph.start_index == NO_GROUP else graph.get_group_id(graph.start_index),
+            unreachable_group_ids=[graph.get_group_id(group_index) for group_index in analysis.unreachable_groups],
+            dead_end_group_ids=[graph.get_group_id(group_index) for group_index in analysis.dead_end_groups],
+            dangling_edges=[
+                DanglingEdgeSchema(
+                    edge_id=graph.get_edge_id(edge_index),
+                    kind=graph.get_edge_kind(edge_index),
+                    source_group_id=graph.get_group_id(group_index),
+                )
+                for group_index, edge_index in analysis.dangling_edges
+            ],
+            closed_cycles=[
+                [graph.get_group_id(group_index) for group_index in cycle]
+                for cycle in analysis.closed_cycles
+            ],
+        )
+
+    async def get_reachability(self, project_id: UUID, version: int) -> ReachabilitySchema:
+        state = reachability_states.get(project_id, version)
+        if state is None:
+            state = await read_flights.run(
+                ('reachability', project_id, version),
+                lambda: self._load_reachability_state(project_id, version),
+            )
+
+        return ReachabilitySchema(
+            project_id=project_id,
+            version=state.version,
+            start_group_id=None if state.start_index == NO_GROUP else state.get_group_id(state.start_index),
+            unreachable_group_ids=[state.get_group_id(group_index) for group_index in sorted(state.unreachable_groups)],
+            dead_end_group_ids=[state.get_group_id(group_index) for group_index in sorted(state.dead_end_groups)],
+            dangling_edges=[
+                DanglingEdgeSchema(edge_id=edge_id, kind=kind, source_group_id=state.get_group_id(group_index))
+                for edge_id, kind, group_index in map(state.get_edge, sorted(state.dangling_edges))
+            ],
+        )
+
+    async def _load_reachability_state(self, project_id: UUID, version: int) -> ReachabilityState:
+        # built once per project, later commits of this process update it in place
+        state = ReachabilityState(await self._graph_service.compile_project(project_id, version), version)
+        reachability_states.put(project_id, state)
+        return state
+
+    async def find_paths(
+            self,
+            project_id: UUID,
+            version: int,
+            from_group_id: Optional[UUID],
+            to_group_id: UUID,
+            count: int,
+    ) -> PathsSchema:
+        path_index = await self._get_path_index(project_id, version)
+        graph = path_index.graph
+        source = graph.start_index if from_group_id is None else graph.get_group_index(from_group_id)
+        target = graph.get_group_index(to_group_id)
+        if source == NO_GROUP or target == NO_GROUP:
+            raise GroupNotFoundError
+
+        return PathsSchema(
+            project_id=project_id,
+            from_group_id=graph.get_group_id(source),
+            to_group_id=to_group_id,
+            paths=[
+                [
+                    PathTransitionSchema(
+                        edge_id=graph.get_edge_id(edge_index),
+                        kind=graph.get_edge_kind(edge_index),
+                        source_group_id=graph.get_group_id(path_index.edge_sources[edge_index]),
+                        destination_group_id=graph.get_group_id(path_index.edge_targets[edge_index]),
+                    )
+                    for edge_index in path
+                ]
+                for path in find_shortest_paths(path_index, source, target, count)
+            ],
+        )
+
+    async def _get_path_index(self, project_id: UUID, version: int) -> PathIndex:
+        path_index = project_cache.get(project_id, ProjectCacheKey.PATH_INDEX, version)
+        if path_index is not None:
+            return path_index
+
+        return await read_flights.run(
+            (ProjectCacheKey.PATH_INDEX, project_id, version),
+            lambda: self._load_path_index(project_id, version),
+        )
+
+    async def _load_path_index(self, project_id: UUID, version: int) -> PathIndex:
+        path_index = build_path_index(await self._graph_service.compile_project(project_id, version))
+        project_cache.put(
+            project_id,
+            ProjectCacheKey.PATH_INDEX,
+            path_index,
+            size=path_index.size,
+            version=version,
+        )
+        return path_index
@@ -0,0 +1,26 @@
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.analysis.reachability import GraphChange, reachability_states
+from src.core.db import get_transaction_info, run_after_commit
+from src.projects.utils import add_version_bump_hook, add_project_delete_hook
+
+
+def get_graph_changes(session: AsyncSession, project_id: UUID) -> list[GraphChange]:
+    return get_transaction_info(session).setdefault('graph_changes', {}).setdefault(project_id, [])
+
+
+def record_graph_change(session: AsyncSession, project_id: UUID, change: GraphChange):
+    # applied to the project's reachability state once the transaction commits, see advance_reachability_state
+    get_graph_changes(session, project_id).append(change)
+
+
+def advance_reachability_state(session: AsyncSession, project_id: UUID, version: int):
+    # graph changes recorded later in the transaction land in the same list
+    changes = get_graph_changes(session, project_id)
+    run_after_commit(session, lambda: reachability_states.advance(project_id, version, changes))
+
+
+add_version_bump_hook(advance_reachability_state)
+add_project_delete_hook(reachability_states.forget)
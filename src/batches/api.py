@@ -0,0 +1,94 @@
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException
+
+from src.actions.exceptions.http_exceptions import (
+    ActionNotFoundHTTPException,
+    IncorrectNumberOfActionsHTTPException,
+    ActionIdsMismatchHTTPException,
+    IncorrectActionSeqNumbersHTTPException,
+    IncorrectActionTypeHTTPException,
+)
+from src.actions.exceptions.services_exceptions import (
+    ActionNotFoundError,
+    IncorrectNumberOfActionsError,
+    ActionIdsMismatchError,
+    IncorrectActionSeqNumbersError,
+    IncorrectActionTypeError,
+)
+from src.batches.dependencies.services_dependencies import BatchServiceDI
+from src.batches.exceptions.http_exceptions import (
+    BatchOperationHTTPException,
+    DuplicateBatchTempIdHTTPException,
+    UnknownBatchReferenceHTTPException,
+)
+from src.batches.exceptions.services_exceptions import (
+    BatchOperationError,
+    DuplicateBatchTempIdError,
+    UnknownBatchReferenceError,
+)
+from src.batches.schemas import BatchSchema, BatchResultSchema
+from src.buttons.exceptions.http_exceptions import (
+    ButtonNotFoundHTTPException,
+    ButtonIdsMismatchHTTPException,
+    IncorrectButtonSeqNumbersHTTPException,
+    IncorrectNumberOfButtonsHTTPException,
+)
+from src.buttons.exceptions.services_exceptions import (
+    ButtonNotFoundError,
+    ButtonIdsMismatchError,
+    IncorrectButtonSeqNumbersError,
+    IncorrectNumberOfButtonsError,
+)
+from src.groups.exceptions.http_exceptions import GroupNotFoundHTTPException
+from src.groups.exceptions.services_exceptions import GroupNotFoundError
+from src.inputs.exceptions.http_exceptions import InputNotFoundHTTPException, InputTypeConflictHTTPException
+from src.inputs.exceptions.services_exceptions import InputNotFoundError, InputTypeConflictError
+from src.ordering.exceptions.http_exceptions import InvalidMoveHTTPException
+from src.ordering.exceptions.services_exceptions import InvalidMoveError
+from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException
+from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+
+router = APIRouter(
+    prefix='/projects/{project_id}/batch',
+    tags=['Batches'],
+)
+
+OPERATION_HTTP_EXCEPTIONS: dict[type[Exception], type[HTTPException]] = {
+    ProjectNotFoundError: ProjectNotFoundHTTPException,
+    GroupNotFoundError: GroupNotFoundHTTPException,
+    ButtonNotFoundError: ButtonNotFoundHTTPException,
+    IncorrectNumberOfButtonsError: IncorrectNumberOfButtonsHTTPException,
+    ButtonIdsMismatchError: ButtonIdsMismatchHTTPException,
+    IncorrectButtonSeqNumbersError: IncorrectButtonSeqNumbersHTTPException,
+    InputNotFoundError: InputNotFoundHTTPException,
+    InputTypeConflictError: InputTypeConflictHTTPException,
+    ActionNotFoundError: ActionNotFoundHTTPException,
+    IncorrectNumberOfActionsError: IncorrectNumberOfActionsHTTPException,
+    ActionIdsMismatchError: ActionIdsMismatchHTTPException,
+    IncorrectActionSeqNumbersError: IncorrectActionSeqNumbersHTTPException,
+    IncorrectActionTypeError: IncorrectActionTypeHTTPException,
+    InvalidMoveError: InvalidMoveHTTPException,
+    UnknownBatchReferenceError: UnknownBatchReferenceHTTPException,
+    DuplicateBatchTempIdError: DuplicateBatchTempIdHTTPException,
+}
+
+
+@router.post(
+    '',
+    response_model=BatchResultSchema,
+)
+async def run_batch(
+        batch_service: BatchServiceDI,
+        project_id: UUID,
+        batch: BatchSchema,
+):
+    try:
+        return await batch_service.run_batch(project_id, batch)
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+    except BatchOperationError as error:
+        http_exception = OPERATION_HTTP_EXCEPTIONS.get(type(error.error))
+        if http_exception is None:
+            raise error.error
+        raise BatchOperationHTTPException(error.index, http_exception())
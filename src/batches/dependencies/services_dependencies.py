@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.batches.services import BatchService
+
+BatchServiceDI = Annotated[BatchService, Depends(BatchService)]
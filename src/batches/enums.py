@@ -0,0 +1,23 @@
+from enum import StrEnum
+
+
+class BatchOperationType(StrEnum):
+    CREATE_GROUP = 'create_group'
+    DELETE_GROUP = 'delete_group'
+
+    CREATE_BUTTON = 'create_button'
+    UPDATE_BUTTON = 'update_button'
+    SET_BUTTON_DESTINATION = 'set_button_destination'
+    MOVE_BUTTON = 'move_button'
+    CHANGE_BUTTON_SEQUENCE = 'change_button_sequence'
+    DELETE_BUTTON = 'delete_button'
+
+    CREATE_INPUT = 'create_input'
+    SET_INPUT_DESTINATION = 'set_input_destination'
+    DELETE_INPUT = 'delete_input'
+
+    CREATE_ACTION = 'create_action'
+    UPDATE_ACTION = 'update_action'
+    MOVE_ACTION = 'move_action'
+    CHANGE_ACTION_SEQUENCE = 'change_action_sequence'
+    DELETE_ACTION = 'delete_action'
@@ -0,0 +1,25 @@
+from fastapi import HTTPException, status
+
+
+class UnknownBatchReferenceHTTPException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Unknown id or temp id',
+        )
+
+
+class DuplicateBatchTempIdHTTPException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Temp id is already used in this batch',
+        )
+
+
+class BatchOperationHTTPException(HTTPException):
+    def __init__(self, index: int, exception: HTTPException):
+        super().__init__(
+            status_code=exception.status_code,
+            detail=f'Operation {index}: {exception.detail}',
+        )
@@ -0,0 +1,13 @@
+class UnknownBatchReferenceError(Exception):
+    pass
+
+
+class DuplicateBatchTempIdError(Exception):
+    pass
+
+
+class BatchOperationError(Exception):
+    def __init__(self, index: int, error: Exception):
+        super().__init__(index, error)
+        self.index = index
+        self.error = error
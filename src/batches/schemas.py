@@ -0,0 +1,174 @@
+from typing import Literal, Optional, Annotated, Union, Any
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.actions.schemas import UnionActionCreateSchema, UnionActionUpdateSchema
+from src.batches.enums import BatchOperationType
+from src.buttons.schemas import ButtonCreateSchema, ButtonUpdateSchema
+from src.groups.schemas import GroupCreateSchema
+from src.inputs.schemas import InputCreateSchema
+from src.ordering.enums import MovePosition
+
+BATCH_MAX_OPERATIONS = 1000
+
+# an id of an existing entity or a temp id assigned by an earlier operation of the same batch
+BatchReference = Annotated[str, Field(max_length=64)]
+BatchTempId = Annotated[str, Field(max_length=64)]
+
+
+# Groups
+class CreateGroupOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.CREATE_GROUP]
+    temp_id: Optional[BatchTempId] = None
+    group: GroupCreateSchema
+
+
+class DeleteGroupOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.DELETE_GROUP]
+    group_id: BatchReference
+
+
+# Buttons
+class BatchButtonIdWithSeqNumber(BaseModel):
+    button_id: BatchReference
+    sequence_number: int = Field(ge=1)
+
+
+class CreateButtonOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.CREATE_BUTTON]
+    temp_id: Optional[BatchTempId] = None
+    group_id: BatchReference
+    button: ButtonCreateSchema
+
+
+class UpdateButtonOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.UPDATE_BUTTON]
+    group_id: BatchReference
+    button_id: BatchReference
+    button: ButtonUpdateSchema
+
+
+class SetButtonDestinationOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.SET_BUTTON_DESTINATION]
+    group_id: BatchReference
+    button_id: BatchReference
+    destination_group_id: BatchReference
+
+
+class MoveButtonOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.MOVE_BUTTON]
+    group_id: BatchReference
+    button_id: BatchReference
+    anchor_id: BatchReference
+    position: MovePosition
+
+
+class ChangeButtonSequenceOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.CHANGE_BUTTON_SEQUENCE]
+    group_id: BatchReference
+    buttons: list[BatchButtonIdWithSeqNumber]
+
+
+class DeleteButtonOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.DELETE_BUTTON]
+    group_id: BatchReference
+    button_id: BatchReference
+
+
+# Inputs
+class CreateInputOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.CREATE_INPUT]
+    temp_id: Optional[BatchTempId] = None
+    group_id: BatchReference
+    input: InputCreateSchema
+
+
+class SetInputDestinationOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.SET_INPUT_DESTINATION]
+    group_id: BatchReference
+    input_id: BatchReference
+    destination_group_id: BatchReference
+
+
+class DeleteInputOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.DELETE_INPUT]
+    group_id: BatchReference
+    input_id: BatchReference
+
+
+# Actions
+class BatchActionIdWithSeqNumber(BaseModel):
+    action_id: BatchReference
+    sequence_number: int = Field(ge=1)
+
+
+class CreateActionOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.CREATE_ACTION]
+    temp_id: Optional[BatchTempId] = None
+    group_id: BatchReference
+    action: UnionActionCreateSchema
+
+
+class UpdateActionOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.UPDATE_ACTION]
+    group_id: BatchReference
+    action_id: BatchReference
+    action: UnionActionUpdateSchema
+
+
+class MoveActionOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.MOVE_ACTION]
+    group_id: BatchReference
+    action_id: BatchReference
+    anchor_id: BatchReference
+    position: MovePosition
+
+
+class ChangeActionSequenceOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.CHANGE_ACTION_SEQUENCE]
+    group_id: BatchReference
+    actions: list[BatchActionIdWithSeqNumber]
+
+
+class DeleteActionOperationSchema(BaseModel):
+    op: Literal[BatchOperationType.DELETE_ACTION]
+    group_id: BatchReference
+    action_id: BatchReference
+
+
+UnionBatchOperationSchema = Annotated[
+    Union[
+        CreateGroupOperationSchema,
+        DeleteGroupOperationSchema,
+        CreateButtonOperationSchema,
+        UpdateButtonOperationSchema,
+        SetButtonDestinationOperationSchema,
+        MoveButtonOperationSchema,
+        ChangeButtonSequenceOperationSchema,
+        DeleteButtonOperationSchema,
+        CreateInputOperationSchema,
+        SetInputDestinationOperationSchema,
+        DeleteInputOperationSchema,
+        CreateActionOperationSchema,
+        UpdateActionOperationSchema,
+        MoveActionOperationSchema,
+        ChangeActionSequenceOperationSchema,
+        DeleteActionOperationSchema,
+    ],
+    Field(discriminator='op')
+]
+
+
+class BatchSchema(BaseModel):
+    operations: list[UnionBatchOperationSchema] = Field(min_length=1, max_length=BATCH_MAX_OPERATIONS)
+
+
+class BatchOperationResultSchema(BaseModel):
+    op: BatchOperationType
+    result: Any = None
+
+
+class BatchResultSchema(BaseModel):
+    results: list[BatchOperationResultSchema]
+    temp_ids: dict[str, UUID]
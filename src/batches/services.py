@@ -0,0 +1,242 @@
+from typing import Any, Optional
+from uuid import UUID
+
+from src.actions.dependencies.services_dependencies import ActionServiceDI
+from src.actions.schemas import ActionIdWithSeqNumber
+from src.batches.enums import BatchOperationType
+from src.batches.exceptions.services_exceptions import (
+    BatchOperationError,
+    DuplicateBatchTempIdError,
+    UnknownBatchReferenceError,
+)
+from src.batches.schemas import (
+    BatchSchema,
+    BatchResultSchema,
+    BatchOperationResultSchema,
+    CreateGroupOperationSchema,
+    DeleteGroupOperationSchema,
+    CreateButtonOperationSchema,
+    UpdateButtonOperationSchema,
+    SetButtonDestinationOperationSchema,
+    MoveButtonOperationSchema,
+    ChangeButtonSequenceOperationSchema,
+    DeleteButtonOperationSchema,
+    CreateInputOperationSchema,
+    SetInputDestinationOperationSchema,
+    DeleteInputOperationSchema,
+    CreateActionOperationSchema,
+    UpdateActionOperationSchema,
+    MoveActionOperationSchema,
+    ChangeActionSequenceOperationSchema,
+    DeleteActionOperationSchema,
+    UnionBatchOperationSchema,
+)
+from src.buttons.dependencies.services_dependencies import ButtonServiceDI
+from src.buttons.schemas import ButtonIdWithSeqNumber
+from src.groups.dependencies.services_dependencies import GroupServiceDI
+from src.inputs.dependencies.services_dependencies import InputServiceDI
+from src.ordering.schemas import MoveSchema
+from src.scopes.dependencies.services_dependencies import ScopeServiceDI
+
+
+class BatchService:
+    def __init__(
+            self,
+            scope_service: ScopeServiceDI,
+            group_service: GroupServiceDI,
+            button_service: ButtonServiceDI,
+            input_service: InputServiceDI,
+            action_service: ActionServiceDI,
+    ):
+        self._scope_service = scope_service
+        self._group_service = group_service
+        self._button_service = button_service
+        self._input_service = input_service
+        self._action_service = action_service
+
+        self._temp_ids: dict[str, UUID] = {}
+        self._operation_handlers = {
+            BatchOperationType.CREATE_GROUP: self._create_group,
+            BatchOperationType.DELETE_GROUP: self._delete_group,
+            BatchOperationType.CREATE_BUTTON: self._create_button,
+            BatchOperationType.UPDATE_BUTTON: self._update_button,
+            BatchOperationType.SET_BUTTON_DESTINATION: self._set_button_destination,
+            BatchOperationType.MOVE_BUTTON: self._move_button,
+            BatchOperationType.CHANGE_BUTTON_SEQUENCE: self._change_button_sequence,
+            BatchOperationType.DELETE_BUTTON: self._delete_button,
+            BatchOperationType.CREATE_INPUT: self._create_input,
+            BatchOperationType.SET_INPUT_DESTINATION: self._set_input_destination,
+            BatchOperationType.DELETE_INPUT: self._delete_input,
+            BatchOperationType.CREATE_ACTION: self._create_action,
+            BatchOperationType.UPDATE_ACTION: self._update_action,
+            BatchOperationType.MOVE_ACTION: self._move_action,
+            BatchOperationType.CHANGE_ACTION_SEQUENCE: self._change_action_sequence,
+            BatchOperationType.DELETE_ACTION: self._delete_action,
+        }
+
+    async def run_batch(self, project_id: UUID, batch: BatchSchema) -> BatchResultSchema:
+        results = []
+        # operations only flush, the request commits the whole batch once or not at all
+        await self._scope_service.get_project_scope(project_id)
+
+        for index, operation in enumerate(batch.operations):
+            try:
+                result = await self._run_operation(project_id, operation)
+            except Exception as error:
+                raise BatchOperationError(index, error) from error
+            results.append(BatchOperationResultSchema(op=operation.op, result=result))
+
+        return BatchResultSchema(results=results, temp_ids=self._temp_ids)
+
+    async def _run_operation(self, project_id: UUID, operation: UnionBatchOperationSchema) -> Any:
+        return await self._operation_handlers[operation.op](project_id, operation)
+
+    def _resolve(self, reference: str) -> UUID:
+        entity_id = self._temp_ids.get(reference)
+        if entity_id is not None:
+            return entity_id
+        try:
+            return UUID(reference)
+        except ValueError:
+            raise UnknownBatchReferenceError
+
+    def _remember(self, temp_id: Optional[str], entity_id: UUID):
+        if temp_id is None:
+            return
+        if temp_id in self._temp_ids:
+            raise DuplicateBatchTempIdError
+        self._temp_ids[temp_id] = entity_id
+
+    # Groups
+    async def _create_group(self, project_id: UUID, operation: CreateGroupOperationSchema):
+        group = await self._group_service.create_group(project_id, operation.group)
+        self._remember(operation.temp_id, group.group_id)
+        return group
+
+    async def _delete_group(self, project_id: UUID, operation: DeleteGroupOperationSchema):
+        await self._group_service.delete_group(project_id, self._resolve(operation.group_id))
+
+    # Buttons
+    async def _create_button(self, project_id: UUID, operation: CreateButtonOperationSchema):
+        button = await self._button_service.create_button(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            button=operation.button,
+        )
+        self._remember(operation.temp_id, button.button_id)
+        return button
+
+    async def _update_button(self, project_id: UUID, operation: UpdateButtonOperationSchema):
+        return await self._button_service.update_button(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            button_id=self._resolve(operation.button_id),
+            button_update=operation.button,
+        )
+
+    async def _set_button_destination(self, project_id: UUID, operation: SetButtonDestinationOperationSchema):
+        return await self._button_service.set_button_destination_group(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            button_id=self._resolve(operation.button_id),
+            destination_group_id=self._resolve(operation.destination_group_id),
+        )
+
+    async def _move_button(self, project_id: UUID, operation: MoveButtonOperationSchema):
+        return await self._button_service.move_button(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            button_id=self._resolve(operation.button_id),
+            move=MoveSchema(anchor_id=self._resolve(operation.anchor_id), position=operation.position),
+        )
+
+    async def _change_button_sequence(self, project_id: UUID, operation: ChangeButtonSequenceOperationSchema):
+        return await self._button_service.change_button_sequence(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            button_ids_with_seq_numbers=[
+                ButtonIdWithSeqNumber(
+                    button_id=self._resolve(button.button_id),
+                    sequence_number=button.sequence_number,
+                )
+                for button in operation.buttons
+            ],
+        )
+
+    async def _delete_button(self, project_id: UUID, operation: DeleteButtonOperationSchema):
+        await self._button_service.delete_button(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            button_id=self._resolve(operation.button_id),
+        )
+
+    # Inputs
+    async def _create_input(self, project_id: UUID, operation: CreateInputOperationSchema):
+        input_field = await self._input_service.create_input(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            input_field=operation.input,
+        )
+        self._remember(operation.temp_id, input_field.input_id)
+        return input_field
+
+    async def _set_input_destination(self, project_id: UUID, operation: SetInputDestinationOperationSchema):
+        return await self._input_service.set_input_destination_group(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            input_id=self._resolve(operation.input_id),
+            destination_group_id=self._resolve(operation.destination_group_id),
+        )
+
+    async def _delete_input(self, project_id: UUID, operation: DeleteInputOperationSchema):
+        await self._input_service.delete_input(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            input_id=self._resolve(operation.input_id),
+        )
+
+    # Actions
+    async def _create_action(self, project_id: UUID, operation: CreateActionOperationSchema):
+        action = await self._action_service.create_action(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            action=operation.action,
+        )
+        self._remember(operation.temp_id, action.action_id)
+        return action
+
+    async def _update_action(self, project_id: UUID, operation: UpdateActionOperationSchema):
+        return await self._action_service.update_action(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            action_id=self._resolve(operation.action_id),
+            action_update=operation.action,
+        )
+
+    async def _move_action(self, project_id: UUID, operation: MoveActionOperationSchema):
+        return await self._action_service.move_action(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            action_id=self._resolve(operation.action_id),
+            move=MoveSchema(anchor_id=self._resolve(operation.anchor_id), position=operation.position),
+        )
+
+    async def _change_action_sequence(self, project_id: UUID, operation: ChangeActionSequenceOperationSchema):
+        return await self._action_service.change_action_sequence(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            action_ids_with_seq_numbers=[
+                ActionIdWithSeqNumber(
+                    action_id=self._resolve(action.action_id),
+                    sequence_number=action.sequence_number,
+                )
+                for action in operation.actions
+            ],
+        )
+
+    async def _delete_action(self, project_id: UUID, operation: DeleteActionOperationSchema):
+        await self._action_service.delete_action(
+            project_id=project_id,
+            group_id=self._resolve(operation.group_id),
+            action_id=self._resolve(operation.action_id),
+        )
@@ -1,7 +1,7 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, status, Body
+from fastapi import APIRouter, status, Body, Depends
 
 from src.buttons.dependencies.services_dependencies import ButtonServiceDI
 from src.buttons.exceptions.http_exceptions import (
@@ -19,6 +19,10 @@ from src.buttons.exceptions.services_exceptions import (
 from src.buttons.schemas import ButtonReadSchema, ButtonCreateSchema, ButtonUpdateSchema, ButtonIdWithSeqNumber
 from src.groups.exceptions.http_exceptions import GroupNotFoundHTTPException
 from src.groups.exceptions.services_exceptions import GroupNotFoundError
+from src.ordering.exceptions.http_exceptions import InvalidMoveHTTPException
+from src.ordering.exceptions.services_exceptions import InvalidMoveError
+from src.ordering.schemas import MoveSchema
+from src.projects.dependencies.etag_dependencies import check_project_etag
 from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException
 from src.projects.exceptions.services_exceptions import ProjectNotFoundError
 
@@ -54,6 +58,7 @@ async def create_button(
 @router.get(
     '',
     response_model=list[ButtonReadSchema],
+    dependencies=[Depends(check_project_etag)],
 )
 async def get_buttons(
         button_service: ButtonServiceDI,
@@ -147,6 +152,34 @@ async def update_button(
         raise ButtonNotFoundHTTPException
 
 
+@router.post(
+    '/{button_id}/move',
+    response_model=ButtonReadSchema,
+)
+async def move_button(
+        button_service: ButtonServiceDI,
+        project_id: UUID,
+        group_id: UUID,
+        button_id: UUID,
+        move: MoveSchema,
+):
+    try:
+        return await button_service.move_button(
+            project_id=project_id,
+            group_id=group_id,
+            button_id=button_id,
+            move=move,
+        )
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+    except GroupNotFoundError:
+        raise GroupNotFoundHTTPException
+    except ButtonNotFoundError:
+        raise ButtonNotFoundHTTPException
+    except InvalidMoveError:
+        raise InvalidMoveHTTPException
+
+
 @router.post(
     '/sequence',
     response_model=list[ButtonIdWithSeqNumber],
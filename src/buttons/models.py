@@ -1,10 +1,11 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, func, String, ForeignKey, UniqueConstraint
+from sqlalchemy import DateTime, func, String, ForeignKey, UniqueConstraint, BigInteger, Index, text as sql_text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.db import Base
+from src.core.utils import uuid7, utc_now
 
 
 class ButtonModel(Base):
@@ -12,6 +13,7 @@ class ButtonModel(Base):
 
     button_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=func.gen_random_uuid(),
     )
 
@@ -19,10 +21,12 @@ class ButtonModel(Base):
     # TODO: payload might be json
     payload: Mapped[str] = mapped_column(String(64))
 
-    sequence_number: Mapped[int]
+    # sparse rank, see src.ordering
+    sequence_number: Mapped[int] = mapped_column(BigInteger)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utc_now,
         server_default=func.now(),
     )
 
@@ -42,5 +46,11 @@ class ButtonModel(Base):
     )
 
     __table_args__ = (
-        UniqueConstraint('group_id', 'sequence_number'),
+        UniqueConstraint('group_id', 'sequence_number', deferrable=True, initially='DEFERRED'),
+        # ON DELETE SET NULL when a destination group is deleted
+        Index(
+            'ix_buttons_destination_group_id',
+            'destination_group_id',
+            postgresql_where=sql_text('destination_group_id IS NOT NULL'),
+        ),
     )
@@ -1,11 +1,30 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import select
 
+from src.analysis.reachability import EdgeSet, EdgeDeleted
+from src.analysis.utils import record_graph_change
 from src.buttons.models import ButtonModel
-from src.buttons.schemas import ButtonCreateSchema, ButtonReadSchema, ButtonUpdateSchema, ButtonIdWithSeqNumber
+from src.buttons.schemas import (
+    ButtonCreateSchema,
+    ButtonReadSchema,
+    ButtonUpdateSchema,
+    ButtonIdWithSeqNumber,
+    buttons_adapter,
+)
+from src.core.db import get_row_dicts
 from src.core.dependencies.db_dependencies import AsyncSessionDI
+from src.graph.enums import GraphEdgeKind
+from src.graph.utils import set_group_edge, delete_group_edge
+from src.ordering.schemas import MoveSchema
+from src.ordering.utils import (
+    allocate_rank,
+    delete_item,
+    get_rank_by_position,
+    move_item,
+)
+from src.projects.utils import bump_project_version
 
 
 class ButtonRepository:
@@ -22,76 +41,131 @@ class ButtonRepository:
             return
         return button
 
-    async def create_button(self, group_id: UUID, button: ButtonCreateSchema) -> ButtonReadSchema:
-        button_count = await self._session.scalar(
-            select(func.count())
-            .select_from(ButtonModel)
-            .where(ButtonModel.group_id == group_id)
-        )
+    async def create_button(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            button: ButtonCreateSchema,
+    ) -> ButtonReadSchema:
+        await bump_project_version(self._session, project_id)
         button = ButtonModel(
             **button.model_dump(),
             group_id=group_id,
-            sequence_number=button_count + 1,
+            sequence_number=await allocate_rank(self._session, ButtonModel, group_id),
         )
         self._session.add(button)
-        await self._session.commit()
+        await self._session.flush()
+        record_graph_change(self._session, project_id, EdgeSet(
+            edge_id=button.button_id,
+            kind=GraphEdgeKind.BUTTON,
+            source_group_id=group_id,
+            destination_group_id=None,
+        ))
         return ButtonReadSchema.model_validate(button)
 
     async def get_buttons(self, group_id: UUID) -> list[ButtonReadSchema]:
         buttons = await self._session.execute(
-            select(ButtonModel)
+            select(
+                ButtonModel.button_id,
+                ButtonModel.text,
+                ButtonModel.payload,
+                ButtonModel.sequence_number,
+                ButtonModel.destination_group_id,
+                ButtonModel.created_at,
+            )
             .where(ButtonModel.group_id == group_id)
             .order_by(ButtonModel.sequence_number)
         )
-        return [
-            ButtonReadSchema.model_validate(button)
-            for button in buttons.scalars().all()
-        ]
+        buttons = get_row_dicts(buttons)
+        for position, button in enumerate(buttons, start=1):
+            button['sequence_number'] = position
+        return buttons_adapter.validate_python(buttons)
 
     async def get_button_by_id(self, button_id: UUID) -> Optional[ButtonReadSchema]:
-        button = self._get_button_model_instance(button_id)
+        button = await self._get_button_model_instance(button_id)
         if button is None:
             return
         return ButtonReadSchema.model_validate(button)
 
-    async def delete_button(self, button_id: UUID):
-        await self._session.execute(
-            delete(ButtonModel)
-            .where(ButtonModel.button_id == button_id)
-        )
-        await self._session.commit()
+    async def delete_button(self, project_id: UUID, button_id: UUID):
+        await bump_project_version(self._session, project_id)
+        await delete_item(self._session, ButtonModel, button_id)
+        await delete_group_edge(self._session, button_id)
+        await self._session.flush()
+        record_graph_change(self._session, project_id, EdgeDeleted(edge_id=button_id))
 
     async def set_button_destination_group(
             self,
+            project_id: UUID,
             button_id: UUID,
             destination_group_id: UUID,
     ) -> Optional[ButtonReadSchema]:
-        button = self._get_button_model_instance(button_id)
+        button = await self._get_button_model_instance(button_id)
         if button is None:
             return
 
+        await bump_project_version(self._session, project_id)
         button.destination_group_id = destination_group_id
-        await self._session.commit()
+        await self._session.flush()
+        await set_group_edge(
+            self._session,
+            project_id=project_id,
+            kind=GraphEdgeKind.BUTTON,
+            ref_id=button_id,
+            src_group_id=button.group_id,
+            dst_group_id=destination_group_id,
+        )
+        record_graph_change(self._session, project_id, EdgeSet(
+            edge_id=button_id,
+            kind=GraphEdgeKind.BUTTON,
+            source_group_id=button.group_id,
+            destination_group_id=destination_group_id,
+        ))
 
         return ButtonReadSchema.model_validate(button)
 
     async def update_button(
             self,
+            project_id: UUID,
             button_id: UUID,
             button_update: ButtonUpdateSchema,
     ) -> Optional[ButtonReadSchema]:
-        button = self._get_button_model_instance(button_id)
+        button = await self._get_button_model_instance(button_id)
         if button is None:
             return
 
+        await bump_project_version(self._session, project_id)
         button.text = button_update.text
         button.payload = button_update.payload
-        await self._session.commit()
+        await self._session.flush()
 
         return ButtonReadSchema.model_validate(button)
 
+    async def move_button(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            button_id: UUID,
+            move: MoveSchema,
+    ) -> Optional[ButtonReadSchema]:
+        await bump_project_version(self._session, project_id)
+        rank = await move_item(
+            self._session,
+            ButtonModel,
+            group_id=group_id,
+            item_id=button_id,
+            anchor_id=move.anchor_id,
+            position=move.position,
+        )
+        if rank is None:
+            return
+        await self._session.flush()
+
+        return await self.get_button_by_id(button_id)
+
     async def change_button_sequence(
             self,
+            project_id: UUID,
             group_id: UUID,
             button_ids_with_seq_numbers: list[ButtonIdWithSeqNumber],
     ) -> list[ButtonIdWithSeqNumber]:
@@ -100,6 +174,7 @@ class ButtonRepository:
             for btn in button_ids_with_seq_numbers
         }
 
+        await bump_project_version(self._session, project_id)
         buttons = await self._session.execute(
             select(ButtonModel)
             .where(ButtonModel.group_id == group_id)
@@ -107,10 +182,10 @@ class ButtonRepository:
         buttons = buttons.scalars().all()
 
         for button in buttons:
-            button.sequence_number = id_to_seq_number[button.button_id]
-        await self._session.commit()
+            button.sequence_number = get_rank_by_position(id_to_seq_number[button.button_id])
+        await self._session.flush()
 
         return [
-            ButtonIdWithSeqNumber.model_validate(button)
+            ButtonIdWithSeqNumber(button_id=button.button_id, sequence_number=id_to_seq_number[button.button_id])
             for button in buttons
         ]
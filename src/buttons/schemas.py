@@ -2,13 +2,15 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class ButtonReadSchema(BaseModel):
     button_id: UUID
     text: str = Field(max_length=64)
     payload: str = Field(max_length=64)
+    # listings number the buttons of a group 1..n, a single button carries its stored rank,
+    # which orders the same way without counting the buttons before it
     sequence_number: int
     destination_group_id: Optional[UUID]
     created_at: datetime
@@ -35,3 +37,6 @@ class ButtonIdWithSeqNumber(BaseModel):
     model_config = {
         'from_attributes': True,
     }
+
+
+buttons_adapter = TypeAdapter(list[ButtonReadSchema])
@@ -8,22 +8,19 @@ from src.buttons.exceptions.services_exceptions import (
     IncorrectNumberOfButtonsError,
 )
 from src.buttons.schemas import ButtonCreateSchema, ButtonReadSchema, ButtonUpdateSchema, ButtonIdWithSeqNumber
-from src.groups.dependencies.repositories_dependencies import GroupRepositoryDI
-from src.groups.exceptions.services_exceptions import GroupNotFoundError
-from src.projects.dependencies.repositories_dependencies import ProjectRepositoryDI
-from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+from src.ordering.exceptions.services_exceptions import InvalidMoveError
+from src.ordering.schemas import MoveSchema
+from src.scopes.dependencies.services_dependencies import ScopeServiceDI
 
 
 class ButtonService:
     def __init__(
             self,
             button_repository: ButtonRepositoryDI,
-            project_repository: ProjectRepositoryDI,
-            group_repository: GroupRepositoryDI,
+            scope_service: ScopeServiceDI,
     ):
         self._button_repository = button_repository
-        self._project_repository = project_repository
-        self._group_repository = group_repository
+        self._scope_service = scope_service
 
     async def create_button(
             self,
@@ -31,45 +28,24 @@ class ButtonService:
             group_id: UUID,
             button: ButtonCreateSchema,
     ) -> ButtonReadSchema:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_group_scope(project_id, group_id)
 
         return await self._button_repository.create_button(
+            project_id=project_id,
             group_id=group_id,
             button=button,
         )
 
     async def get_buttons(self, project_id: UUID, group_id: UUID) -> list[ButtonReadSchema]:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_group_scope(project_id, group_id)
 
         return await self._button_repository.get_buttons(group_id)
 
-    # TODO: update the sequence numbers of remaining buttons after deletion
+    # positions are counted from the ranks, the remaining buttons need no renumbering
     async def delete_button(self, project_id: UUID, group_id: UUID, button_id: UUID):
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
-
-        button = await self._button_repository.get_button_by_id(button_id)
-        if button is None:
-            raise ButtonNotFoundError
+        await self._scope_service.get_button_scope(project_id, group_id, button_id)
 
-        await self._button_repository.delete_button(button_id)
+        await self._button_repository.delete_button(project_id, button_id)
 
     async def set_button_destination_group(
             self,
@@ -78,24 +54,15 @@ class ButtonService:
             button_id: UUID,
             destination_group_id: UUID,
     ) -> ButtonReadSchema:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
-
-        # TODO: specify group id in errors
-        destination_group = await self._group_repository.get_group_by_id(destination_group_id)
-        if destination_group is None:
-            raise GroupNotFoundError
-
-        button = await self._button_repository.get_button_by_id(button_id)
-        if button is None:
-            raise ButtonNotFoundError
+        await self._scope_service.get_button_scope(
+            project_id=project_id,
+            group_id=group_id,
+            button_id=button_id,
+            destination_group_id=destination_group_id,
+        )
 
         return await self._button_repository.set_button_destination_group(
+            project_id=project_id,
             button_id=button_id,
             destination_group_id=destination_group_id,
         )
@@ -107,36 +74,42 @@ class ButtonService:
             button_id: UUID,
             button_update: ButtonUpdateSchema,
     ) -> ButtonReadSchema:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
-
-        button = await self._button_repository.get_button_by_id(button_id)
-        if button is None:
-            raise ButtonNotFoundError
+        await self._scope_service.get_button_scope(project_id, group_id, button_id)
 
         return await self._button_repository.update_button(
+            project_id=project_id,
             button_id=button_id,
             button_update=button_update,
         )
 
+    async def move_button(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            button_id: UUID,
+            move: MoveSchema,
+    ) -> ButtonReadSchema:
+        await self._scope_service.get_button_scope(project_id, group_id, button_id)
+        if move.anchor_id == button_id:
+            raise InvalidMoveError
+
+        button = await self._button_repository.move_button(
+            project_id=project_id,
+            group_id=group_id,
+            button_id=button_id,
+            move=move,
+        )
+        if button is None:
+            raise ButtonNotFoundError
+        return button
+
     async def change_button_sequence(
             self,
             project_id: UUID,
             group_id: UUID,
             button_ids_with_seq_numbers: list[ButtonIdWithSeqNumber],
     ) -> list[ButtonIdWithSeqNumber]:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_group_scope(project_id, group_id)
 
         buttons = await self._button_repository.get_buttons(group_id)
         buttons_len = len(buttons)
@@ -158,6 +131,7 @@ class ButtonService:
             raise IncorrectButtonSeqNumbersError
 
         return await self._button_repository.change_button_sequence(
+            project_id=project_id,
             group_id=group_id,
             button_ids_with_seq_numbers=button_ids_with_seq_numbers,
         )
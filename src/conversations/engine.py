@@ -0,0 +1,76 @@
+from typing import Optional
+
+from src.conversations.schemas import IncomingUpdate, ConversationStep
+from src.conversations.utils import INPUT_TYPES_BY_PRIORITY, get_input_matcher_by_type
+from src.graph.compiler import CompiledGraph, NO_GROUP
+
+
+class InMemoryChatStateStorage:
+    def __init__(self):
+        self._group_indexes: dict[int, int] = {}
+
+    async def get_group_index(self, chat_id: int) -> Optional[int]:
+        return self._group_indexes.get(chat_id)
+
+    async def set_group_index(self, chat_id: int, group_index: int):
+        self._group_indexes[chat_id] = group_index
+
+
+class ConversationEngine:
+    def __init__(self, graph: CompiledGraph, storage: Optional[InMemoryChatStateStorage] = None):
+        self._graph = graph
+        # group indexes are only meaningful for the graph they were resolved with
+        self._storage = storage or InMemoryChatStateStorage()
+        self._input_matchers = tuple(
+            (input_type.value, get_input_matcher_by_type(input_type))
+            for input_type in INPUT_TYPES_BY_PRIORITY
+        )
+
+    @property
+    def graph(self) -> CompiledGraph:
+        return self._graph
+
+    async def start(self, chat_id: int) -> ConversationStep:
+        start_index = self._graph.start_index
+        if start_index == NO_GROUP:
+            return ConversationStep(chat_id=chat_id, group_index=NO_GROUP, transitioned=False, actions=())
+
+        await self._storage.set_group_index(chat_id, start_index)
+        return ConversationStep(
+            chat_id=chat_id,
+            group_index=start_index,
+            transitioned=True,
+            actions=self._graph.actions[start_index],
+        )
+
+    async def handle_update(self, update: IncomingUpdate) -> ConversationStep:
+        group_index = await self._storage.get_group_index(update.chat_id)
+        if group_index is None:
+            return await self.start(update.chat_id)
+
+        next_group_index = self.resolve_next_group(group_index, update)
+        if next_group_index == NO_GROUP:
+            return ConversationStep(chat_id=update.chat_id, group_index=group_index, transitioned=False, actions=())
+
+        await self._storage.set_group_index(update.chat_id, next_group_index)
+        return ConversationStep(
+            chat_id=update.chat_id,
+            group_index=next_group_index,
+            transitioned=True,
+            actions=self._graph.actions[next_group_index],
+        )
+
+    def resolve_next_group(self, group_index: int, update: IncomingUpdate) -> int:
+        if update.payload is not None:
+            return self._graph.get_button_destination(group_index, update.payload)
+
+        if update.text is not None:
+            group_inputs = self._graph.input_destinations[group_index]
+            if group_inputs:
+                # an input without a destination does not take the text, a less specific input may
+                for input_type, matcher in self._input_matchers:
+                    destination = group_inputs.get(input_type, NO_GROUP)
+                    if destination != NO_GROUP and matcher(update.text):
+                        return destination
+
+        return NO_GROUP
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.graph.compiler import CompiledAction
+
+
+@dataclass(frozen=True, slots=True)
+class IncomingUpdate:
+    chat_id: int
+    payload: Optional[str] = None
+    text: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ConversationStep:
+    chat_id: int
+    group_index: int
+    transitioned: bool
+    actions: tuple[CompiledAction, ...]
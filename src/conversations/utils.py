@@ -0,0 +1,26 @@
+import re
+from typing import Callable
+
+from src.inputs.enums import InputType
+
+_INT_PATTERN = re.compile(r'[+-]?\d+')
+_EMAIL_PATTERN = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+_PHONE_NUMBER_PATTERN = re.compile(r'\+?[\d\s()-]{7,20}')
+
+# specific inputs are tried before the catch-all one
+INPUT_TYPES_BY_PRIORITY = (
+    InputType.INT,
+    InputType.PHONE_NUMBER,
+    InputType.EMAIL,
+    InputType.ANY,
+)
+
+
+def get_input_matcher_by_type(input_type: InputType) -> Callable[[str], bool]:
+    types_to_matchers = {
+        InputType.INT: lambda text: _INT_PATTERN.fullmatch(text) is not None,
+        InputType.EMAIL: lambda text: _EMAIL_PATTERN.fullmatch(text) is not None,
+        InputType.PHONE_NUMBER: lambda text: _PHONE_NUMBER_PATTERN.fullmatch(text) is not None,
+        InputType.ANY: lambda text: True,
+    }
+    return types_to_matchers[input_type]
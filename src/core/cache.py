@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Optional
+from uuid import UUID
+
+from src.core import settings
+
+# rough bookkeeping cost of one entry, charged on top of the value size
+_ENTRY_OVERHEAD = 256
+
+
+class ProjectCacheKey(StrEnum):
+    GROUPS = 'groups'
+    COMPILED_GRAPH = 'compiled_graph'
+    PATH_INDEX = 'path_index'
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    value: Any
+    size: int
+    version: int
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    stale: int = 0
+
+
+# LRU cache of per-project read models within a memory budget. Entries are only returned for the
+# project version they were read at, which readers take from the same snapshot as the cached rows
+class ProjectCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple[UUID, str], _CacheEntry] = OrderedDict()
+        self._project_keys: dict[UUID, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, project_id: UUID, key: str, version: int) -> Optional[Any]:
+        entry = self._entries.get((project_id, key))
+        if entry is None:
+            self.stats.misses += 1
+            return
+        if entry.version != version:
+            # left by an older version, or read at a newer one than this reader's snapshot
+            self.stats.misses += 1
+            self.stats.stale += 1
+            return
+        self._entries.move_to_end((project_id, key))
+        self.stats.hits += 1
+        return entry.value
+
+    def put(self, project_id: UUID, key: str, value: Any, size: int, version: int):
+        entry = self._entries.get((project_id, key))
+        if entry is not None and entry.version > version:
+            return
+        size += _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+
+        self._remove((project_id, key))
+        self._entries[(project_id, key)] = _CacheEntry(value=value, size=size, version=version)
+        self._project_keys.setdefault(project_id, set()).add(key)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.stats.evictions += 1
+
+    def invalidate(self, project_id: UUID):
+        # entries of older versions are never returned anyway, this frees them right after a local commit
+        for key in self._project_keys.pop(project_id, ()):
+            self._remove((project_id, key))
+        self.stats.invalidations += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._project_keys.clear()
+        self.size = 0
+
+    def _remove(self, entry_key: tuple[UUID, str]):
+        entry = self._entries.pop(entry_key, None)
+        if entry is None:
+            return
+        self.size -= entry.size
+
+        project_id, key = entry_key
+        project_keys = self._project_keys.get(project_id)
+        if project_keys is not None:
+            project_keys.discard(key)
+            if not project_keys:
+                del self._project_keys[project_id]
+
+
+project_cache = ProjectCache(max_bytes=settings.PROJECT_CACHE_MAX_BYTES)
@@ -1,9 +1,13 @@
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Callable
+from uuid import uuid4
 
+from sqlalchemy import event, Result
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
 from src.core import settings
+from src.core.pool import MeasuredQueuePool
 
 
 class Base(DeclarativeBase):
@@ -26,10 +30,69 @@ def get_postgres_dsn(
     )
 
 
-engine = create_async_engine(get_postgres_dsn())
+def get_engine_options() -> dict:
+    connect_args = {'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE}
+    if settings.DB_PGBOUNCER:
+        # in transaction mode consecutive transactions land on different server connections,
+        # so nothing may stay prepared under a name and statement names must not collide
+        connect_args = {
+            'prepared_statement_cache_size': 0,
+            'statement_cache_size': 0,
+            'prepared_statement_name_func': lambda: f'__asyncpg_{uuid4()}__',
+        }
+
+    return {
+        'poolclass': MeasuredQueuePool,
+        'pool_size': settings.DB_POOL_SIZE,
+        'max_overflow': settings.DB_MAX_OVERFLOW,
+        'pool_timeout': settings.DB_POOL_TIMEOUT,
+        'pool_recycle': settings.DB_POOL_RECYCLE,
+        'pool_pre_ping': settings.DB_POOL_PRE_PING,
+        'connect_args': connect_args,
+    }
+
+
+engine = create_async_engine(get_postgres_dsn(), **get_engine_options())
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+# reads open their transactions with BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY: writes in them
+# are rejected and all statements of a request see one snapshot, so one project version
+READ_ONLY_EXECUTION_OPTIONS = {'isolation_level': 'REPEATABLE READ', 'postgresql_readonly': True}
+read_only_session_maker = async_sessionmaker(
+    engine.execution_options(**READ_ONLY_EXECUTION_OPTIONS),
+    expire_on_commit=False,
+)
+
+
+def get_row_dicts(result: Result) -> list[dict]:
+    # cheaper than Row._asdict() per row, response rows are validated from plain dicts
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row)) for row in result.all()]
+
+
+def get_transaction_info(session: AsyncSession) -> dict:
+    return session.info.setdefault('transaction_info', {})
+
+
+def run_after_commit(session: AsyncSession, callback: Callable[[], None]):
+    get_transaction_info(session).setdefault('after_commit_callbacks', []).append(callback)
+
+
+@asynccontextmanager
+async def unit_of_work(session: AsyncSession) -> AsyncGenerator[None, None]:
+    try:
+        yield
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+
+
+@event.listens_for(Session, 'after_commit')
+def _run_after_commit_callbacks(session: Session):
+    for callback in session.info.pop('transaction_info', {}).get('after_commit_callbacks', ()):
+        callback()
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
-        yield session
+@event.listens_for(Session, 'after_rollback')
+def _drop_transaction_info(session: Session):
+    session.info.pop('transaction_info', None)
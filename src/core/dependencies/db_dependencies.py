@@ -1,8 +1,30 @@
-from typing import Annotated
+from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db import get_async_session
+from src.core.db import async_session_maker, unit_of_work
+from src.core.replica import CONSISTENCY_TOKEN_HEADER, replica_engine, get_read_session_maker, get_commit_token
+
+READ_ONLY_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    # one transaction per request: repositories only flush, the request commits once or rolls everything back.
+    # The dependency exits before the response is sent, so a failed commit never reaches the client as a success
+    if request.method in READ_ONLY_METHODS:
+        session_maker = await get_read_session_maker(request.headers.get(CONSISTENCY_TOKEN_HEADER))
+        async with session_maker() as session:
+            async with unit_of_work(session):
+                yield session
+        return
+
+    async with async_session_maker() as session:
+        async with unit_of_work(session):
+            yield session
+            has_transaction = session.in_transaction()
+        if has_transaction and replica_engine is not None:
+            request.state.consistency_token = await get_commit_token(session)
+
 
 AsyncSessionDI = Annotated[AsyncSession, Depends(get_async_session)]
@@ -0,0 +1,53 @@
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+# upper bounds in seconds of the checkout wait histogram, the last bucket takes everything slower
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+@dataclass(slots=True)
+class PoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    wait_histogram: list[int] = field(default_factory=lambda: [0] * (len(CHECKOUT_WAIT_BUCKETS) + 1))
+
+    def record_checkout(self, wait_seconds: float):
+        self.checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        for i, bound in enumerate(CHECKOUT_WAIT_BUCKETS):
+            if wait_seconds <= bound:
+                self.wait_histogram[i] += 1
+                return
+        self.wait_histogram[-1] += 1
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    @property
+    def max_overflow(self) -> int:
+        return self._max_overflow
+
+    def recreate(self) -> 'MeasuredQueuePool':
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    # a checkout covers waiting for a free connection, opening a new one and the pre-ping
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        self.stats.record_checkout(time.perf_counter() - started_at)
+        return connection
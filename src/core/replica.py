@@ -0,0 +1,88 @@
+import asyncio
+import time
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core import settings
+from src.core.db import get_postgres_dsn, get_engine_options, read_only_session_maker, READ_ONLY_EXECUTION_OPTIONS
+
+# writes answer with the WAL position of their commit, clients send it back with later reads
+CONSISTENCY_TOKEN_HEADER = 'X-Consistency-Token'
+REPLICA_POLL_INTERVAL = 0.01
+
+replica_engine = None
+replica_session_maker = None
+if settings.DB_REPLICA_HOST:
+    replica_engine = create_async_engine(
+        get_postgres_dsn(host=settings.DB_REPLICA_HOST, port=settings.DB_REPLICA_PORT),
+        **get_engine_options(),
+    )
+    replica_session_maker = async_sessionmaker(
+        replica_engine.execution_options(**READ_ONLY_EXECUTION_OPTIONS),
+        expire_on_commit=False,
+    )
+
+# the furthest position the replica was seen to replay
+_replayed_lsn = 0
+
+
+def parse_lsn(lsn: str) -> Optional[int]:
+    high, separator, low = lsn.partition('/')
+    if not separator:
+        return
+    try:
+        return int(high, 16) << 32 | int(low, 16)
+    except ValueError:
+        return
+
+
+async def get_commit_token(session: AsyncSession) -> str:
+    # read after the commit, a replica could replay up to a position taken before it without the commit record
+    return await session.scalar(text('SELECT pg_current_wal_lsn()::text'))
+
+
+async def _get_replayed_lsn() -> int:
+    async with replica_engine.connect() as connection:
+        lsn = await connection.scalar(text(
+            'SELECT (CASE WHEN pg_is_in_recovery() THEN pg_last_wal_replay_lsn() ELSE pg_current_wal_lsn() END)::text'
+        ))
+    return parse_lsn(lsn or '') or 0
+
+
+async def wait_for_replica(lsn: int) -> bool:
+    global _replayed_lsn
+    deadline = time.monotonic() + settings.DB_REPLICA_MAX_WAIT
+    while _replayed_lsn < lsn:
+        _replayed_lsn = max(_replayed_lsn, await _get_replayed_lsn())
+        if _replayed_lsn < lsn:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(REPLICA_POLL_INTERVAL)
+    return True
+
+
+async def get_read_session_maker(token: Optional[str]) -> async_sessionmaker:
+    if replica_session_maker is None:
+        return read_only_session_maker
+    # only the client's own writes are waited for, the project cache checks its entries
+    # against the version read in the same snapshot, so older replica rows never replace newer ones
+    lsn = parse_lsn(token or '') or 0
+    try:
+        if await wait_for_replica(lsn):
+            return replica_session_maker
+    except (OSError, DBAPIError):
+        # an unreachable replica is treated like a lagging one
+        pass
+    return read_only_session_maker
+
+
+async def set_consistency_token(request: Request, call_next):
+    response = await call_next(request)
+    token = getattr(request.state, 'consistency_token', None)
+    if token is not None:
+        response.headers[CONSISTENCY_TOKEN_HEADER] = token
+    return response
@@ -5,6 +5,11 @@ from src.groups.api import router as groups_router
 from src.buttons.api import router as buttons_router
 from src.inputs.api import router as inputs_router
 from src.actions.api import router as actions_router
+from src.graph.api import router as graph_router
+from src.batches.api import router as batches_router
+from src.transfers.api import router as transfers_router
+from src.analysis.api import router as analysis_router
+from src.monitoring.api import router as monitoring_router
 
 
 def get_app_router() -> APIRouter:
@@ -16,6 +21,11 @@ def get_app_router() -> APIRouter:
         buttons_router,
         inputs_router,
         actions_router,
+        graph_router,
+        batches_router,
+        transfers_router,
+        analysis_router,
+        monitoring_router,
     ]
 
     for router in routers:
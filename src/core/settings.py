@@ -11,3 +11,27 @@ DB_PORT = os.environ.get('DB_PORT')
 DB_NAME = os.environ.get('DB_NAME')
 DB_USER = os.environ.get('DB_USER')
 DB_PASS = os.environ.get('DB_PASS')
+
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE') or 10)
+DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW') or 10)
+# seconds a request waits for a free connection before failing
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT') or 10)
+# seconds after which a connection is replaced, keep it below server and proxy idle timeouts
+DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE') or 1800)
+DB_POOL_PRE_PING = (os.environ.get('DB_POOL_PRE_PING') or 'true').lower() in ('1', 'true')
+# prepared statements cached per connection, 0 prepares every statement again
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get('DB_STATEMENT_CACHE_SIZE') or 100)
+# connect through PgBouncer in transaction pooling mode: no statement cache and unique statement names
+DB_PGBOUNCER = os.environ.get('DB_PGBOUNCER', '').lower() in ('1', 'true')
+
+# optional streaming replica that serves GET requests
+DB_REPLICA_HOST = os.environ.get('DB_REPLICA_HOST')
+DB_REPLICA_PORT = os.environ.get('DB_REPLICA_PORT') or DB_PORT
+# seconds a read waits for the replica to replay the client's last write before it goes to the primary
+DB_REPLICA_MAX_WAIT = float(os.environ.get('DB_REPLICA_MAX_WAIT') or 0.1)
+
+PROJECT_CACHE_MAX_BYTES = int(os.environ.get('PROJECT_CACHE_MAX_BYTES') or 64 * 1024 * 1024)
+# let Postgres render the groups listing JSON instead of the API process
+GROUPS_SQL_JSON = os.environ.get('GROUPS_SQL_JSON', '').lower() in ('1', 'true')
+# projects whose reachability state is kept in memory and updated by edits
+REACHABILITY_MAX_PROJECTS = int(os.environ.get('REACHABILITY_MAX_PROJECTS') or 16)
@@ -0,0 +1,59 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(slots=True)
+class SingleFlightStats:
+    loads: int = 0
+    coalesced: int = 0
+
+
+# coalesces concurrent calls with the same key: the first caller runs the load, later ones wait for
+# its result or error, and if it is cancelled one of the waiting callers runs the load instead
+class SingleFlight:
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        # the future holds (result, error), so an error nobody waits for is never reported as unretrieved
+        self._flights: dict[Hashable, asyncio.Future[tuple[Any, BaseException | None]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def run(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        flight = self._flights.get(key)
+        while flight is not None:
+            try:
+                result, error = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                flight = self._flights.get(key)
+                continue
+            self.stats.coalesced += 1
+            if error is not None:
+                raise error
+            return result
+
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        self.stats.loads += 1
+        try:
+            result = await load()
+        except Exception as error:
+            flight.set_result((None, error))
+            raise
+        except BaseException:
+            # the caller was cancelled, the waiting callers wake up and one of them loads again
+            flight.cancel()
+            raise
+        else:
+            flight.set_result((result, None))
+            return result
+        finally:
+            del self._flights[key]
+
+
+# graph reads that miss the project cache, keyed by what they read and the project version
+read_flights = SingleFlight()
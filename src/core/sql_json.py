@@ -0,0 +1,51 @@
+import json
+from enum import Enum
+from typing import Type
+
+from pydantic import BaseModel
+from sqlalchemy import func, case, cast, Text, ColumnElement
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+# Builders for JSON text that Postgres renders exactly like pydantic's dump_json.
+# json_build_object and json_agg put spaces after separators, so objects and arrays are
+# concatenated by hand from to_json escaped values, which escape strings the same way.
+
+
+def json_value(expression: ColumnElement) -> ColumnElement:
+    return func.coalesce(cast(func.to_json(expression), Text), 'null')
+
+
+def json_datetime(expression: ColumnElement) -> ColumnElement:
+    # pydantic writes aware datetimes in UTC with a Z suffix and drops zero microseconds
+    utc_expression = func.timezone('UTC', expression)
+    return func.concat(
+        '"',
+        func.to_char(utc_expression, 'YYYY-MM-DD"T"HH24:MI:SS'),
+        case(
+            (func.date_trunc('second', expression) == expression, ''),
+            else_=func.to_char(utc_expression, '.US'),
+        ),
+        'Z"',
+    )
+
+
+def json_enum(expression: ColumnElement, enum_type: Type[Enum]) -> ColumnElement:
+    return case(
+        *((expression == member, json.dumps(member.value)) for member in enum_type),
+        else_='null',
+    )
+
+
+def json_object(schema: Type[BaseModel], values: dict[str, ColumnElement]) -> ColumnElement:
+    # fields follow the schema declaration order, the order dump_json writes them in
+    parts = []
+    for i, field in enumerate(schema.model_fields):
+        parts.append(('{' if i == 0 else ',') + json.dumps(field) + ':')
+        parts.append(values[field])
+    parts.append('}')
+    return func.concat(*parts)
+
+
+def json_array(item: ColumnElement, *order_by: ColumnElement) -> ColumnElement:
+    # an aggregate, rows without items give '[]'
+    return func.concat('[', func.string_agg(item, aggregate_order_by(',', *order_by)), ']')
@@ -0,0 +1,47 @@
+import os
+import time
+from datetime import datetime, timezone
+from uuid import UUID
+
+_UUID7_COUNTER_MAX = 2 ** 42 - 1
+
+_last_uuid7_timestamp = 0
+_last_uuid7_counter = 0
+
+
+def _get_uuid7_counter_and_tail() -> tuple[int, int]:
+    random_bits = int.from_bytes(os.urandom(10))
+    # the counter starts in its lower half, so it can advance many times within one millisecond
+    return (random_bits >> 32) & (_UUID7_COUNTER_MAX >> 1), random_bits & 0xffff_ffff
+
+
+def uuid7() -> UUID:
+    # RFC 9562 time ordered ids: 48 bit unix milliseconds, 42 bit counter, 32 random bits.
+    # New rows land at the right edge of the primary key index instead of a random page,
+    # and ids generated by this process keep increasing even within one millisecond.
+    global _last_uuid7_timestamp, _last_uuid7_counter
+
+    timestamp = time.time_ns() // 1_000_000
+    if timestamp > _last_uuid7_timestamp:
+        counter, tail = _get_uuid7_counter_and_tail()
+    else:
+        # the clock went backwards or did not move
+        timestamp = _last_uuid7_timestamp
+        counter = _last_uuid7_counter + 1
+        tail = int.from_bytes(os.urandom(4))
+        if counter > _UUID7_COUNTER_MAX:
+            timestamp += 1
+            counter, tail = _get_uuid7_counter_and_tail()
+    _last_uuid7_timestamp, _last_uuid7_counter = timestamp, counter
+
+    value = (timestamp & 0xffff_ffff_ffff) << 80
+    value |= 0x7 << 76
+    value |= (counter >> 30) << 64
+    value |= 0b10 << 62
+    value |= (counter & 0x3fff_ffff) << 32
+    value |= tail
+    return UUID(int=value)
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
@@ -0,0 +1,47 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Response, Depends
+
+from src.graph.dependencies.services_dependencies import GraphServiceDI
+from src.graph.schemas import GraphSchema
+from src.projects.dependencies.etag_dependencies import check_project_etag, ProjectETagDI, ProjectVersionDI
+from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException
+from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+
+router = APIRouter(
+    prefix='/projects/{project_id}/graph',
+    tags=['Graph'],
+)
+
+
+@router.get(
+    '',
+    response_model=GraphSchema,
+    dependencies=[Depends(check_project_etag)],
+)
+async def get_graph(
+        graph_service: GraphServiceDI,
+        project_id: UUID,
+):
+    try:
+        return await graph_service.get_graph(project_id)
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+
+
+@router.get(
+    '/compiled',
+    response_class=Response,
+    responses={200: {'content': {'application/octet-stream': {}}}},
+)
+async def get_compiled_graph(
+        graph_service: GraphServiceDI,
+        project_id: UUID,
+        project_etag: ProjectETagDI,
+        project_version: ProjectVersionDI,
+):
+    try:
+        compiled_graph = await graph_service.get_compiled_graph_data(project_id, project_version)
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+    return Response(content=compiled_graph, media_type='application/octet-stream', headers={'ETag': project_etag})
@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import sys
+from uuid import UUID
+
+from sqlalchemy import select, delete, except_, func, String
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.actions.models import ActionModel  # noqa: F401, the group mapper needs every related model
+from src.core.db import async_session_maker
+from src.graph.models import GroupEdgeModel
+from src.graph.utils import select_expected_edges, fill_group_edges
+from src.projects.models import ProjectModel  # noqa: F401
+
+
+def select_stored_edges():
+    return select(
+        GroupEdgeModel.ref_id,
+        GroupEdgeModel.kind.cast(String),
+        GroupEdgeModel.project_id,
+        GroupEdgeModel.src_group_id,
+        GroupEdgeModel.dst_group_id,
+    )
+
+
+async def count_differences(session: AsyncSession) -> dict[str, int]:
+    missing = except_(select_expected_edges(), select_stored_edges()).subquery()
+    stale = except_(select_stored_edges(), select_expected_edges()).subquery()
+    return {
+        'missing': await session.scalar(select(func.count()).select_from(missing)),
+        'stale': await session.scalar(select(func.count()).select_from(stale)),
+    }
+
+
+async def get_drifted_project_ids(session: AsyncSession) -> list[UUID]:
+    missing = except_(select_expected_edges(), select_stored_edges()).subquery()
+    stale = except_(select_stored_edges(), select_expected_edges()).subquery()
+    return (await session.scalars(
+        select(missing.c.project_id)
+        .union(select(stale.c.project_id))
+    )).all()
+
+
+async def rebuild_project_edges(session: AsyncSession, project_id: UUID):
+    await session.execute(
+        delete(GroupEdgeModel)
+        .where(GroupEdgeModel.project_id == project_id)
+    )
+    await fill_group_edges(session, project_id)
+
+
+async def run_check(repair: bool) -> bool:
+    async with async_session_maker() as session:
+        differences = await count_differences(session)
+        print(f'{differences["missing"]} missing and {differences["stale"]} stale edges in group_edges')
+        if not any(differences.values()):
+            return True
+        if not repair:
+            return False
+
+        project_ids = await get_drifted_project_ids(session)
+        for project_id in project_ids:
+            await rebuild_project_edges(session, project_id)
+        await session.commit()
+
+    print(f'rebuilt the edges of {len(project_ids)} projects')
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare group_edges with the destinations of buttons and inputs')
+    parser.add_argument('--repair', action='store_true', help='rebuild the edges of the projects that differ')
+    args = parser.parse_args()
+
+    if not asyncio.run(run_check(repair=args.repair)):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+import marshal
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Optional, Self
+from uuid import UUID
+
+from src.graph.enums import GraphEdgeKind
+
+COMPILED_GRAPH_FORMAT_VERSION = 1
+
+# index of a missing group: unset destinations, unknown payloads and empty projects
+NO_GROUP = -1
+
+EDGE_KINDS = tuple(GraphEdgeKind)
+EDGE_KIND_CODES = {kind: code for code, kind in enumerate(EDGE_KINDS)}
+
+UUID_SIZE = 16
+
+CompiledAction = tuple[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledGraph:
+    project_id: UUID
+
+    # ids are kept packed and only turned into UUID objects on demand, which keeps loading cheap
+    group_ids: bytes
+    group_indexes: dict[bytes, int]
+
+    # CSR adjacency: edges of group i are edge_offsets[i]:edge_offsets[i + 1]
+    edge_offsets: memoryview
+    edge_targets: memoryview
+    edge_kinds: memoryview
+    edge_ids: bytes
+
+    button_destinations: tuple[dict[str, int], ...]
+    input_destinations: tuple[dict[str, int], ...]
+    actions: tuple[tuple[CompiledAction, ...], ...]
+
+    def __len__(self) -> int:
+        return len(self.group_indexes)
+
+    @property
+    def start_index(self) -> int:
+        # groups are compiled in creation order, the first one is the entry point of the bot
+        return 0 if self.group_indexes else NO_GROUP
+
+    def get_group_id(self, group_index: int) -> UUID:
+        return _get_packed_uuid(self.group_ids, group_index)
+
+    def get_group_index(self, group_id: UUID) -> int:
+        return self.group_indexes.get(group_id.bytes, NO_GROUP)
+
+    def get_edge_id(self, edge_index: int) -> UUID:
+        return _get_packed_uuid(self.edge_ids, edge_index)
+
+    def get_edge_range(self, group_index: int) -> range:
+        return range(self.edge_offsets[group_index], self.edge_offsets[group_index + 1])
+
+    def get_edge_kind(self, edge_index: int) -> GraphEdgeKind:
+        return EDGE_KINDS[self.edge_kinds[edge_index]]
+
+    def get_button_destination(self, group_index: int, payload: str) -> int:
+        return self.button_destinations[group_index].get(payload, NO_GROUP)
+
+    def get_input_destination(self, group_index: int, input_type: str) -> int:
+        return self.input_destinations[group_index].get(input_type, NO_GROUP)
+
+    def dumps(self) -> bytes:
+        return marshal.dumps((
+            COMPILED_GRAPH_FORMAT_VERSION,
+            self.project_id.bytes,
+            self.group_ids,
+            self.edge_offsets.tobytes(),
+            self.edge_targets.tobytes(),
+            self.edge_kinds.tobytes(),
+            self.edge_ids,
+            self.button_destinations,
+            self.input_destinations,
+            self.actions,
+        ))
+
+    @classmethod
+    def loads(cls, data: bytes) -> Self:
+        (
+            format_version,
+            project_id,
+            group_ids,
+            edge_offsets,
+            edge_targets,
+            edge_kinds,
+            edge_ids,
+            button_destinations,
+            input_destinations,
+            actions,
+        ) = marshal.loads(data)
+        if format_version != COMPILED_GRAPH_FORMAT_VERSION:
+            raise ValueError(f'Unsupported compiled graph format version: {format_version}')
+
+        return cls(
+            project_id=UUID(bytes=project_id),
+            group_ids=group_ids,
+            group_indexes=_index_packed_uuids(group_ids),
+            edge_offsets=_freeze_array('I', edge_offsets),
+            edge_targets=_freeze_array('i', edge_targets),
+            edge_kinds=_freeze_array('B', edge_kinds),
+            edge_ids=edge_ids,
+            button_destinations=button_destinations,
+            input_destinations=input_destinations,
+            actions=actions,
+        )
+
+
+def compile_graph(
+        project_id: UUID,
+        group_ids: Iterable[UUID],
+        edges: Iterable[tuple[UUID, GraphEdgeKind, UUID, Optional[UUID], Optional[str], Optional[str]]],
+        actions: Iterable[tuple[UUID, str, str]],
+) -> CompiledGraph:
+    # edges are (edge_id, kind, source_group_id, destination_group_id, payload, input_type) in display
+    # order within a group, actions are (group_id, action_type, content) in sequence order within a group
+    group_ids = b''.join(group_id.bytes for group_id in group_ids)
+    group_indexes = _index_packed_uuids(group_ids)
+    groups_count = len(group_indexes)
+
+    # rows of a group missing from `group_ids` were committed after the groups were read,
+    # they belong to a later version and are left out instead of failing the whole compile
+    buckets = [[] for _ in range(groups_count)]
+    for edge in edges:
+        group_index = group_indexes.get(edge[2].bytes)
+        if group_index is not None:
+            buckets[group_index].append(edge)
+
+    edge_offsets = array('I', [0])
+    edge_targets = array('i')
+    edge_kinds = array('B')
+    edge_ids = bytearray()
+    button_destinations = []
+    input_destinations = []
+    for bucket in buckets:
+        group_buttons = {}
+        group_inputs = {}
+        for edge_id, kind, _, destination_group_id, payload, input_type in bucket:
+            target = NO_GROUP if destination_group_id is None else group_indexes.get(destination_group_id.bytes, NO_GROUP)
+            edge_targets.append(target)
+            edge_kinds.append(EDGE_KIND_CODES[kind])
+            edge_ids += edge_id.bytes
+            # the first linked button wins when a group reuses a payload, as it is the one shown first,
+            # an unlinked one only answers the payload when no button with it leads anywhere
+            destinations, key = (group_buttons, payload) if kind == GraphEdgeKind.BUTTON else (group_inputs, input_type)
+            if destinations.get(key, NO_GROUP) == NO_GROUP:
+                destinations[key] = target
+        edge_offsets.append(len(edge_targets))
+        button_destinations.append(group_buttons)
+        input_destinations.append(group_inputs)
+
+    group_actions = [[] for _ in range(groups_count)]
+    for group_id, action_type, content in actions:
+        group_index = group_indexes.get(group_id.bytes)
+        if group_index is not None:
+            group_actions[group_index].append((action_type, content))
+
+    return CompiledGraph(
+        project_id=project_id,
+        group_ids=group_ids,
+        group_indexes=group_indexes,
+        edge_offsets=_freeze_array('I', edge_offsets),
+        edge_targets=_freeze_array('i', edge_targets),
+        edge_kinds=_freeze_array('B', edge_kinds),
+        edge_ids=bytes(edge_ids),
+        button_destinations=tuple(button_destinations),
+        input_destinations=tuple(input_destinations),
+        actions=tuple(tuple(group_action_list) for group_action_list in group_actions),
+    )
+
+
+def _freeze_array(typecode: str, data: array | bytes) -> memoryview:
+    if isinstance(data, bytes):
+        data = array(typecode, data)
+    return memoryview(data).toreadonly()
+
+
+def _get_packed_uuid(data: bytes, index: int) -> UUID:
+    offset = index * UUID_SIZE
+    return UUID(bytes=data[offset:offset + UUID_SIZE])
+
+
+def _index_packed_uuids(data: bytes) -> dict[bytes, int]:
+    return {
+        data[offset:offset + UUID_SIZE]: index
+        for index, offset in enumerate(range(0, len(data), UUID_SIZE))
+    }
@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.graph.repositories import GraphRepository
+
+GraphRepositoryDI = Annotated[GraphRepository, Depends(GraphRepository)]
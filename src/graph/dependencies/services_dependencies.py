@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.graph.services import GraphService
+
+GraphServiceDI = Annotated[GraphService, Depends(GraphService)]
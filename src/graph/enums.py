@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class GraphEdgeKind(StrEnum):
+    BUTTON = 'button'
+    INPUT = 'input'
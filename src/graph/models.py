@@ -0,0 +1,26 @@
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.db import Base
+from src.graph.enums import GraphEdgeKind
+
+
+class GroupEdgeModel(Base):
+    __tablename__ = 'group_edges'
+
+    # the button or input the edge belongs to, only those with a destination have an edge
+    ref_id: Mapped[UUID] = mapped_column(primary_key=True)
+    kind: Mapped[GraphEdgeKind]
+
+    project_id: Mapped[UUID] = mapped_column(ForeignKey('projects.project_id', ondelete='CASCADE'))
+    src_group_id: Mapped[UUID] = mapped_column(ForeignKey('groups.group_id', ondelete='CASCADE'))
+    # deleting the destination group sets the button or input destination to null, and drops the edge
+    dst_group_id: Mapped[UUID] = mapped_column(ForeignKey('groups.group_id', ondelete='CASCADE'))
+
+    __table_args__ = (
+        Index('ix_group_edges_project_id', 'project_id'),
+        Index('ix_group_edges_src_group_id', 'src_group_id', 'dst_group_id'),
+        Index('ix_group_edges_dst_group_id', 'dst_group_id', 'src_group_id'),
+    )
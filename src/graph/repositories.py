@@ -0,0 +1,135 @@
+from collections import defaultdict
+from uuid import UUID
+
+from sqlalchemy import select, literal, null, cast, Integer, String, union_all, Select, CompoundSelect
+
+from src.actions.models import ActionModel
+from src.actions.utils import validate_action_from_db, get_action_content_field_by_type
+from src.buttons.models import ButtonModel
+from src.core.dependencies.db_dependencies import AsyncSessionDI
+from src.graph.compiler import CompiledGraph, compile_graph
+from src.graph.enums import GraphEdgeKind
+from src.graph.schemas import GraphSchema, GraphNodeSchema, GraphEdgeSchema
+from src.groups.models import GroupModel
+from src.inputs.models import InputModel
+
+
+class GraphRepository:
+    def __init__(self, session: AsyncSessionDI):
+        self._session = session
+
+    async def get_graph(self, project_id: UUID) -> GraphSchema:
+        groups = await self._session.execute(self._select_groups(project_id))
+        edges = await self._session.execute(self._select_edges(project_id))
+        actions = await self._session.execute(self._select_actions(project_id))
+
+        # buttons and actions come ordered by rank, their positions in a group are counted here
+        group_actions = defaultdict(list)
+        for action in actions.scalars().all():
+            actions_of_group = group_actions[action.group_id]
+            actions_of_group.append(validate_action_from_db(action, sequence_number=len(actions_of_group) + 1))
+
+        groups = groups.all()
+        group_ids = {group.group_id for group in groups}
+        # like in compile_graph, edges of groups committed after the groups were read are left out
+        edges = [
+            GraphEdgeSchema.model_validate(edge)
+            for edge in edges.all()
+            if edge.source_group_id in group_ids
+        ]
+        buttons_counts = defaultdict(int)
+        for edge in edges:
+            if edge.kind == GraphEdgeKind.BUTTON:
+                buttons_counts[edge.source_group_id] += 1
+                edge.sequence_number = buttons_counts[edge.source_group_id]
+        return GraphSchema(
+            project_id=project_id,
+            nodes=[
+                GraphNodeSchema(
+                    group_id=group.group_id,
+                    name=group.name,
+                    created_at=group.created_at,
+                    actions=group_actions[group.group_id],
+                )
+                for group in groups
+            ],
+            edges=edges,
+        )
+
+    async def get_compiled_graph(self, project_id: UUID) -> CompiledGraph:
+        groups = await self._session.execute(self._select_groups(project_id))
+        edges = await self._session.execute(self._select_edges(project_id))
+        actions = await self._session.execute(self._select_actions(project_id))
+
+        return compile_graph(
+            project_id=project_id,
+            group_ids=[group.group_id for group in groups.all()],
+            edges=[
+                (
+                    edge.edge_id,
+                    edge.kind,
+                    edge.source_group_id,
+                    edge.destination_group_id,
+                    edge.payload,
+                    None if edge.input_type is None else edge.input_type.value,
+                )
+                for edge in edges.all()
+            ],
+            actions=[
+                (
+                    action.group_id,
+                    action.type.value,
+                    action.payload[get_action_content_field_by_type(action.type)],
+                )
+                for action in actions.scalars().all()
+            ],
+        )
+
+    @staticmethod
+    def _select_groups(project_id: UUID) -> Select:
+        return (
+            select(GroupModel.group_id, GroupModel.name, GroupModel.created_at)
+            .where(GroupModel.project_id == project_id)
+            .order_by(GroupModel.created_at, GroupModel.group_id)
+        )
+
+    @staticmethod
+    def _select_edges(project_id: UUID) -> CompoundSelect:
+        return (
+            union_all(
+                select(
+                    ButtonModel.button_id.label('edge_id'),
+                    literal(GraphEdgeKind.BUTTON.value).label('kind'),
+                    ButtonModel.group_id.label('source_group_id'),
+                    ButtonModel.destination_group_id,
+                    ButtonModel.sequence_number,
+                    ButtonModel.text,
+                    ButtonModel.payload,
+                    cast(null(), InputModel.type.type).label('input_type'),
+                )
+                .join(GroupModel, GroupModel.group_id == ButtonModel.group_id)
+                .where(GroupModel.project_id == project_id),
+                select(
+                    InputModel.input_id.label('edge_id'),
+                    literal(GraphEdgeKind.INPUT.value).label('kind'),
+                    InputModel.group_id.label('source_group_id'),
+                    InputModel.destination_group_id,
+                    cast(null(), Integer).label('sequence_number'),
+                    cast(null(), String).label('text'),
+                    cast(null(), String).label('payload'),
+                    InputModel.type.label('input_type'),
+                )
+                .join(GroupModel, GroupModel.group_id == InputModel.group_id)
+                .where(GroupModel.project_id == project_id),
+            )
+            .order_by('source_group_id', 'kind', 'sequence_number', 'input_type')
+        )
+
+    @staticmethod
+    def _select_actions(project_id: UUID) -> Select:
+        return (
+            select(ActionModel)
+            .join(GroupModel, GroupModel.group_id == ActionModel.group_id)
+            .where(GroupModel.project_id == project_id)
+            .order_by(ActionModel.group_id, ActionModel.sequence_number)
+        )
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.actions.schemas import UnionActionReadSchema
+from src.graph.enums import GraphEdgeKind
+from src.inputs.enums import InputType
+
+
+class GraphNodeSchema(BaseModel):
+    group_id: UUID
+    name: str
+    created_at: datetime
+    actions: list[UnionActionReadSchema]
+
+
+class GraphEdgeSchema(BaseModel):
+    edge_id: UUID
+    kind: GraphEdgeKind
+    source_group_id: UUID
+    destination_group_id: Optional[UUID]
+    sequence_number: Optional[int]
+    text: Optional[str]
+    payload: Optional[str]
+    input_type: Optional[InputType]
+
+    model_config = {
+        'from_attributes': True,
+    }
+
+
+class GraphSchema(BaseModel):
+    project_id: UUID
+    nodes: list[GraphNodeSchema]
+    edges: list[GraphEdgeSchema]
@@ -0,0 +1,48 @@
+from uuid import UUID
+
+from src.core.cache import project_cache, ProjectCacheKey
+from src.core.single_flight import read_flights
+from src.graph.compiler import CompiledGraph
+from src.graph.dependencies.repositories_dependencies import GraphRepositoryDI
+from src.graph.schemas import GraphSchema
+from src.scopes.dependencies.services_dependencies import ScopeServiceDI
+
+
+class GraphService:
+    def __init__(
+            self,
+            graph_repository: GraphRepositoryDI,
+            scope_service: ScopeServiceDI,
+    ):
+        self._graph_repository = graph_repository
+        self._scope_service = scope_service
+
+    async def get_graph(self, project_id: UUID) -> GraphSchema:
+        await self._scope_service.get_project_scope(project_id)
+        return await self._graph_repository.get_graph(project_id)
+
+    async def compile_project(self, project_id: UUID, version: int) -> CompiledGraph:
+        return CompiledGraph.loads(await self.get_compiled_graph_data(project_id, version))
+
+    async def get_compiled_graph_data(self, project_id: UUID, version: int) -> bytes:
+        # the version was read by the ETag check, a project missing from the database has none
+        compiled_graph = project_cache.get(project_id, ProjectCacheKey.COMPILED_GRAPH, version)
+        if compiled_graph is not None:
+            return compiled_graph
+
+        return await read_flights.run(
+            (ProjectCacheKey.COMPILED_GRAPH, project_id, version),
+            lambda: self._load_compiled_graph_data(project_id, version),
+        )
+
+    async def _load_compiled_graph_data(self, project_id: UUID, version: int) -> bytes:
+        compiled_graph = (await self._graph_repository.get_compiled_graph(project_id)).dumps()
+
+        project_cache.put(
+            project_id,
+            ProjectCacheKey.COMPILED_GRAPH,
+            compiled_graph,
+            size=len(compiled_graph),
+            version=version,
+        )
+        return compiled_graph
@@ -0,0 +1,85 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, delete, literal, union_all, true, CompoundSelect
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.buttons.models import ButtonModel
+from src.graph.enums import GraphEdgeKind
+from src.graph.models import GroupEdgeModel
+from src.groups.models import GroupModel
+from src.inputs.models import InputModel
+
+EDGE_MODELS = (
+    (GraphEdgeKind.BUTTON, ButtonModel, ButtonModel.button_id),
+    (GraphEdgeKind.INPUT, InputModel, InputModel.input_id),
+)
+
+
+async def set_group_edge(
+        session: AsyncSession,
+        project_id: UUID,
+        kind: GraphEdgeKind,
+        ref_id: UUID,
+        src_group_id: UUID,
+        dst_group_id: UUID,
+):
+    statement = insert(GroupEdgeModel).values(
+        ref_id=ref_id,
+        kind=kind,
+        project_id=project_id,
+        src_group_id=src_group_id,
+        dst_group_id=dst_group_id,
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[GroupEdgeModel.ref_id],
+            set_={'dst_group_id': statement.excluded.dst_group_id},
+        )
+    )
+
+
+async def delete_group_edge(session: AsyncSession, ref_id: UUID):
+    await session.execute(
+        delete(GroupEdgeModel)
+        .where(GroupEdgeModel.ref_id == ref_id)
+    )
+
+
+def select_expected_edges(project_id: Optional[UUID] = None) -> CompoundSelect:
+    # the edges group_edges should hold, read from the buttons and inputs themselves
+    return union_all(*(
+        select(
+            ref_id_column.label('ref_id'),
+            literal(kind.name).label('kind'),
+            GroupModel.project_id,
+            model.group_id.label('src_group_id'),
+            model.destination_group_id.label('dst_group_id'),
+        )
+        .join(GroupModel, GroupModel.group_id == model.group_id)
+        .where(
+            true() if project_id is None else GroupModel.project_id == project_id,
+            model.destination_group_id.is_not(None),
+        )
+        for kind, model, ref_id_column in EDGE_MODELS
+    ))
+
+
+async def fill_group_edges(session: AsyncSession, project_id: UUID):
+    # for rows written without the repositories, like COPY imports and benchmark seeds
+    edges = select_expected_edges(project_id).subquery()
+    await session.execute(
+        insert(GroupEdgeModel)
+        .from_select(
+            ['ref_id', 'kind', 'project_id', 'src_group_id', 'dst_group_id'],
+            select(
+                edges.c.ref_id,
+                edges.c.kind.cast(GroupEdgeModel.kind.type),
+                edges.c.project_id,
+                edges.c.src_group_id,
+                edges.c.dst_group_id,
+            ),
+        )
+        .on_conflict_do_nothing(index_elements=[GroupEdgeModel.ref_id])
+    )
@@ -1,14 +1,22 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, status, Response, Query
 
 from src.groups.dependencies.services_dependencies import GroupServiceDI
+from src.groups.enums import NeighborhoodDirection
 from src.groups.exceptions.http_exceptions import GroupNotFoundHTTPException
 from src.groups.exceptions.services_exceptions import GroupNotFoundError
 from src.groups.schemas import GroupReadSchema, GroupCreateSchema
+from src.projects.dependencies.etag_dependencies import ProjectETagDI, ProjectVersionDI
 from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException
 from src.projects.exceptions.services_exceptions import ProjectNotFoundError
 
+NEIGHBORHOOD_DEFAULT_DEPTH = 1
+NEIGHBORHOOD_MAX_DEPTH = 10
+NEIGHBORHOOD_DEFAULT_LIMIT = 500
+NEIGHBORHOOD_MAX_LIMIT = 5000
+
 router = APIRouter(
     prefix='/projects/{project_id}/groups',
     tags=['Groups'],
@@ -41,11 +49,42 @@ async def create_group(
 async def get_groups(
         group_service: GroupServiceDI,
         project_id: UUID,
+        project_etag: ProjectETagDI,
+        project_version: ProjectVersionDI,
+):
+    try:
+        groups = await group_service.get_groups_json(project_id, project_version)
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+    return Response(content=groups, media_type='application/json', headers={'ETag': project_etag})
+
+
+@router.get(
+    '/{group_id}/neighborhood',
+    response_model=list[GroupReadSchema],
+)
+async def get_neighborhood(
+        group_service: GroupServiceDI,
+        project_id: UUID,
+        group_id: UUID,
+        project_etag: ProjectETagDI,
+        depth: Annotated[int, Query(ge=0, le=NEIGHBORHOOD_MAX_DEPTH)] = NEIGHBORHOOD_DEFAULT_DEPTH,
+        direction: NeighborhoodDirection = NeighborhoodDirection.BOTH,
+        limit: Annotated[int, Query(ge=1, le=NEIGHBORHOOD_MAX_LIMIT)] = NEIGHBORHOOD_DEFAULT_LIMIT,
 ):
     try:
-        return await group_service.get_groups(project_id)
+        groups = await group_service.get_neighborhood_json(
+            project_id=project_id,
+            group_id=group_id,
+            depth=depth,
+            direction=direction,
+            limit=limit,
+        )
     except ProjectNotFoundError:
         raise ProjectNotFoundHTTPException
+    except GroupNotFoundError:
+        raise GroupNotFoundHTTPException
+    return Response(content=groups, media_type='application/json', headers={'ETag': project_etag})
 
 
 @router.delete(
@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timezone, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.actions.enums import ActionType
+from src.actions.models import ActionModel
+from src.buttons.models import ButtonModel
+from src.core.db import async_session_maker
+from src.groups.models import GroupModel
+from src.groups.repositories import GroupRepository
+from src.groups.schemas import groups_adapter
+from src.inputs.enums import InputType
+from src.inputs.models import InputModel
+from src.ordering.utils import RANK_GAP
+from src.projects.models import ProjectModel
+
+# strings that JSON encoders tend to disagree on
+AWKWARD_TEXTS = (
+    'plain',
+    'quote " and backslash \\',
+    'new\nline\ttab\rreturn',
+    'controls \x01\x08\x0c\x1f\x7f',
+    'unicode é ß 漢字 🙂',
+    'separators    </script>',
+    '',
+)
+
+
+async def seed_awkward_project(session: AsyncSession) -> UUID:
+    project_id = uuid4()
+    created_at = datetime(2024, 2, 29, 23, 59, 59, tzinfo=timezone.utc)
+    group_ids = [uuid4() for _ in AWKWARD_TEXTS]
+    await session.execute(insert(ProjectModel), [{'project_id': project_id, 'name': 'check'}])
+    await session.execute(insert(GroupModel), [
+        {
+            'group_id': group_id,
+            'project_id': project_id,
+            'name': text,
+            # whole seconds, microseconds and a shared timestamp to exercise the tie-breaker
+            'created_at': created_at + timedelta(microseconds=i * 250_000 if i % 3 else 0),
+        }
+        for i, (group_id, text) in enumerate(zip(group_ids, AWKWARD_TEXTS))
+    ])
+    # the last group stays empty
+    await session.execute(insert(ButtonModel), [
+        {
+            'group_id': group_id,
+            'destination_group_id': group_ids[i + 1] if i % 2 else None,
+            'text': text[:64],
+            'payload': text[::-1][:64],
+            'sequence_number': (i + 1) * RANK_GAP,
+        }
+        for i, (group_id, text) in enumerate(zip(group_ids[:-1], AWKWARD_TEXTS))
+    ])
+    await session.execute(insert(InputModel), [
+        {
+            'group_id': group_id,
+            'destination_group_id': group_ids[0] if i % 2 else None,
+            'type': input_type,
+            'created_at': created_at,
+        }
+        for i, (group_id, input_type) in enumerate(zip(group_ids, InputType))
+    ])
+    await session.execute(insert(ActionModel), [
+        {
+            'group_id': group_id,
+            'type': action_type,
+            'payload': {'text': text} if action_type == ActionType.TEXT_MESSAGE else {'image_path': text},
+            'sequence_number': (j + 1) * RANK_GAP,
+        }
+        for group_id, text in zip(group_ids[:-1], AWKWARD_TEXTS)
+        for j, action_type in enumerate(ActionType)
+    ])
+    return project_id
+
+
+async def compare_project(repository: GroupRepository, project_id: UUID) -> bool:
+    expected = groups_adapter.dump_json(await repository.get_groups(project_id))
+    rendered = await repository.get_groups_json(project_id)
+    if expected == rendered:
+        return True
+
+    offset = next(
+        (i for i, (left, right) in enumerate(zip(expected, rendered)) if left != right),
+        min(len(expected), len(rendered)),
+    )
+    print(f'project {project_id} differs at byte {offset}:')
+    print(f'  python:   {expected[max(0, offset - 60):offset + 60]!r}')
+    print(f'  postgres: {rendered[max(0, offset - 60):offset + 60]!r}')
+    return False
+
+
+async def run_check(all_projects: bool) -> bool:
+    async with async_session_maker() as session:
+        repository = GroupRepository(session)
+        if all_projects:
+            project_ids = (await session.scalars(select(ProjectModel.project_id))).all()
+        else:
+            # seeded inside a transaction that is rolled back
+            project_ids = [await seed_awkward_project(session)]
+
+        identical = 0
+        for project_id in project_ids:
+            identical += await compare_project(repository, project_id)
+        await session.rollback()
+
+    print(f'{identical} of {len(project_ids)} projects render identically')
+    return identical == len(project_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the Postgres rendered groups listing with the pydantic one')
+    parser.add_argument('--all-projects', action='store_true', help='check every stored project instead of a seeded one')
+    args = parser.parse_args()
+
+    if not asyncio.run(run_check(all_projects=args.all_projects)):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class NeighborhoodDirection(StrEnum):
+    OUT = 'out'
+    IN = 'in'
+    BOTH = 'both'
@@ -1,10 +1,11 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, func, String, ForeignKey
+from sqlalchemy import DateTime, func, String, ForeignKey, BigInteger, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.db import Base
+from src.core.utils import uuid7, utc_now
 
 
 class GroupModel(Base):
@@ -12,14 +13,22 @@ class GroupModel(Base):
 
     group_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=func.gen_random_uuid(),
     )
     name: Mapped[str] = mapped_column(String(256))
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utc_now,
         server_default=func.now(),
     )
 
+    # child counters, buttons and actions take their ranks from here, see src.ordering
+    buttons_count: Mapped[int] = mapped_column(default=0, server_default='0')
+    last_button_rank: Mapped[int] = mapped_column(BigInteger, default=0, server_default='0')
+    actions_count: Mapped[int] = mapped_column(default=0, server_default='0')
+    last_action_rank: Mapped[int] = mapped_column(BigInteger, default=0, server_default='0')
+
     project_id: Mapped[UUID] = mapped_column(ForeignKey('projects.project_id', ondelete='CASCADE'))
     project: Mapped['ProjectModel'] = relationship(back_populates='groups')
 
@@ -47,3 +56,8 @@ class GroupModel(Base):
         back_populates='destination_group',
         foreign_keys='ButtonModel.destination_group_id',
     )
+
+    __table_args__ = (
+        # project lookups, the groups listing order and ON DELETE CASCADE from projects
+        Index('ix_groups_project_id_created_at', 'project_id', 'created_at', 'group_id'),
+    )
@@ -1,13 +1,44 @@
-from typing import Optional
+from typing import Optional, Type
 from uuid import UUID
 
-from sqlalchemy import select, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    select,
+    delete,
+    func,
+    case,
+    cast,
+    literal,
+    true,
+    any_,
+    union_all,
+    bindparam,
+    Text,
+    Uuid,
+    Select,
+    Subquery,
+    ColumnElement,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 
+from src.actions.enums import ActionType
 from src.actions.models import ActionModel
+from src.actions.utils import get_action_fields, get_action_schema_by_type
+from src.analysis.reachability import GroupAdded, GroupDeleted
+from src.analysis.utils import record_graph_change
+from src.buttons.models import ButtonModel
+from src.buttons.schemas import ButtonReadSchema
+from src.graph.models import GroupEdgeModel
+from src.groups.enums import NeighborhoodDirection
 from src.groups.models import GroupModel
-from src.groups.schemas import GroupCreateSchema, GroupReadSchema
+from src.groups.schemas import GroupCreateSchema, GroupReadSchema, groups_adapter
+from src.core.db import get_row_dicts
 from src.core.dependencies.db_dependencies import AsyncSessionDI
+from src.core.sql_json import json_value, json_datetime, json_enum, json_object, json_array
+from src.inputs.enums import InputType
+from src.inputs.models import InputModel
+from src.inputs.schemas import InputReadSchema
+from src.ordering.utils import OrderedModel
+from src.projects.utils import bump_project_version
 
 
 class GroupRepository:
@@ -16,52 +47,297 @@ class GroupRepository:
 
     # TODO: add limit for groups
     async def create_group(self, project_id: UUID, group: GroupCreateSchema) -> GroupReadSchema:
+        await bump_project_version(self._session, project_id)
         group = GroupModel(
             **group.model_dump(),
             project_id=project_id,
         )
         self._session.add(group)
-        await self._session.commit()
-        await self._session.refresh(group)
+        await self._session.flush()
+        record_graph_change(self._session, project_id, GroupAdded(group_id=group.group_id))
 
-        return GroupReadSchema.model_validate(group)
+        return GroupReadSchema(
+            group_id=group.group_id,
+            name=group.name,
+            created_at=group.created_at,
+            inputs=[],
+            buttons=[],
+            actions=[],
+        )
 
     async def get_groups(self, project_id: UUID) -> list[GroupReadSchema]:
+        return await self._get_groups(GroupModel.project_id == project_id)
+
+    async def get_group_by_id(self, group_id: UUID) -> Optional[GroupReadSchema]:
+        groups = await self._get_groups(GroupModel.group_id == group_id)
+        if not groups:
+            return
+        return groups[0]
+
+    async def get_neighborhood(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            depth: int,
+            direction: NeighborhoodDirection,
+            limit: int,
+    ) -> list[GroupReadSchema]:
+        group_ids = await self._session.scalars(self._select_neighborhood(group_id, depth, direction, limit))
+        # one array parameter keeps a single prepared statement for any neighborhood size
+        return await self._get_groups(
+            (GroupModel.project_id == project_id)
+            & (GroupModel.group_id == any_(bindparam('group_ids', group_ids.all(), type_=ARRAY(Uuid))))
+        )
+
+    @staticmethod
+    def _select_neighborhood(group_id: UUID, depth: int, direction: NeighborhoodDirection, limit: int) -> Select:
+        neighborhood = (
+            select(literal(group_id, Uuid).label('group_id'), literal(0).label('depth'))
+            .cte('neighborhood', recursive=True)
+        )
+
+        # the neighbors of each group are looked up through the forward and reverse edge indexes,
+        # a join against all edges would let the planner read the whole table
+        neighbor_queries = []
+        if direction != NeighborhoodDirection.IN:
+            neighbor_queries.append(
+                select(GroupEdgeModel.dst_group_id.label('group_id'))
+                .where(GroupEdgeModel.src_group_id == neighborhood.c.group_id)
+            )
+        if direction != NeighborhoodDirection.OUT:
+            neighbor_queries.append(
+                select(GroupEdgeModel.src_group_id.label('group_id'))
+                .where(GroupEdgeModel.dst_group_id == neighborhood.c.group_id)
+            )
+        neighbors = union_all(*neighbor_queries).lateral('neighbors')
+
+        # UNION drops a group reached again at the same depth, the depth bounds the rest
+        neighborhood = neighborhood.union(
+            select(neighbors.c.group_id, neighborhood.c.depth + 1)
+            .select_from(neighborhood)
+            .join(neighbors, true())
+            .where(neighborhood.c.depth < depth)
+        )
+        # groups leading to a hub, like a main menu, can make the neighborhood most of the project,
+        # the closest groups are kept
+        return (
+            select(neighborhood.c.group_id)
+            .group_by(neighborhood.c.group_id)
+            .order_by(func.min(neighborhood.c.depth), neighborhood.c.group_id)
+            .limit(limit)
+        )
+
+    async def _get_groups(self, where_clause) -> list[GroupReadSchema]:
+        # plain rows are assembled into one list and validated in a single adapter call,
+        # loading ORM objects and validating them one by one costs several times more
         groups = await self._session.execute(
-            select(GroupModel)
-            .options(
-                selectinload(GroupModel.buttons),
-                selectinload(GroupModel.inputs),
-                selectinload(GroupModel.actions)
-                .selectin_polymorphic(ActionModel.__subclasses__()),
+            select(GroupModel.group_id, GroupModel.name, GroupModel.created_at)
+            .where(where_clause)
+            .order_by(GroupModel.created_at, GroupModel.group_id)
+        )
+        groups = {
+            group['group_id']: {**group, 'inputs': [], 'buttons': [], 'actions': []}
+            for group in get_row_dicts(groups)
+        }
+        if not groups:
+            return []
+
+        for key, query in (
+            ('inputs', self._select_inputs(where_clause)),
+            ('buttons', self._select_buttons(where_clause)),
+            ('actions', self._select_actions(where_clause)),
+        ):
+            rows = await self._session.execute(query)
+            for row in get_row_dicts(rows):
+                # rows of a group committed after the groups were read are left out
+                group = groups.get(row['group_id'])
+                if group is None:
+                    continue
+                if key != 'inputs':
+                    # rows come ordered by rank, the schemas number them 1..n within the group
+                    row['sequence_number'] = len(group[key]) + 1
+                group[key].append(row)
+
+        for group in groups.values():
+            group['actions'] = [get_action_fields(action) for action in group['actions']]
+        return groups_adapter.validate_python(list(groups.values()))
+
+    async def get_groups_json(self, project_id: UUID) -> bytes:
+        # the same document get_groups gives after dump_json, rendered by Postgres
+        inputs = self._select_inputs_json(project_id)
+        buttons = self._select_buttons_json(project_id)
+        actions = self._select_actions_json(project_id)
+        groups = await self._session.scalar(
+            select(
+                json_array(
+                    json_object(GroupReadSchema, {
+                        'group_id': json_value(GroupModel.group_id),
+                        'name': json_value(GroupModel.name),
+                        'created_at': json_datetime(GroupModel.created_at),
+                        'inputs': func.coalesce(inputs.c.items_json, '[]'),
+                        'buttons': func.coalesce(buttons.c.items_json, '[]'),
+                        'actions': func.coalesce(actions.c.items_json, '[]'),
+                    }),
+                    GroupModel.created_at,
+                    GroupModel.group_id,
+                )
             )
+            .select_from(GroupModel)
+            .outerjoin(inputs, inputs.c.group_id == GroupModel.group_id)
+            .outerjoin(buttons, buttons.c.group_id == GroupModel.group_id)
+            .outerjoin(actions, actions.c.group_id == GroupModel.group_id)
             .where(GroupModel.project_id == project_id)
-            .order_by(GroupModel.created_at)
         )
-        return [
-            GroupReadSchema.model_validate(group)
-            for group in groups.scalars().all()
-        ]
+        return groups.encode()
 
-    async def get_group_by_id(self, group_id: UUID) -> Optional[GroupReadSchema]:
-        group = await self._session.execute(
-            select(GroupModel)
-            .options(
-                selectinload(GroupModel.buttons),
-                selectinload(GroupModel.inputs),
-                selectinload(GroupModel.actions)
-                .selectin_polymorphic(ActionModel.__subclasses__()),
+    @staticmethod
+    def _select_inputs_json(project_id: UUID) -> Subquery:
+        return (
+            select(
+                InputModel.group_id,
+                json_array(
+                    json_object(InputReadSchema, {
+                        'input_id': json_value(InputModel.input_id),
+                        'type': json_enum(InputModel.type, InputType),
+                        'destination_group_id': json_value(InputModel.destination_group_id),
+                        'created_at': json_datetime(InputModel.created_at),
+                    }),
+                    InputModel.created_at,
+                    InputModel.input_id,
+                ).label('items_json'),
             )
-            .where(GroupModel.group_id == group_id)
+            .join(GroupModel, GroupModel.group_id == InputModel.group_id)
+            .where(GroupModel.project_id == project_id)
+            .group_by(InputModel.group_id)
+            .subquery()
+        )
+
+    @staticmethod
+    def _select_positioned(model: Type[OrderedModel], project_id: UUID) -> Subquery:
+        # the schemas number buttons and actions 1..n within the group, a window function
+        # cannot run inside the aggregate, so the positions are counted in a subquery
+        return (
+            select(
+                model,
+                func.row_number().over(partition_by=model.group_id, order_by=model.sequence_number).label('position'),
+            )
+            .join(GroupModel, GroupModel.group_id == model.group_id)
+            .where(GroupModel.project_id == project_id)
+            .subquery()
+        )
+
+    @classmethod
+    def _select_buttons_json(cls, project_id: UUID) -> Subquery:
+        buttons = cls._select_positioned(ButtonModel, project_id)
+        return (
+            select(
+                buttons.c.group_id,
+                json_array(
+                    json_object(ButtonReadSchema, {
+                        'button_id': json_value(buttons.c.button_id),
+                        'text': json_value(buttons.c.text),
+                        'payload': json_value(buttons.c.payload),
+                        'sequence_number': json_value(buttons.c.position),
+                        'destination_group_id': json_value(buttons.c.destination_group_id),
+                        'created_at': json_datetime(buttons.c.created_at),
+                    }),
+                    buttons.c.sequence_number,
+                ).label('items_json'),
+            )
+            .group_by(buttons.c.group_id)
+            .subquery()
+        )
+
+    @classmethod
+    def _select_actions_json(cls, project_id: UUID) -> Subquery:
+        actions = cls._select_positioned(ActionModel, project_id)
+        return (
+            select(
+                actions.c.group_id,
+                json_array(
+                    case(*(
+                        (
+                            actions.c.type == action_type,
+                            json_object(
+                                get_action_schema_by_type(action_type),
+                                cls._get_action_json_values(actions, action_type),
+                            ),
+                        )
+                        for action_type in ActionType
+                    )),
+                    actions.c.sequence_number,
+                ).label('items_json'),
+            )
+            .group_by(actions.c.group_id)
+            .subquery()
+        )
+
+    @staticmethod
+    def _get_action_json_values(actions: Subquery, action_type: ActionType) -> dict[str, ColumnElement]:
+        values = {
+            'action_id': json_value(actions.c.action_id),
+            'sequence_number': json_value(actions.c.position),
+            'created_at': json_datetime(actions.c.created_at),
+            'type': json_enum(actions.c.type, ActionType),
+        }
+        # the other fields of an action schema are kept in the payload
+        for field in get_action_schema_by_type(action_type).model_fields:
+            values.setdefault(field, func.coalesce(cast(actions.c.payload[field], Text), 'null'))
+        return values
+
+    @staticmethod
+    def _select_inputs(where_clause) -> Select:
+        return (
+            select(
+                InputModel.group_id,
+                InputModel.input_id,
+                InputModel.type,
+                InputModel.destination_group_id,
+                InputModel.created_at,
+            )
+            .join(GroupModel, GroupModel.group_id == InputModel.group_id)
+            .where(where_clause)
+            .order_by(InputModel.group_id, InputModel.created_at, InputModel.input_id)
+        )
+
+    @staticmethod
+    def _select_buttons(where_clause) -> Select:
+        return (
+            select(
+                ButtonModel.group_id,
+                ButtonModel.button_id,
+                ButtonModel.text,
+                ButtonModel.payload,
+                ButtonModel.sequence_number,
+                ButtonModel.destination_group_id,
+                ButtonModel.created_at,
+            )
+            .join(GroupModel, GroupModel.group_id == ButtonModel.group_id)
+            .where(where_clause)
+            .order_by(ButtonModel.group_id, ButtonModel.sequence_number)
+        )
+
+    @staticmethod
+    def _select_actions(where_clause) -> Select:
+        return (
+            select(
+                ActionModel.group_id,
+                ActionModel.action_id,
+                ActionModel.type,
+                ActionModel.payload,
+                ActionModel.sequence_number,
+                ActionModel.created_at,
+            )
+            .join(GroupModel, GroupModel.group_id == ActionModel.group_id)
+            .where(where_clause)
+            .order_by(ActionModel.group_id, ActionModel.sequence_number)
         )
-        group = group.scalar()
-        if group is None:
-            return
-        return GroupReadSchema.model_validate(group)
 
-    async def delete_group(self, group_id: UUID):
+    async def delete_group(self, project_id: UUID, group_id: UUID):
+        await bump_project_version(self._session, project_id)
         await self._session.execute(
             delete(GroupModel)
             .where(GroupModel.group_id == group_id)
         )
-        await self._session.commit()
+        await self._session.flush()
+        record_graph_change(self._session, project_id, GroupDeleted(group_id=group_id))
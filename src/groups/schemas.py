@@ -1,10 +1,9 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter
 
 from src.actions.schemas import UnionActionReadSchema
-from src.actions.utils import validate_action_from_db, UnionActionModel
 from src.buttons.schemas import ButtonReadSchema
 from src.inputs.schemas import InputReadSchema
 
@@ -18,11 +17,6 @@ class GroupReadSchema(BaseModel):
     buttons: list[ButtonReadSchema]
     actions: list[UnionActionReadSchema]
 
-    @field_validator('actions')
-    @classmethod
-    def transform_actions(cls, actions: list[UnionActionModel]):
-        return [validate_action_from_db(action) for action in actions]
-
     model_config = {
         'from_attributes': True,
     }
@@ -30,3 +24,6 @@ class GroupReadSchema(BaseModel):
 
 class GroupCreateSchema(BaseModel):
     name: str = Field(max_length=256)
+
+
+groups_adapter = TypeAdapter(list[GroupReadSchema])
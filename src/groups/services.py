@@ -1,44 +1,66 @@
 from uuid import UUID
 
+from src.core import settings
+from src.core.cache import project_cache, ProjectCacheKey
+from src.core.single_flight import read_flights
 from src.groups.dependencies.repositories_dependencies import GroupRepositoryDI
-from src.groups.exceptions.services_exceptions import GroupNotFoundError
-from src.groups.schemas import GroupCreateSchema, GroupReadSchema
-from src.projects.dependencies.repositories_dependencies import ProjectRepositoryDI
-from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+from src.groups.enums import NeighborhoodDirection
+from src.groups.schemas import GroupCreateSchema, GroupReadSchema, groups_adapter
+from src.scopes.dependencies.services_dependencies import ScopeServiceDI
 
 
 class GroupService:
     def __init__(
             self,
             group_repository: GroupRepositoryDI,
-            project_repository: ProjectRepositoryDI,
+            scope_service: ScopeServiceDI,
     ):
         self._group_repository = group_repository
-        self._project_repository = project_repository
+        self._scope_service = scope_service
 
     async def create_group(self, project_id: UUID, group: GroupCreateSchema) -> GroupReadSchema:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
+        await self._scope_service.get_project_scope(project_id)
 
         return await self._group_repository.create_group(
             project_id=project_id,
             group=group,
         )
 
-    async def get_groups(self, project_id: UUID) -> list[GroupReadSchema]:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-        return await self._group_repository.get_groups(project_id)
+    async def get_groups_json(self, project_id: UUID, version: int) -> bytes:
+        # the version was read by the ETag check, a project missing from the database has none
+        groups = project_cache.get(project_id, ProjectCacheKey.GROUPS, version)
+        if groups is not None:
+            return groups
 
-    async def delete_group(self, project_id: UUID, group_id: UUID):
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
+        # concurrent misses for the same project version share one query and one rendering
+        return await read_flights.run(
+            (ProjectCacheKey.GROUPS, project_id, version),
+            lambda: self._load_groups_json(project_id, version),
+        )
+
+    async def _load_groups_json(self, project_id: UUID, version: int) -> bytes:
+        if settings.GROUPS_SQL_JSON:
+            groups = await self._group_repository.get_groups_json(project_id)
+        else:
+            groups = groups_adapter.dump_json(await self._group_repository.get_groups(project_id))
+
+        project_cache.put(project_id, ProjectCacheKey.GROUPS, groups, size=len(groups), version=version)
+        return groups
 
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+    async def get_neighborhood_json(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            depth: int,
+            direction: NeighborhoodDirection,
+            limit: int,
+    ) -> bytes:
+        await self._scope_service.get_group_scope(project_id, group_id)
+        groups = await self._group_repository.get_neighborhood(project_id, group_id, depth, direction, limit)
+        return groups_adapter.dump_json(groups)
+
+    async def delete_group(self, project_id: UUID, group_id: UUID):
+        await self._scope_service.get_group_scope(project_id, group_id)
 
-        await self._group_repository.delete_group(group_id)
+        await self._group_repository.delete_group(project_id, group_id)
+        self._scope_service.forget_group_scope(project_id, group_id)
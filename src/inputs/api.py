@@ -1,7 +1,7 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, status, Body
+from fastapi import APIRouter, status, Body, Depends
 
 from src.groups.exceptions.http_exceptions import GroupNotFoundHTTPException
 from src.groups.exceptions.services_exceptions import GroupNotFoundError
@@ -9,6 +9,7 @@ from src.inputs.dependencies.services_dependencies import InputServiceDI
 from src.inputs.exceptions.http_exceptions import InputNotFoundHTTPException, InputTypeConflictHTTPException
 from src.inputs.exceptions.services_exceptions import InputNotFoundError, InputTypeConflictError
 from src.inputs.schemas import InputReadSchema, InputCreateSchema
+from src.projects.dependencies.etag_dependencies import check_project_etag
 from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException
 from src.projects.exceptions.services_exceptions import ProjectNotFoundError
 
@@ -48,6 +49,7 @@ async def create_input(
 @router.get(
     '',
     response_model=list[InputReadSchema],
+    dependencies=[Depends(check_project_etag)],
 )
 async def get_inputs(
         input_service: InputServiceDI,
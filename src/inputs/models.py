@@ -1,11 +1,12 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, ForeignKey, Enum, DateTime, UniqueConstraint
+from sqlalchemy import func, ForeignKey, Enum, DateTime, UniqueConstraint, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.inputs.enums import InputType
 from src.core.db import Base
+from src.core.utils import uuid7, utc_now
 
 
 class InputModel(Base):
@@ -13,6 +14,7 @@ class InputModel(Base):
 
     input_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=func.gen_random_uuid(),
     )
     type: Mapped[InputType] = mapped_column(
@@ -22,6 +24,7 @@ class InputModel(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utc_now,
         server_default=func.now(),
     )
 
@@ -42,4 +45,10 @@ class InputModel(Base):
 
     __table_args__ = (
         UniqueConstraint('group_id', 'type'),
+        # ON DELETE SET NULL when a destination group is deleted
+        Index(
+            'ix_inputs_destination_group_id',
+            'destination_group_id',
+            postgresql_where=text('destination_group_id IS NOT NULL'),
+        ),
     )
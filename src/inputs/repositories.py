@@ -4,9 +4,15 @@ from uuid import UUID
 from sqlalchemy import select, delete
 from sqlalchemy.exc import IntegrityError
 
+from src.analysis.reachability import EdgeSet, EdgeDeleted
+from src.analysis.utils import record_graph_change
+from src.core.db import get_row_dicts
 from src.core.dependencies.db_dependencies import AsyncSessionDI
+from src.graph.enums import GraphEdgeKind
+from src.graph.utils import set_group_edge, delete_group_edge
 from src.inputs.models import InputModel
-from src.inputs.schemas import InputCreateSchema, InputReadSchema
+from src.inputs.schemas import InputCreateSchema, InputReadSchema, inputs_adapter
+from src.projects.utils import bump_project_version
 
 
 class InputRepository:
@@ -23,25 +29,39 @@ class InputRepository:
             return
         return input_field
 
-    async def create_input(self, group_id: UUID, input_field: InputCreateSchema) -> Optional[InputReadSchema]:
+    async def create_input(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            input_field: InputCreateSchema,
+    ) -> Optional[InputReadSchema]:
+        await bump_project_version(self._session, project_id)
         input_field = InputModel(**input_field.model_dump(), group_id=group_id)
         self._session.add(input_field)
         try:
-            await self._session.commit()
+            await self._session.flush()
         except IntegrityError:
             return
+        record_graph_change(self._session, project_id, EdgeSet(
+            edge_id=input_field.input_id,
+            kind=GraphEdgeKind.INPUT,
+            source_group_id=group_id,
+            destination_group_id=None,
+        ))
         return InputReadSchema.model_validate(input_field)
 
     async def get_inputs(self, group_id: UUID) -> list[InputReadSchema]:
         input_fields = await self._session.execute(
-            select(InputModel)
+            select(
+                InputModel.input_id,
+                InputModel.type,
+                InputModel.destination_group_id,
+                InputModel.created_at,
+            )
             .where(InputModel.group_id == group_id)
             .order_by(InputModel.created_at)
         )
-        return [
-            InputReadSchema.model_validate(input_field)
-            for input_field in input_fields.scalars().all()
-        ]
+        return inputs_adapter.validate_python(get_row_dicts(input_fields))
 
     async def get_input_by_id(self, input_id: UUID) -> Optional[InputReadSchema]:
         input_field = await self._get_input_model_instance(input_id)
@@ -49,15 +69,19 @@ class InputRepository:
             return
         return InputReadSchema.model_validate(input_field)
 
-    async def delete_input(self, input_id: UUID):
+    async def delete_input(self, project_id: UUID, input_id: UUID):
+        await bump_project_version(self._session, project_id)
         await self._session.execute(
             delete(InputModel)
             .where(InputModel.input_id == input_id)
         )
-        await self._session.commit()
+        await delete_group_edge(self._session, input_id)
+        await self._session.flush()
+        record_graph_change(self._session, project_id, EdgeDeleted(edge_id=input_id))
 
     async def set_input_destination_group(
             self,
+            project_id: UUID,
             input_id: UUID,
             destination_group_id: UUID,
     ) -> Optional[InputReadSchema]:
@@ -65,7 +89,22 @@ class InputRepository:
         if input_field is None:
             return
 
+        await bump_project_version(self._session, project_id)
         input_field.destination_group_id = destination_group_id
-        await self._session.commit()
+        await self._session.flush()
+        await set_group_edge(
+            self._session,
+            project_id=project_id,
+            kind=GraphEdgeKind.INPUT,
+            ref_id=input_id,
+            src_group_id=input_field.group_id,
+            dst_group_id=destination_group_id,
+        )
+        record_graph_change(self._session, project_id, EdgeSet(
+            edge_id=input_id,
+            kind=GraphEdgeKind.INPUT,
+            source_group_id=input_field.group_id,
+            destination_group_id=destination_group_id,
+        ))
 
         return InputReadSchema.model_validate(input_field)
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from src.inputs.enums import InputType
 
@@ -20,3 +20,6 @@ class InputReadSchema(BaseModel):
 
 class InputCreateSchema(BaseModel):
     type: InputType
+
+
+inputs_adapter = TypeAdapter(list[InputReadSchema])
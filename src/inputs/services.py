@@ -1,24 +1,19 @@
 from uuid import UUID
 
-from src.groups.dependencies.repositories_dependencies import GroupRepositoryDI
-from src.groups.exceptions.services_exceptions import GroupNotFoundError
 from src.inputs.dependencies.repositories_dependencies import InputRepositoryDI
-from src.inputs.exceptions.services_exceptions import InputNotFoundError, InputTypeConflictError
+from src.inputs.exceptions.services_exceptions import InputTypeConflictError
 from src.inputs.schemas import InputReadSchema, InputCreateSchema
-from src.projects.dependencies.repositories_dependencies import ProjectRepositoryDI
-from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+from src.scopes.dependencies.services_dependencies import ScopeServiceDI
 
 
 class InputService:
     def __init__(
             self,
             input_repository: InputRepositoryDI,
-            project_repository: ProjectRepositoryDI,
-            group_repository: GroupRepositoryDI,
+            scope_service: ScopeServiceDI,
     ):
         self._input_repository = input_repository
-        self._project_repository = project_repository
-        self._group_repository = group_repository
+        self._scope_service = scope_service
 
     async def create_input(
             self,
@@ -26,15 +21,10 @@ class InputService:
             group_id: UUID,
             input_field: InputCreateSchema,
     ) -> InputReadSchema:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_group_scope(project_id, group_id)
 
         input_field = await self._input_repository.create_input(
+            project_id=project_id,
             group_id=group_id,
             input_field=input_field,
         )
@@ -43,30 +33,14 @@ class InputService:
         return input_field
 
     async def get_inputs(self, project_id: UUID, group_id: UUID) -> list[InputReadSchema]:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_group_scope(project_id, group_id)
 
         return await self._input_repository.get_inputs(group_id)
 
     async def delete_input(self, project_id: UUID, group_id: UUID, input_id: UUID):
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        await self._scope_service.get_input_scope(project_id, group_id, input_id)
 
-        input_field = await self._input_repository.get_input_by_id(input_id)
-        if input_field is None:
-            raise InputNotFoundError
-
-        await self._input_repository.delete_input(input_id)
+        await self._input_repository.delete_input(project_id, input_id)
 
     async def set_input_destination_group(
             self,
@@ -75,24 +49,15 @@ class InputService:
             input_id: UUID,
             destination_group_id: UUID,
     ) -> InputReadSchema:
-        project = await self._project_repository.get_project_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError
-
-        group = await self._group_repository.get_group_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
-
-        # TODO: specify group id in errors
-        destination_group = await self._group_repository.get_group_by_id(destination_group_id)
-        if destination_group is None:
-            raise GroupNotFoundError
-
-        button = await self._input_repository.get_input_by_id(input_id)
-        if button is None:
-            raise InputNotFoundError
+        await self._scope_service.get_input_scope(
+            project_id=project_id,
+            group_id=group_id,
+            input_id=input_id,
+            destination_group_id=destination_group_id,
+        )
 
         return await self._input_repository.set_input_destination_group(
+            project_id=project_id,
             input_id=input_id,
             destination_group_id=destination_group_id,
         )
@@ -1,12 +1,16 @@
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.core import settings
+from src.core.replica import CONSISTENCY_TOKEN_HEADER, set_consistency_token
 from src.core.router import get_app_router
+from src.projects.api import NEXT_CURSOR_HEADER
 
-app = FastAPI(title='Chatbot Builder PoC')
+app = FastAPI(title='Chatbot Builder PoC', default_response_class=ORJSONResponse)
 app.include_router(get_app_router())
+app.middleware('http')(set_consistency_token)
 
 origins = [
     settings.CLIENT_APP_URL,
@@ -18,6 +22,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=['*'],
     allow_headers=['*'],
+    expose_headers=[CONSISTENCY_TOKEN_HEADER, NEXT_CURSOR_HEADER],
 )
 
 if __name__ == '__main__':
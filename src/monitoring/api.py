@@ -0,0 +1,39 @@
+from fastapi import APIRouter
+
+from src.monitoring.dependencies.services_dependencies import MonitoringServiceDI
+from src.monitoring.schemas import CacheStatsSchema, PoolStatsSchema, SingleFlightStatsSchema
+
+router = APIRouter(
+    prefix='/monitoring',
+    tags=['Monitoring'],
+)
+
+
+@router.get(
+    '/cache',
+    response_model=CacheStatsSchema,
+)
+async def get_cache_stats(
+        monitoring_service: MonitoringServiceDI,
+):
+    return await monitoring_service.get_cache_stats()
+
+
+@router.get(
+    '/db-pools',
+    response_model=dict[str, PoolStatsSchema],
+)
+async def get_pool_stats(
+        monitoring_service: MonitoringServiceDI,
+):
+    return await monitoring_service.get_pool_stats()
+
+
+@router.get(
+    '/single-flight',
+    response_model=SingleFlightStatsSchema,
+)
+async def get_single_flight_stats(
+        monitoring_service: MonitoringServiceDI,
+):
+    return await monitoring_service.get_single_flight_stats()
@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.monitoring.services import MonitoringService
+
+MonitoringServiceDI = Annotated[MonitoringService, Depends(MonitoringService)]
@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+
+
+class CacheStatsSchema(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    stale: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class PoolStatsSchema(BaseModel):
+    size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    # checked out connections relative to everything the pool may open
+    saturation: float
+    checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    # checkouts per upper wait bound in seconds
+    wait_histogram: dict[str, int]
+
+
+class SingleFlightStatsSchema(BaseModel):
+    loads: int
+    # callers that got the result of a load already in flight instead of running their own
+    coalesced: int
+    in_flight: int
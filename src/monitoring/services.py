@@ -0,0 +1,55 @@
+from src.core.cache import project_cache
+from src.core.db import engine
+from src.core.pool import MeasuredQueuePool, CHECKOUT_WAIT_BUCKETS
+from src.core.replica import replica_engine
+from src.core.single_flight import read_flights
+from src.monitoring.schemas import CacheStatsSchema, PoolStatsSchema, SingleFlightStatsSchema
+
+
+class MonitoringService:
+    async def get_cache_stats(self) -> CacheStatsSchema:
+        stats = project_cache.stats
+        return CacheStatsSchema(
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+            invalidations=stats.invalidations,
+            stale=stats.stale,
+            entries=len(project_cache),
+            size_bytes=project_cache.size,
+            max_bytes=project_cache.max_bytes,
+        )
+
+    async def get_single_flight_stats(self) -> SingleFlightStatsSchema:
+        return SingleFlightStatsSchema(
+            loads=read_flights.stats.loads,
+            coalesced=read_flights.stats.coalesced,
+            in_flight=len(read_flights),
+        )
+
+    async def get_pool_stats(self) -> dict[str, PoolStatsSchema]:
+        pools = {'primary': engine.sync_engine.pool}
+        if replica_engine is not None:
+            pools['replica'] = replica_engine.sync_engine.pool
+        return {name: self._get_pool_stats(pool) for name, pool in pools.items()}
+
+    @staticmethod
+    def _get_pool_stats(pool: MeasuredQueuePool) -> PoolStatsSchema:
+        # an unlimited overflow (-1) leaves the pool size as the only bound
+        max_connections = pool.size() + max(pool.max_overflow, 0)
+        return PoolStatsSchema(
+            size=pool.size(),
+            max_overflow=pool.max_overflow,
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+            saturation=pool.checkedout() / max_connections,
+            checkouts=pool.stats.checkouts,
+            timeouts=pool.stats.timeouts,
+            wait_seconds_total=pool.stats.wait_seconds_total,
+            wait_seconds_max=pool.stats.wait_seconds_max,
+            wait_histogram=dict(zip(
+                [str(bound) for bound in CHECKOUT_WAIT_BUCKETS] + ['+Inf'],
+                pool.stats.wait_histogram,
+            )),
+        )
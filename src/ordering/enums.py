@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class MovePosition(StrEnum):
+    BEFORE = 'before'
+    AFTER = 'after'
@@ -0,0 +1,9 @@
+from fastapi import HTTPException, status
+
+
+class InvalidMoveHTTPException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Item cannot be moved relative to itself',
+        )
@@ -0,0 +1,64 @@
+import argparse
+import asyncio
+from typing import Type
+
+from sqlalchemy import select, func
+
+from src.actions.models import ActionModel
+from src.buttons.models import ButtonModel
+from src.core.db import async_session_maker
+from src.groups.models import GroupModel
+from src.inputs.models import InputModel  # noqa: F401, the group mapper needs every related model
+from src.ordering.utils import OrderedModel, RANK_GAP, rebalance_ranks
+from src.projects.utils import bump_project_version
+
+
+async def rebalance_crowded_groups(model: Type[OrderedModel], min_gap: int) -> int:
+    async with async_session_maker() as session:
+        gaps = (
+            select(
+                model.group_id,
+                (
+                    model.sequence_number
+                    - func.lag(model.sequence_number, 1, 0).over(
+                        partition_by=model.group_id,
+                        order_by=model.sequence_number,
+                    )
+                ).label('gap'),
+            )
+            .subquery()
+        )
+        crowded_groups = await session.execute(
+            select(GroupModel.project_id, GroupModel.group_id)
+            .join(gaps, gaps.c.group_id == GroupModel.group_id)
+            .group_by(GroupModel.project_id, GroupModel.group_id)
+            .having(func.min(gaps.c.gap) < min_gap)
+        )
+        crowded_groups = crowded_groups.all()
+
+        for project_id, group_id in crowded_groups:
+            await bump_project_version(session, project_id)
+            await rebalance_ranks(session, model, group_id)
+            await session.commit()
+
+    return len(crowded_groups)
+
+
+async def run_rebalance(min_gap: int) -> dict[str, int]:
+    return {
+        'buttons': await rebalance_crowded_groups(ButtonModel, min_gap),
+        'actions': await rebalance_crowded_groups(ActionModel, min_gap),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Respread button and action ranks in groups with exhausted gaps')
+    parser.add_argument('--min-gap', type=int, default=RANK_GAP // 2 ** 8)
+    args = parser.parse_args()
+
+    result = asyncio.run(run_rebalance(min_gap=args.min_gap))
+    print('rebalanced {buttons} button groups and {actions} action groups'.format(**result))
+
+
+if __name__ == '__main__':
+    main()
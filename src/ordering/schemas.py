@@ -0,0 +1,10 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.ordering.enums import MovePosition
+
+
+class MoveSchema(BaseModel):
+    anchor_id: UUID
+    position: MovePosition
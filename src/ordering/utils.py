@@ -0,0 +1,178 @@
+from typing import Optional, Type, Union
+from uuid import UUID
+
+from sqlalchemy import select, func, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.actions.models import ActionModel
+from src.buttons.models import ButtonModel
+from src.groups.models import GroupModel
+from src.ordering.enums import MovePosition
+
+# sequence numbers are sparse ranks: a move takes the midpoint between two neighbours,
+# so a group can absorb about 16 moves into the same gap before it is rebalanced
+RANK_GAP = 2 ** 16
+
+OrderedModel = Union[ButtonModel, ActionModel]
+
+
+def get_rank_by_position(position: int) -> int:
+    return position * RANK_GAP
+
+
+def _get_group_counters(model: Type[OrderedModel]) -> tuple[InstrumentedAttribute, InstrumentedAttribute]:
+    if issubclass(model, ButtonModel):
+        return GroupModel.buttons_count, GroupModel.last_button_rank
+    return GroupModel.actions_count, GroupModel.last_action_rank
+
+
+async def allocate_rank(
+        session: AsyncSession,
+        model: Type[OrderedModel],
+        group_id: UUID,
+        count_delta: int = 1,
+) -> int:
+    # the group row is the counter, concurrent appends to a group queue on its lock instead of scanning
+    count_column, last_rank_column = _get_group_counters(model)
+    return await session.scalar(
+        update(GroupModel)
+        .where(GroupModel.group_id == group_id)
+        .values({
+            count_column: count_column + count_delta,
+            last_rank_column: last_rank_column + RANK_GAP,
+        })
+        .returning(last_rank_column)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def delete_item(session: AsyncSession, model: Type[OrderedModel], item_id: UUID):
+    id_column = model.__mapper__.primary_key[0]
+    count_column, _ = _get_group_counters(model)
+    deleted = (
+        delete(model)
+        .where(id_column == item_id)
+        .returning(model.group_id)
+        .cte('deleted')
+    )
+    await session.execute(
+        update(GroupModel)
+        .where(GroupModel.group_id == deleted.c.group_id)
+        .values({count_column: count_column - 1})
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def recount_group_counters(session: AsyncSession, project_id: UUID):
+    values = {}
+    for model in (ButtonModel, ActionModel):
+        count_column, last_rank_column = _get_group_counters(model)
+        values[count_column] = (
+            select(func.count())
+            .where(model.group_id == GroupModel.group_id)
+            .scalar_subquery()
+        )
+        values[last_rank_column] = (
+            select(func.coalesce(func.max(model.sequence_number), 0))
+            .where(model.group_id == GroupModel.group_id)
+            .scalar_subquery()
+        )
+    # one pass over the project groups, every counter is read from the (group_id, sequence_number) index
+    await session.execute(
+        update(GroupModel)
+        .where(GroupModel.project_id == project_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def move_item(
+        session: AsyncSession,
+        model: Type[OrderedModel],
+        group_id: UUID,
+        item_id: UUID,
+        anchor_id: UUID,
+        position: MovePosition,
+) -> Optional[int]:
+    id_column = model.__mapper__.primary_key[0]
+
+    # the anchor lock serializes concurrent moves into the same gap
+    anchor_rank = await session.scalar(
+        select(model.sequence_number)
+        .where(id_column == anchor_id, model.group_id == group_id)
+        .with_for_update()
+    )
+    if anchor_rank is None:
+        return
+
+    rank = await _get_rank_next_to(session, model, group_id, item_id, anchor_rank, position)
+    if rank is None:
+        await rebalance_ranks(session, model, group_id)
+        anchor_rank = await session.scalar(
+            select(model.sequence_number)
+            .where(id_column == anchor_id)
+        )
+        rank = await _get_rank_next_to(session, model, group_id, item_id, anchor_rank, position)
+
+    await session.execute(
+        update(model)
+        .where(id_column == item_id)
+        .values(sequence_number=rank)
+    )
+    return rank
+
+
+async def _get_rank_next_to(
+        session: AsyncSession,
+        model: Type[OrderedModel],
+        group_id: UUID,
+        item_id: UUID,
+        anchor_rank: int,
+        position: MovePosition,
+) -> Optional[int]:
+    id_column = model.__mapper__.primary_key[0]
+    if position == MovePosition.BEFORE:
+        neighbour_rank = await session.scalar(
+            select(func.max(model.sequence_number))
+            .where(model.group_id == group_id, model.sequence_number < anchor_rank, id_column != item_id)
+        )
+        # ranks stay positive, the first item is moved towards zero
+        lower_rank, upper_rank = neighbour_rank or 0, anchor_rank
+    else:
+        neighbour_rank = await session.scalar(
+            select(func.min(model.sequence_number))
+            .where(model.group_id == group_id, model.sequence_number > anchor_rank, id_column != item_id)
+        )
+        if neighbour_rank is None:
+            # moving to the end takes a fresh rank from the group counter, like an append
+            return await allocate_rank(session, model, group_id, count_delta=0)
+        lower_rank, upper_rank = anchor_rank, neighbour_rank
+
+    return get_rank_between(lower_rank, upper_rank)
+
+
+def get_rank_between(lower_rank: int, upper_rank: int) -> Optional[int]:
+    # None once the gap is exhausted, the group has to be rebalanced first
+    if upper_rank - lower_rank < 2:
+        return
+    return (lower_rank + upper_rank) // 2
+
+
+async def rebalance_ranks(session: AsyncSession, model: Type[OrderedModel], group_id: UUID):
+    id_column = model.__mapper__.primary_key[0]
+    positions = (
+        select(
+            id_column.label('item_id'),
+            func.row_number().over(order_by=(model.sequence_number, id_column)).label('position'),
+        )
+        .where(model.group_id == group_id)
+        .subquery()
+    )
+    # the unique constraint on ranks is deferred, so rows may collide until commit
+    await session.execute(
+        update(model)
+        .where(id_column == positions.c.item_id)
+        .values(sequence_number=positions.c.position * RANK_GAP)
+        .execution_options(synchronize_session='fetch')
+    )
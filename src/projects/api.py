@@ -1,12 +1,19 @@
+from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, status, Query, Response
+from fastapi.responses import StreamingResponse
 
 from src.projects.dependencies.services_dependencies import ProjectServiceDI
-from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException
-from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException, InvalidProjectCursorHTTPException
+from src.projects.exceptions.services_exceptions import ProjectNotFoundError, InvalidProjectCursorError
 from src.projects.schemas import ProjectReadSchema, ProjectCreateSchema
 
+PROJECTS_PAGE_DEFAULT_LIMIT = 50
+PROJECTS_PAGE_MAX_LIMIT = 500
+# the listing stays a plain list, the cursor of the next page travels in a header
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
 router = APIRouter(prefix='/projects', tags=['Projects'])
 
 
@@ -28,8 +35,29 @@ async def create_project(
 )
 async def get_projects(
         project_service: ProjectServiceDI,
+        response: Response,
+        limit: Annotated[int, Query(ge=1, le=PROJECTS_PAGE_MAX_LIMIT)] = PROJECTS_PAGE_DEFAULT_LIMIT,
+        cursor: Annotated[Optional[str], Query(max_length=256)] = None,
+):
+    try:
+        page = await project_service.get_projects_page(limit=limit, cursor=cursor)
+    except InvalidProjectCursorError:
+        raise InvalidProjectCursorHTTPException
+
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+@router.get(
+    '/stream',
+    response_model=list[ProjectReadSchema],
+    response_class=StreamingResponse,
+)
+async def stream_projects(
+        project_service: ProjectServiceDI,
 ):
-    return await project_service.get_projects()
+    return StreamingResponse(project_service.stream_projects(), media_type='application/json')
 
 
 @router.delete(
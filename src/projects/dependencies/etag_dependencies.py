@@ -0,0 +1,48 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Request, Response, Depends
+
+from src.projects.dependencies.services_dependencies import ProjectServiceDI
+from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException, NotModifiedHTTPException
+from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+
+
+def _is_etag_matching(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == '*':
+        return True
+    return any(
+        value.strip().removeprefix('W/') == etag
+        for value in if_none_match.split(',')
+    )
+
+
+async def get_project_version(
+        project_service: ProjectServiceDI,
+        project_id: UUID,
+) -> int:
+    # resolved once per request, the ETag check and the cached reads behind it share it
+    try:
+        return await project_service.get_project_version(project_id)
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+
+
+ProjectVersionDI = Annotated[int, Depends(get_project_version)]
+
+
+async def check_project_etag(
+        version: ProjectVersionDI,
+        request: Request,
+        response: Response,
+) -> str:
+    etag = f'"{version}"'
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match is not None and _is_etag_matching(if_none_match, etag):
+        raise NotModifiedHTTPException(etag)
+
+    response.headers['ETag'] = etag
+    return etag
+
+
+ProjectETagDI = Annotated[str, Depends(check_project_etag)]
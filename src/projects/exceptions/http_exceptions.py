@@ -7,3 +7,19 @@ class ProjectNotFoundHTTPException(HTTPException):
             status_code=status.HTTP_404_NOT_FOUND,
             detail='Project not found',
         )
+
+
+class NotModifiedHTTPException(HTTPException):
+    def __init__(self, etag: str):
+        super().__init__(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag},
+        )
+
+
+class InvalidProjectCursorHTTPException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Invalid cursor',
+        )
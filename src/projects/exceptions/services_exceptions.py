@@ -1,2 +1,6 @@
 class ProjectNotFoundError(Exception):
     pass
+
+
+class InvalidProjectCursorError(Exception):
+    pass
@@ -1,10 +1,11 @@
 import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, func, String
+from sqlalchemy import DateTime, func, String, BigInteger, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.db import Base
+from src.core.utils import uuid7, utc_now
 
 
 class ProjectModel(Base):
@@ -12,12 +13,25 @@ class ProjectModel(Base):
 
     project_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=func.gen_random_uuid(),
     )
     name: Mapped[str] = mapped_column(String(256))
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utc_now,
         server_default=func.now(),
     )
+    # bumped by every change of the project graph, used for conditional reads
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+        server_default='0',
+    )
 
     groups: Mapped[list['GroupModel']] = relationship(back_populates='project')
+
+    __table_args__ = (
+        # keyset pagination of the project listing
+        Index('ix_projects_created_at_project_id', 'created_at', 'project_id'),
+    )
@@ -1,10 +1,17 @@
-from typing import Optional
+from typing import Optional, AsyncIterator
+from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, tuple_, Select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import project_cache
+from src.core.db import run_after_commit
 from src.core.dependencies.db_dependencies import AsyncSessionDI
 from src.projects.models import ProjectModel
 from src.projects.schemas import ProjectCreateSchema, ProjectReadSchema
+from src.projects.utils import ProjectCursor, run_project_delete_hooks
+
+PROJECTS_CHUNK_SIZE = 1000
 
 
 class ProjectRepository:
@@ -14,18 +21,28 @@ class ProjectRepository:
     async def create_project(self, project: ProjectCreateSchema) -> ProjectReadSchema:
         project = ProjectModel(**project.model_dump())
         self._session.add(project)
-        await self._session.commit()
+        await self._session.flush()
         return ProjectReadSchema.model_validate(project)
 
-    async def get_projects(self) -> list[ProjectReadSchema]:
-        projects = await self._session.execute(
-            select(ProjectModel)
-        )
+    async def get_projects(self, limit: int, after: Optional[ProjectCursor] = None) -> list[ProjectReadSchema]:
+        query = self._select_projects()
+        if after is not None:
+            query = query.where(tuple_(ProjectModel.created_at, ProjectModel.project_id) > tuple_(*after))
+
+        projects = await self._session.execute(query.limit(limit))
         return [
-            ProjectReadSchema.model_validate(project)
-            for project in projects.unique().scalars().all()
+            ProjectReadSchema.model_validate(project._asdict())
+            for project in projects.all()
         ]
 
+    async def stream_projects(self) -> AsyncIterator[list[ProjectReadSchema]]:
+        # the request session is closed before a streamed body is sent, so the listing reads with its own
+        # on the database the request was routed to
+        async with AsyncSession(self._session.bind, expire_on_commit=False) as session:
+            projects = await session.stream(self._select_projects().execution_options(yield_per=PROJECTS_CHUNK_SIZE))
+            async for partition in projects.partitions():
+                yield [ProjectReadSchema.model_validate(project._asdict()) for project in partition]
+
     async def get_project_by_id(self, project_id: int) -> Optional[ProjectReadSchema]:
         project = await self._session.execute(
             select(ProjectModel)
@@ -36,9 +53,24 @@ class ProjectRepository:
             return
         return ProjectReadSchema.model_validate(project)
 
+    async def get_project_version(self, project_id: UUID) -> Optional[int]:
+        return await self._session.scalar(
+            select(ProjectModel.version)
+            .where(ProjectModel.project_id == project_id)
+        )
+
+    @staticmethod
+    def _select_projects() -> Select:
+        return (
+            select(ProjectModel.project_id, ProjectModel.name, ProjectModel.created_at)
+            .order_by(ProjectModel.created_at, ProjectModel.project_id)
+        )
+
     async def delete_project(self, project_id: int):
         await self._session.execute(
             delete(ProjectModel)
             .where(ProjectModel.project_id == project_id)
         )
-        await self._session.commit()
+        run_after_commit(self._session, lambda: project_cache.invalidate(project_id))
+        run_project_delete_hooks(self._session, project_id)
+        await self._session.flush()
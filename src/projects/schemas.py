@@ -1,4 +1,5 @@
 import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -16,3 +17,9 @@ class ProjectReadSchema(BaseModel):
 
 class ProjectCreateSchema(BaseModel):
     name: str = Field(max_length=256)
+
+
+class ProjectPageSchema(BaseModel):
+    items: list[ProjectReadSchema]
+    # opaque, sent as the X-Next-Cursor header and passed back as `cursor`; null on the last page
+    next_cursor: Optional[str]
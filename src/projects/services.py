@@ -1,6 +1,10 @@
+from typing import Optional, AsyncIterator
+from uuid import UUID
+
 from src.projects.dependencies.repositories_dependencies import ProjectRepositoryDI
-from src.projects.exceptions.services_exceptions import ProjectNotFoundError
-from src.projects.schemas import ProjectCreateSchema, ProjectReadSchema
+from src.projects.exceptions.services_exceptions import ProjectNotFoundError, InvalidProjectCursorError
+from src.projects.schemas import ProjectCreateSchema, ProjectReadSchema, ProjectPageSchema
+from src.projects.utils import encode_project_cursor, decode_project_cursor
 
 
 class ProjectService:
@@ -10,8 +14,36 @@ class ProjectService:
     async def create_project(self, project: ProjectCreateSchema) -> ProjectReadSchema:
         return await self._project_repository.create_project(project)
 
-    async def get_projects(self) -> list[ProjectReadSchema]:
-        return await self._project_repository.get_projects()
+    async def get_projects_page(self, limit: int, cursor: Optional[str] = None) -> ProjectPageSchema:
+        after = None
+        if cursor is not None:
+            after = decode_project_cursor(cursor)
+            if after is None:
+                raise InvalidProjectCursorError
+
+        # one extra row tells whether there is a next page
+        projects = await self._project_repository.get_projects(limit=limit + 1, after=after)
+        if len(projects) <= limit:
+            return ProjectPageSchema(items=projects, next_cursor=None)
+
+        projects = projects[:limit]
+        return ProjectPageSchema(items=projects, next_cursor=encode_project_cursor(projects[-1]))
+
+    async def stream_projects(self) -> AsyncIterator[bytes]:
+        yield b'['
+        separator = b''
+        async for projects in self._project_repository.stream_projects():
+            for project in projects:
+                yield separator + project.model_dump_json().encode()
+                separator = b','
+        yield b']'
+
+    async def get_project_version(self, project_id: UUID) -> int:
+        # never cached: other processes commit too, and the cached read models are checked against it
+        version = await self._project_repository.get_project_version(project_id)
+        if version is None:
+            raise ProjectNotFoundError
+        return version
 
     async def delete_project(self, project_id: int):
         project = await self._project_repository.get_project_by_id(project_id)
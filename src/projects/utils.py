@@ -0,0 +1,73 @@
+import base64
+from datetime import datetime
+from typing import Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import project_cache
+from src.core.db import run_after_commit, get_transaction_info
+from src.projects.models import ProjectModel
+from src.projects.schemas import ProjectReadSchema
+
+# other domains follow project changes through hooks they register here, projects import none of them.
+# Bump hooks run inside the transaction that bumped the version and defer their work with run_after_commit,
+# delete hooks run once the delete is committed
+VersionBumpHook = Callable[[AsyncSession, UUID, int], None]
+ProjectDeleteHook = Callable[[UUID], None]
+_version_bump_hooks: list[VersionBumpHook] = []
+_project_delete_hooks: list[ProjectDeleteHook] = []
+
+
+def add_version_bump_hook(hook: VersionBumpHook):
+    _version_bump_hooks.append(hook)
+
+
+def add_project_delete_hook(hook: ProjectDeleteHook):
+    _project_delete_hooks.append(hook)
+
+
+def run_project_delete_hooks(session: AsyncSession, project_id: UUID):
+    for hook in _project_delete_hooks:
+        run_after_commit(session, lambda hook=hook: hook(project_id))
+
+
+async def bump_project_version(session: AsyncSession, project_id: UUID):
+    # called before any group, button, input or action row is written or locked, so every writer
+    # locks the project row first and writers of one project cannot deadlock on each other.
+    # One bump per transaction is enough, batches touch the same project many times
+    bumped_project_ids = get_transaction_info(session).setdefault('bumped_project_ids', set())
+    if project_id in bumped_project_ids:
+        return
+    bumped_project_ids.add(project_id)
+
+    version = await session.scalar(
+        update(ProjectModel)
+        .where(ProjectModel.project_id == project_id)
+        .values(version=ProjectModel.version + 1)
+        .returning(ProjectModel.version)
+    )
+    run_after_commit(session, lambda: project_cache.invalidate(project_id))
+    if version is not None:
+        for hook in _version_bump_hooks:
+            hook(session, project_id, version)
+
+
+ProjectCursor = tuple[datetime, UUID]
+
+
+def encode_project_cursor(project: ProjectReadSchema) -> str:
+    cursor = f'{project.created_at.isoformat()}|{project.project_id}'
+    return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+
+def decode_project_cursor(cursor: str) -> Optional[ProjectCursor]:
+    try:
+        created_at, project_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        created_at, project_id = datetime.fromisoformat(created_at), UUID(project_id)
+    except ValueError:
+        return
+    if created_at.tzinfo is None:
+        return
+    return created_at, project_id
@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.scopes.repositories import ScopeRepository
+
+ScopeRepositoryDI = Annotated[ScopeRepository, Depends(ScopeRepository)]
@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.scopes.services import ScopeService
+
+ScopeServiceDI = Annotated[ScopeService, Depends(ScopeService)]
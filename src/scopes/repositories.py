@@ -0,0 +1,84 @@
+from typing import Optional, Type, Union
+from uuid import UUID
+
+from sqlalchemy import select, null, and_
+from sqlalchemy.orm import aliased
+
+from src.actions.models import ActionModel
+from src.buttons.models import ButtonModel
+from src.core.dependencies.db_dependencies import AsyncSessionDI
+from src.groups.models import GroupModel
+from src.inputs.models import InputModel
+from src.projects.models import ProjectModel
+from src.scopes.schemas import ScopeSchema
+
+ScopeChildModel = Union[ButtonModel, InputModel, ActionModel]
+
+
+class ScopeRepository:
+    def __init__(self, session: AsyncSessionDI):
+        self._session = session
+
+    async def get_scope(
+            self,
+            project_id: UUID,
+            group_id: Optional[UUID] = None,
+            child_model: Optional[Type[ScopeChildModel]] = None,
+            child_id: Optional[UUID] = None,
+            destination_group_id: Optional[UUID] = None,
+    ) -> Optional[ScopeSchema]:
+        # every level is joined through its parent, so an id from another project or group comes back as NULL
+        query = select(ProjectModel.project_id).where(ProjectModel.project_id == project_id)
+
+        if group_id is None:
+            query = query.add_columns(null().label('group_id'))
+        else:
+            query = (
+                query
+                .add_columns(GroupModel.group_id)
+                .outerjoin(
+                    GroupModel,
+                    and_(
+                        GroupModel.group_id == group_id,
+                        GroupModel.project_id == ProjectModel.project_id,
+                    ),
+                )
+            )
+
+        if child_model is None or group_id is None:
+            query = query.add_columns(null().label('child_id'))
+        else:
+            child_pk = child_model.__mapper__.primary_key[0]
+            query = (
+                query
+                .add_columns(child_pk.label('child_id'))
+                .outerjoin(
+                    child_model,
+                    and_(
+                        child_pk == child_id,
+                        child_model.group_id == GroupModel.group_id,
+                    ),
+                )
+            )
+
+        if destination_group_id is None:
+            query = query.add_columns(null().label('destination_group_id'))
+        else:
+            destination_group = aliased(GroupModel)
+            query = (
+                query
+                .add_columns(destination_group.group_id.label('destination_group_id'))
+                .outerjoin(
+                    destination_group,
+                    and_(
+                        destination_group.group_id == destination_group_id,
+                        destination_group.project_id == ProjectModel.project_id,
+                    ),
+                )
+            )
+
+        scope = await self._session.execute(query)
+        scope = scope.first()
+        if scope is None:
+            return
+        return ScopeSchema.model_validate(scope)
@@ -0,0 +1,15 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ScopeSchema(BaseModel):
+    project_id: UUID
+    group_id: Optional[UUID]
+    child_id: Optional[UUID]
+    destination_group_id: Optional[UUID]
+
+    model_config = {
+        'from_attributes': True,
+    }
@@ -0,0 +1,120 @@
+from typing import Optional, Type
+from uuid import UUID
+
+from src.actions.exceptions.services_exceptions import ActionNotFoundError
+from src.actions.models import ActionModel
+from src.buttons.exceptions.services_exceptions import ButtonNotFoundError
+from src.buttons.models import ButtonModel
+from src.groups.exceptions.services_exceptions import GroupNotFoundError
+from src.inputs.exceptions.services_exceptions import InputNotFoundError
+from src.inputs.models import InputModel
+from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+from src.scopes.dependencies.repositories_dependencies import ScopeRepositoryDI
+from src.scopes.repositories import ScopeChildModel
+from src.scopes.schemas import ScopeSchema
+
+
+class ScopeService:
+    def __init__(self, scope_repository: ScopeRepositoryDI):
+        self._scope_repository = scope_repository
+        # project and group scopes already resolved in this request, batches check the same ones many times
+        self._resolved_scopes: dict[tuple[UUID, Optional[UUID]], ScopeSchema] = {}
+
+    async def get_project_scope(self, project_id: UUID) -> ScopeSchema:
+        return await self._get_scope(project_id=project_id)
+
+    async def get_group_scope(self, project_id: UUID, group_id: UUID) -> ScopeSchema:
+        return await self._get_scope(project_id=project_id, group_id=group_id)
+
+    async def get_button_scope(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            button_id: UUID,
+            destination_group_id: Optional[UUID] = None,
+    ) -> ScopeSchema:
+        return await self._get_scope(
+            project_id=project_id,
+            group_id=group_id,
+            child_model=ButtonModel,
+            child_id=button_id,
+            child_not_found_error=ButtonNotFoundError,
+            destination_group_id=destination_group_id,
+        )
+
+    async def get_input_scope(
+            self,
+            project_id: UUID,
+            group_id: UUID,
+            input_id: UUID,
+            destination_group_id: Optional[UUID] = None,
+    ) -> ScopeSchema:
+        return await self._get_scope(
+            project_id=project_id,
+            group_id=group_id,
+            child_model=InputModel,
+            child_id=input_id,
+            child_not_found_error=InputNotFoundError,
+            destination_group_id=destination_group_id,
+        )
+
+    async def get_action_scope(self, project_id: UUID, group_id: UUID, action_id: UUID) -> ScopeSchema:
+        return await self._get_scope(
+            project_id=project_id,
+            group_id=group_id,
+            child_model=ActionModel,
+            child_id=action_id,
+            child_not_found_error=ActionNotFoundError,
+        )
+
+    def forget_group_scope(self, project_id: UUID, group_id: UUID):
+        self._resolved_scopes.pop((project_id, group_id), None)
+
+    async def _get_scope(
+            self,
+            project_id: UUID,
+            group_id: Optional[UUID] = None,
+            child_model: Optional[Type[ScopeChildModel]] = None,
+            child_id: Optional[UUID] = None,
+            child_not_found_error: Optional[Type[Exception]] = None,
+            destination_group_id: Optional[UUID] = None,
+    ) -> ScopeSchema:
+        if child_model is None and destination_group_id is None:
+            scope = self._resolved_scopes.get((project_id, group_id))
+            if scope is not None:
+                return scope
+
+        scope = await self._scope_repository.get_scope(
+            project_id=project_id,
+            group_id=group_id,
+            child_model=child_model,
+            child_id=child_id,
+            destination_group_id=destination_group_id,
+        )
+        if scope is None:
+            raise ProjectNotFoundError
+
+        if group_id is not None and scope.group_id is None:
+            raise GroupNotFoundError
+
+        # TODO: specify group id in errors
+        if destination_group_id is not None and scope.destination_group_id is None:
+            raise GroupNotFoundError
+
+        if child_model is not None and scope.child_id is None:
+            raise child_not_found_error
+
+        self._resolved_scopes[(project_id, None)] = ScopeSchema(
+            project_id=project_id,
+            group_id=None,
+            child_id=None,
+            destination_group_id=None,
+        )
+        if group_id is not None:
+            self._resolved_scopes[(project_id, group_id)] = ScopeSchema(
+                project_id=project_id,
+                group_id=group_id,
+                child_id=None,
+                destination_group_id=None,
+            )
+        return scope
@@ -0,0 +1,62 @@
+from uuid import UUID
+
+from fastapi import APIRouter, status, Request
+from fastapi.responses import StreamingResponse
+
+from src.projects.exceptions.http_exceptions import ProjectNotFoundHTTPException
+from src.projects.exceptions.services_exceptions import ProjectNotFoundError
+from src.projects.schemas import ProjectReadSchema
+from src.transfers.dependencies.services_dependencies import TransferServiceDI
+from src.transfers.exceptions.http_exceptions import (
+    InvalidImportRecordHTTPException,
+    UnknownImportReferenceHTTPException,
+    EmptyImportHTTPException,
+    ConflictingImportRecordsHTTPException,
+)
+from src.transfers.exceptions.services_exceptions import (
+    InvalidImportRecordError,
+    UnknownImportReferenceError,
+    EmptyImportError,
+    ConflictingImportRecordsError,
+)
+
+router = APIRouter(
+    prefix='/projects',
+    tags=['Transfers'],
+)
+
+
+@router.get(
+    '/{project_id}/export',
+    response_class=StreamingResponse,
+)
+async def export_project(
+        transfer_service: TransferServiceDI,
+        project_id: UUID,
+):
+    try:
+        records = await transfer_service.export_project(project_id)
+    except ProjectNotFoundError:
+        raise ProjectNotFoundHTTPException
+    return StreamingResponse(records, media_type='application/x-ndjson')
+
+
+@router.post(
+    '/import',
+    response_model=ProjectReadSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_project(
+        transfer_service: TransferServiceDI,
+        request: Request,
+):
+    try:
+        return await transfer_service.import_project(request.stream())
+    except UnknownImportReferenceError as error:
+        raise UnknownImportReferenceHTTPException(error.line_number)
+    except InvalidImportRecordError as error:
+        raise InvalidImportRecordHTTPException(error.line_number)
+    except EmptyImportError:
+        raise EmptyImportHTTPException
+    except ConflictingImportRecordsError:
+        raise ConflictingImportRecordsHTTPException
@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.transfers.repositories import TransferRepository
+
+TransferRepositoryDI = Annotated[TransferRepository, Depends(TransferRepository)]
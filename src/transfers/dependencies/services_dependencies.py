@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.transfers.services import TransferService
+
+TransferServiceDI = Annotated[TransferService, Depends(TransferService)]
@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class TransferRecordType(StrEnum):
+    PROJECT = 'project'
+    GROUP = 'group'
+    BUTTON = 'button'
+    INPUT = 'input'
+    ACTION = 'action'
@@ -0,0 +1,33 @@
+from fastapi import HTTPException, status
+
+
+class InvalidImportRecordHTTPException(HTTPException):
+    def __init__(self, line_number: int):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f'Invalid record at line {line_number}',
+        )
+
+
+class UnknownImportReferenceHTTPException(HTTPException):
+    def __init__(self, line_number: int):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f'Record at line {line_number} references an unknown id',
+        )
+
+
+class EmptyImportHTTPException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Import contains no project',
+        )
+
+
+class ConflictingImportRecordsHTTPException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail='Imported records violate a uniqueness constraint',
+        )
@@ -0,0 +1,16 @@
+class InvalidImportRecordError(Exception):
+    def __init__(self, line_number: int):
+        super().__init__(line_number)
+        self.line_number = line_number
+
+
+class UnknownImportReferenceError(InvalidImportRecordError):
+    pass
+
+
+class EmptyImportError(Exception):
+    pass
+
+
+class ConflictingImportRecordsError(Exception):
+    pass
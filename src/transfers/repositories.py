@@ -0,0 +1,141 @@
+from typing import AsyncIterator, Sequence, Type
+from uuid import UUID
+
+from asyncpg import IntegrityConstraintViolationError
+from pydantic import BaseModel
+from sqlalchemy import select, func, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.actions.enums import ActionType
+from src.actions.models import ActionModel
+from src.actions.utils import get_action_content_field_by_type
+from src.buttons.models import ButtonModel
+from src.core.db import Base, READ_ONLY_EXECUTION_OPTIONS
+from src.core.dependencies.db_dependencies import AsyncSessionDI
+from src.graph.utils import fill_group_edges
+from src.groups.models import GroupModel
+from src.inputs.models import InputModel
+from src.ordering.utils import recount_group_counters
+from src.projects.models import ProjectModel
+from src.transfers.schemas import (
+    ProjectRecordSchema,
+    GroupRecordSchema,
+    ButtonRecordSchema,
+    InputRecordSchema,
+    ActionRecordSchema,
+)
+
+EXPORT_CHUNK_SIZE = 1000
+
+
+class TransferRepository:
+    def __init__(self, session: AsyncSessionDI):
+        self._session = session
+
+    async def stream_project_records(self, project_id: UUID) -> AsyncIterator[list[BaseModel]]:
+        # the request session is closed before a streamed body is sent, so the export reads with its own
+        # on the database the request was routed to
+        async with AsyncSession(self._session.bind, expire_on_commit=False) as session:
+            await session.connection(execution_options=READ_ONLY_EXECUTION_OPTIONS)
+
+            queries = (
+                (self._select_project(project_id), ProjectRecordSchema),
+                (self._select_groups(project_id), GroupRecordSchema),
+                (self._select_buttons(project_id), ButtonRecordSchema),
+                (self._select_inputs(project_id), InputRecordSchema),
+                (self._select_actions(project_id), ActionRecordSchema),
+            )
+            for query, record_schema in queries:
+                rows = await session.stream(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+                async for partition in rows.partitions():
+                    # validating plain dicts is much cheaper than reading rows as attributes
+                    yield [record_schema.model_validate(row._asdict()) for row in partition]
+
+    async def copy_records(self, model: Type[Base], columns: Sequence[str], records: list[tuple]) -> bool:
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        if not raw_connection.driver_connection.is_in_transaction():
+            # the driver only begins the transaction with the first statement, a COPY before it would commit on its own
+            await connection.exec_driver_sql('SELECT 1')
+        try:
+            await raw_connection.driver_connection.copy_records_to_table(
+                model.__tablename__,
+                records=records,
+                columns=columns,
+            )
+        except IntegrityConstraintViolationError:
+            # the failed COPY aborted the transaction, the request rolls it back
+            return False
+        return True
+
+    async def recount_group_counters(self, project_id: UUID):
+        await recount_group_counters(self._session, project_id)
+
+    async def fill_group_edges(self, project_id: UUID):
+        await fill_group_edges(self._session, project_id)
+
+    @staticmethod
+    def _select_project(project_id: UUID) -> Select:
+        return (
+            select(ProjectModel.project_id, ProjectModel.name, ProjectModel.created_at)
+            .where(ProjectModel.project_id == project_id)
+        )
+
+    @staticmethod
+    def _select_groups(project_id: UUID) -> Select:
+        return (
+            select(GroupModel.group_id, GroupModel.name, GroupModel.created_at)
+            .where(GroupModel.project_id == project_id)
+            .order_by(GroupModel.created_at, GroupModel.group_id)
+        )
+
+    @staticmethod
+    def _select_buttons(project_id: UUID) -> Select:
+        return (
+            select(
+                ButtonModel.button_id,
+                ButtonModel.group_id,
+                ButtonModel.destination_group_id,
+                ButtonModel.text,
+                ButtonModel.payload,
+                ButtonModel.sequence_number,
+                ButtonModel.created_at,
+            )
+            .join(GroupModel, GroupModel.group_id == ButtonModel.group_id)
+            .where(GroupModel.project_id == project_id)
+            .order_by(ButtonModel.group_id, ButtonModel.sequence_number)
+        )
+
+    @staticmethod
+    def _select_inputs(project_id: UUID) -> Select:
+        return (
+            select(
+                InputModel.input_id,
+                InputModel.group_id,
+                InputModel.destination_group_id,
+                InputModel.type,
+                InputModel.created_at,
+            )
+            .join(GroupModel, GroupModel.group_id == InputModel.group_id)
+            .where(GroupModel.project_id == project_id)
+            .order_by(InputModel.group_id, InputModel.created_at)
+        )
+
+    @staticmethod
+    def _select_actions(project_id: UUID) -> Select:
+        return (
+            select(
+                ActionModel.action_id,
+                ActionModel.group_id,
+                ActionModel.type,
+                func.coalesce(*(
+                    ActionModel.payload[get_action_content_field_by_type(action_type)].astext
+                    for action_type in ActionType
+                )).label('content'),
+                ActionModel.sequence_number,
+                ActionModel.created_at,
+            )
+            .join(GroupModel, GroupModel.group_id == ActionModel.group_id)
+            .where(GroupModel.project_id == project_id)
+            .order_by(ActionModel.group_id, ActionModel.sequence_number)
+        )
@@ -0,0 +1,93 @@
+from datetime import datetime
+from typing import Literal, Optional, Annotated, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from src.actions.enums import ActionType
+from src.inputs.enums import InputType
+from src.transfers.enums import TransferRecordType
+
+TRANSFER_FORMAT_VERSION = 1
+
+
+class ProjectRecordSchema(BaseModel):
+    record: Literal[TransferRecordType.PROJECT] = TransferRecordType.PROJECT
+    format_version: int = TRANSFER_FORMAT_VERSION
+    project_id: UUID
+    name: str = Field(max_length=256)
+    created_at: datetime
+
+    model_config = {
+        'from_attributes': True,
+    }
+
+
+class GroupRecordSchema(BaseModel):
+    record: Literal[TransferRecordType.GROUP] = TransferRecordType.GROUP
+    group_id: UUID
+    name: str = Field(max_length=256)
+    created_at: datetime
+
+    model_config = {
+        'from_attributes': True,
+    }
+
+
+class ButtonRecordSchema(BaseModel):
+    record: Literal[TransferRecordType.BUTTON] = TransferRecordType.BUTTON
+    button_id: UUID
+    group_id: UUID
+    destination_group_id: Optional[UUID]
+    text: str = Field(max_length=64)
+    payload: str = Field(max_length=64)
+    # records carry the stored rank, not the position the API shows, so an import restores the gaps
+    sequence_number: int
+    created_at: datetime
+
+    model_config = {
+        'from_attributes': True,
+    }
+
+
+class InputRecordSchema(BaseModel):
+    record: Literal[TransferRecordType.INPUT] = TransferRecordType.INPUT
+    input_id: UUID
+    group_id: UUID
+    destination_group_id: Optional[UUID]
+    type: InputType
+    created_at: datetime
+
+    model_config = {
+        'from_attributes': True,
+    }
+
+
+class ActionRecordSchema(BaseModel):
+    record: Literal[TransferRecordType.ACTION] = TransferRecordType.ACTION
+    action_id: UUID
+    group_id: UUID
+    type: ActionType
+    # text of a text message, path of an image message
+    content: str = Field(max_length=4096)
+    # the stored rank, like in button records
+    sequence_number: int = Field(ge=1)
+    created_at: datetime
+
+    model_config = {
+        'from_attributes': True,
+    }
+
+
+UnionRecordSchema = Annotated[
+    Union[
+        ProjectRecordSchema,
+        GroupRecordSchema,
+        ButtonRecordSchema,
+        InputRecordSchema,
+        ActionRecordSchema,
+    ],
+    Field(discriminator='record')
+]
+
+record_adapter = TypeAdapter(UnionRecordSchema)
@@ -0,0 +1,171 @@
+import json
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from src.actions.models import ActionModel
+from src.actions.utils import get_action_content_field_by_type
+from src.buttons.models import ButtonModel
+from src.core.utils import uuid7, utc_now
+from src.groups.models import GroupModel
+from src.inputs.models import InputModel
+from src.projects.models import ProjectModel
+from src.projects.schemas import ProjectReadSchema
+from src.scopes.dependencies.services_dependencies import ScopeServiceDI
+from src.transfers.dependencies.repositories_dependencies import TransferRepositoryDI
+from src.transfers.exceptions.services_exceptions import (
+    InvalidImportRecordError,
+    UnknownImportReferenceError,
+    EmptyImportError,
+    ConflictingImportRecordsError,
+)
+from src.transfers.schemas import (
+    TRANSFER_FORMAT_VERSION,
+    ProjectRecordSchema,
+    GroupRecordSchema,
+    ButtonRecordSchema,
+    InputRecordSchema,
+    ActionRecordSchema,
+    record_adapter,
+)
+from src.transfers.utils import iter_ndjson_lines
+
+IMPORT_CHUNK_SIZE = 5000
+
+# tables are copied in this order so that every foreign key points to an already copied row
+IMPORT_COLUMNS = {
+    ProjectModel: ('project_id', 'name', 'created_at'),
+    GroupModel: ('group_id', 'project_id', 'name', 'created_at'),
+    ButtonModel: (
+        'button_id',
+        'group_id',
+        'destination_group_id',
+        'text',
+        'payload',
+        'sequence_number',
+        'created_at',
+    ),
+    InputModel: ('input_id', 'group_id', 'destination_group_id', 'type', 'created_at'),
+    ActionModel: ('action_id', 'group_id', 'type', 'payload', 'sequence_number', 'created_at'),
+}
+
+
+class TransferService:
+    def __init__(
+            self,
+            transfer_repository: TransferRepositoryDI,
+            scope_service: ScopeServiceDI,
+    ):
+        self._transfer_repository = transfer_repository
+        self._scope_service = scope_service
+
+    async def export_project(self, project_id: UUID) -> AsyncIterator[bytes]:
+        await self._scope_service.get_project_scope(project_id)
+        return self._export_project(project_id)
+
+    async def _export_project(self, project_id: UUID) -> AsyncIterator[bytes]:
+        async for records in self._transfer_repository.stream_project_records(project_id):
+            yield b''.join(record.model_dump_json().encode() + b'\n' for record in records)
+
+    async def import_project(self, chunks: AsyncIterator[bytes]) -> ProjectReadSchema:
+        project: Optional[ProjectReadSchema] = None
+        # only groups are referenced by other records, so only their new ids are kept
+        group_ids: dict[UUID, UUID] = {}
+        buffers = {model: [] for model in IMPORT_COLUMNS}
+        buffered = 0
+
+        async for line_number, line in iter_ndjson_lines(chunks):
+            try:
+                record = record_adapter.validate_json(line)
+            except ValidationError:
+                raise InvalidImportRecordError(line_number)
+
+            if project is None:
+                if not isinstance(record, ProjectRecordSchema) or record.format_version != TRANSFER_FORMAT_VERSION:
+                    raise InvalidImportRecordError(line_number)
+                project = ProjectReadSchema(
+                    project_id=uuid7(),
+                    name=record.name,
+                    created_at=utc_now(),
+                )
+                buffers[ProjectModel].append((project.project_id, project.name, project.created_at))
+
+            elif isinstance(record, GroupRecordSchema):
+                if record.group_id in group_ids:
+                    raise InvalidImportRecordError(line_number)
+                group_id = group_ids[record.group_id] = uuid7()
+                buffers[GroupModel].append((group_id, project.project_id, record.name, record.created_at))
+
+            elif isinstance(record, ButtonRecordSchema):
+                buffers[ButtonModel].append((
+                    uuid7(),
+                    self._remap_group_id(group_ids, record.group_id, line_number),
+                    self._remap_destination_group_id(group_ids, record.destination_group_id, line_number),
+                    record.text,
+                    record.payload,
+                    record.sequence_number,
+                    record.created_at,
+                ))
+
+            elif isinstance(record, InputRecordSchema):
+                buffers[InputModel].append((
+                    uuid7(),
+                    self._remap_group_id(group_ids, record.group_id, line_number),
+                    self._remap_destination_group_id(group_ids, record.destination_group_id, line_number),
+                    record.type.name,
+                    record.created_at,
+                ))
+
+            elif isinstance(record, ActionRecordSchema):
+                buffers[ActionModel].append((
+                    uuid7(),
+                    self._remap_group_id(group_ids, record.group_id, line_number),
+                    record.type.name,
+                    json.dumps({get_action_content_field_by_type(record.type): record.content}),
+                    record.sequence_number,
+                    record.created_at,
+                ))
+
+            else:
+                raise InvalidImportRecordError(line_number)
+
+            buffered += 1
+            if buffered >= IMPORT_CHUNK_SIZE:
+                await self._copy_buffers(buffers)
+                buffered = 0
+
+        if project is None:
+            raise EmptyImportError
+
+        await self._copy_buffers(buffers)
+        # COPY bypasses the group counters and the edges, they are filled in once for the whole project
+        await self._transfer_repository.recount_group_counters(project.project_id)
+        await self._transfer_repository.fill_group_edges(project.project_id)
+        return project
+
+    async def _copy_buffers(self, buffers: dict[type, list[tuple]]):
+        for model, records in buffers.items():
+            if not records:
+                continue
+            if not await self._transfer_repository.copy_records(model, IMPORT_COLUMNS[model], records):
+                raise ConflictingImportRecordsError
+            records.clear()
+
+    @staticmethod
+    def _remap_group_id(group_ids: dict[UUID, UUID], group_id: UUID, line_number: int) -> UUID:
+        new_group_id = group_ids.get(group_id)
+        if new_group_id is None:
+            raise UnknownImportReferenceError(line_number)
+        return new_group_id
+
+    @classmethod
+    def _remap_destination_group_id(
+            cls,
+            group_ids: dict[UUID, UUID],
+            destination_group_id: Optional[UUID],
+            line_number: int,
+    ) -> Optional[UUID]:
+        if destination_group_id is None:
+            return
+        return cls._remap_group_id(group_ids, destination_group_id, line_number)
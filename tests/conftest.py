@@ -0,0 +1,17 @@
+import os
+
+import pytest
+
+# the engine is created on import and needs a DSN that parses, the tests that connect are skipped without DB_HOST
+os.environ.setdefault('DB_PORT', '5432')
+
+from src.core import settings  # noqa: E402
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    if settings.DB_HOST:
+        return
+    skip_db = pytest.mark.skip(reason='DB_HOST is not set')
+    for item in items:
+        if 'db' in item.keywords:
+            item.add_marker(skip_db)
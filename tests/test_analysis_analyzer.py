@@ -0,0 +1,94 @@
+import random
+
+from src.analysis.analyzer import analyze_graph
+from tests.utils import Link, build_graph, build_random_links
+
+
+def test_unreachable_and_dead_end_groups():
+    # 0 -> 1 -> 2, 3 -> 1, 4 alone
+    graph = build_graph(5, [(0, 1), (1, 2), (3, 1)])
+
+    analysis = analyze_graph(graph)
+
+    assert analysis.unreachable_groups == [3, 4]
+    assert analysis.dead_end_groups == [2, 4]
+    assert analysis.dangling_edges == []
+
+
+def test_group_with_only_dangling_edges_is_a_dead_end():
+    graph = build_graph(3, [(0, 1), (0, None), (1, None), (1, None), (2, 0)])
+
+    analysis = analyze_graph(graph)
+
+    assert analysis.dead_end_groups == [1]
+    assert analysis.dangling_edges == [(0, 1), (1, 2), (1, 3)]
+
+
+def test_closed_cycles_leave_out_the_start_group():
+    # 0 <-> 1 is the bot's main loop, 2 <-> 3 can not be left, 4 -> 5 -> 4 -> 0 can
+    graph = build_graph(6, [(0, 1), (1, 0), (0, 2), (2, 3), (3, 2), (1, 4), (4, 5), (5, 4), (4, 0)])
+
+    assert analyze_graph(graph).closed_cycles == [[2, 3]]
+
+
+def test_self_loop_is_a_closed_cycle():
+    graph = build_graph(3, [(0, 1), (0, 2), (1, 1), (2, 2), (2, 0)])
+
+    assert analyze_graph(graph).closed_cycles == [[1]]
+
+
+def test_empty_graph():
+    analysis = analyze_graph(build_graph(0, []))
+
+    assert analysis.unreachable_groups == []
+    assert analysis.dead_end_groups == []
+    assert analysis.closed_cycles == []
+
+
+def _find_reachable_naively(groups_count: int, links: list[Link]) -> list[set[int]]:
+    # groups reachable from every group over at least one edge
+    targets = [{target for source, target in links if source == group and target is not None} for group in range(groups_count)]
+    reachable = []
+    for group in range(groups_count):
+        reached, stack = set(), [group]
+        while stack:
+            for target in targets[stack.pop()]:
+                if target not in reached:
+                    reached.add(target)
+                    stack.append(target)
+        reachable.append(reached)
+    return reachable
+
+
+def _find_closed_cycles_naively(groups_count: int, links: list[Link]) -> list[list[int]]:
+    reachable = _find_reachable_naively(groups_count, links)
+    cycles = set()
+    for group in range(groups_count):
+        if group not in reachable[group]:
+            continue
+        component = frozenset(other for other in reachable[group] if group in reachable[other])
+        if all(reachable[member] <= component for member in component):
+            cycles.add(component)
+    return sorted(sorted(cycle) for cycle in cycles if 0 not in cycle)
+
+
+def test_matches_naive_analysis_on_random_graphs():
+    rnd = random.Random(15)
+    for _ in range(200):
+        groups_count = rnd.randint(1, 12)
+        links = build_random_links(rnd, groups_count, rnd.randint(0, 20))
+        # compiled edges are ordered by source group
+        links.sort(key=lambda link: link[0])
+        graph = build_graph(groups_count, links)
+
+        analysis = analyze_graph(graph)
+
+        reached = _find_reachable_naively(groups_count, links)[0] | {0}
+        assert analysis.unreachable_groups == [group for group in range(groups_count) if group not in reached]
+        assert analysis.dead_end_groups == [
+            group
+            for group in range(groups_count)
+            if all(target is None for source, target in links if source == group)
+        ]
+        assert analysis.dangling_edges == [(source, i) for i, (source, target) in enumerate(links) if target is None]
+        assert analysis.closed_cycles == _find_closed_cycles_naively(groups_count, links)
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from src.analysis.paths import PathIndex, build_path_index, find_shortest_path, find_shortest_paths
+from src.graph.compiler import NO_GROUP
+from tests.utils import build_graph, build_random_links
+
+
+def find_all_paths(index: PathIndex, source: int, target: int) -> list[list[int]]:
+    # every path that never visits a group twice, by depth first search over the edges
+    paths = []
+
+    def visit(group_index: int, visited: set[int], path: list[int]):
+        if group_index == target:
+            paths.append(list(path))
+            return
+        for edge_index in range(index.edge_offsets[group_index], index.edge_offsets[group_index + 1]):
+            next_group = index.edge_targets[edge_index]
+            if next_group == NO_GROUP or next_group in visited:
+                continue
+            visited.add(next_group)
+            path.append(edge_index)
+            visit(next_group, visited, path)
+            path.pop()
+            visited.remove(next_group)
+
+    visit(source, {source}, [])
+    return paths
+
+
+def assert_is_path(index: PathIndex, source: int, target: int, path: list[int]):
+    groups = [source]
+    for edge_index in path:
+        assert index.edge_sources[edge_index] == groups[-1]
+        groups.append(index.edge_targets[edge_index])
+    assert groups[-1] == target
+    assert len(set(groups)) == len(groups)
+
+
+def test_buttons_to_the_same_group_make_different_paths():
+    index = build_path_index(build_graph(3, [(0, 1), (0, 1), (0, 2), (1, 2)]))
+
+    assert find_shortest_paths(index, 0, 2, count=5) == [[2], [0, 3], [1, 3]]
+
+
+def test_no_path():
+    index = build_path_index(build_graph(3, [(0, 1), (2, 0), (1, None)]))
+
+    assert find_shortest_paths(index, 0, 2, count=3) == []
+    assert find_shortest_path(index, 0, 0, blocked_groups=set(), blocked_edges=set()) == []
+
+
+def test_blocked_groups_and_edges_are_avoided():
+    index = build_path_index(build_graph(4, [(0, 1), (0, 2), (1, 3), (2, 3)]))
+
+    assert find_shortest_path(index, 0, 3, blocked_groups={1}, blocked_edges=set()) == [1, 3]
+    assert find_shortest_path(index, 0, 3, blocked_groups=set(), blocked_edges={1, 2}) is None
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_shortest_paths_match_brute_force(seed: int):
+    rnd = random.Random(seed)
+    for _ in range(30):
+        groups_count = rnd.randint(2, 8)
+        links = sorted(build_random_links(rnd, groups_count, rnd.randint(1, 18)), key=lambda link: link[0])
+        index = build_path_index(build_graph(groups_count, links))
+        source, target = rnd.randrange(groups_count), rnd.randrange(groups_count)
+        count = rnd.randint(1, 6)
+
+        all_paths = find_all_paths(index, source, target)
+        paths = find_shortest_paths(index, source, target, count)
+
+        assert [len(path) for path in paths] == sorted(len(path) for path in all_paths)[:count]
+        assert len({tuple(path) for path in paths}) == len(paths)
+        for path in paths:
+            assert_is_path(index, source, target, path)
@@ -0,0 +1,182 @@
+import random
+from typing import Optional
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.analysis.analyzer import analyze_graph
+from src.analysis.reachability import (
+    EdgeDeleted,
+    EdgeSet,
+    GraphChange,
+    GroupAdded,
+    GroupDeleted,
+    ReachabilityState,
+    ReachabilityStates,
+    UnknownGraphChangeError,
+)
+from src.graph.compiler import CompiledGraph, compile_graph
+from src.graph.enums import GraphEdgeKind
+
+
+class ProjectModel:
+    # the project as plain dicts, compiled from scratch to check the incremental state
+    def __init__(self):
+        self.project_id = uuid4()
+        self.group_ids: list[UUID] = []
+        self.edges: dict[UUID, tuple[GraphEdgeKind, UUID, Optional[UUID]]] = {}
+
+    def apply(self, change: GraphChange):
+        if isinstance(change, GroupAdded):
+            self.group_ids.append(change.group_id)
+        elif isinstance(change, GroupDeleted):
+            self.group_ids.remove(change.group_id)
+            for edge_id, (kind, source, target) in list(self.edges.items()):
+                if source == change.group_id:
+                    del self.edges[edge_id]
+                elif target == change.group_id:
+                    self.edges[edge_id] = (kind, source, None)
+        elif isinstance(change, EdgeSet):
+            self.edges[change.edge_id] = (change.kind, change.source_group_id, change.destination_group_id)
+        else:
+            del self.edges[change.edge_id]
+
+    def compile(self) -> CompiledGraph:
+        return compile_graph(
+            project_id=self.project_id,
+            group_ids=self.group_ids,
+            edges=[(edge_id, kind, source, target, None, None) for edge_id, (kind, source, target) in self.edges.items()],
+            actions=[],
+        )
+
+    def analyze(self) -> tuple[set[UUID], set[UUID], set[UUID]]:
+        graph = self.compile()
+        analysis = analyze_graph(graph)
+        return (
+            {graph.get_group_id(group_index) for group_index in analysis.unreachable_groups},
+            {graph.get_group_id(group_index) for group_index in analysis.dead_end_groups},
+            {graph.get_edge_id(edge_index) for _, edge_index in analysis.dangling_edges},
+        )
+
+    def build_state(self, version: int) -> ReachabilityState:
+        return ReachabilityState(self.compile(), version)
+
+
+def describe(state: ReachabilityState) -> tuple[set[UUID], set[UUID], set[UUID]]:
+    return (
+        {state.get_group_id(group_index) for group_index in state.unreachable_groups},
+        {state.get_group_id(group_index) for group_index in state.dead_end_groups},
+        {state.get_edge(edge_index)[0] for edge_index in state.dangling_edges},
+    )
+
+
+def make_random_change(rnd: random.Random, model: ProjectModel) -> GraphChange:
+    roll = rnd.random()
+    if not model.group_ids or roll < 0.15:
+        return GroupAdded(group_id=uuid4())
+    if roll < 0.22:
+        return GroupDeleted(group_id=rnd.choice(model.group_ids))
+    if model.edges and roll < 0.3:
+        return EdgeDeleted(edge_id=rnd.choice(list(model.edges)))
+    destination = rnd.choice(model.group_ids) if rnd.random() < 0.85 else None
+    if model.edges and roll < 0.65:
+        # a new destination of an existing button or input
+        edge_id = rnd.choice(list(model.edges))
+        kind, source, _ = model.edges[edge_id]
+        return EdgeSet(edge_id=edge_id, kind=kind, source_group_id=source, destination_group_id=destination)
+    return EdgeSet(
+        edge_id=uuid4(),
+        kind=rnd.choice(list(GraphEdgeKind)),
+        source_group_id=rnd.choice(model.group_ids),
+        destination_group_id=destination,
+    )
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_incremental_state_matches_full_recompute(seed: int):
+    rnd = random.Random(seed)
+    model = ProjectModel()
+    for _ in range(rnd.randint(0, 6)):
+        model.apply(GroupAdded(group_id=uuid4()))
+    for _ in range(rnd.randint(0, 10)):
+        model.apply(make_random_change(rnd, model))
+    state = model.build_state(version=1)
+    assert describe(state) == model.analyze()
+
+    for _ in range(150):
+        change = make_random_change(rnd, model)
+        model.apply(change)
+        state.apply(change)
+
+        assert describe(state) == model.analyze()
+        assert len(state) == len(model.group_ids)
+
+
+def test_deleted_start_group_passes_the_start_on():
+    model = ProjectModel()
+    first, second, third = uuid4(), uuid4(), uuid4()
+    for group_id in (first, second, third):
+        model.apply(GroupAdded(group_id=group_id))
+    model.apply(EdgeSet(edge_id=uuid4(), kind=GraphEdgeKind.BUTTON, source_group_id=first, destination_group_id=third))
+    state = model.build_state(version=1)
+    assert describe(state)[0] == {second}
+
+    state.apply(GroupDeleted(group_id=first))
+
+    assert state.get_group_id(state.start_index) == second
+    assert describe(state)[0] == {third}
+
+
+def test_unknown_changes_are_rejected():
+    model = ProjectModel()
+    group_id = uuid4()
+    model.apply(GroupAdded(group_id=group_id))
+    state = model.build_state(version=1)
+
+    with pytest.raises(UnknownGraphChangeError):
+        state.apply(GroupDeleted(group_id=uuid4()))
+    with pytest.raises(UnknownGraphChangeError):
+        state.apply(EdgeDeleted(edge_id=uuid4()))
+    with pytest.raises(UnknownGraphChangeError):
+        state.apply(GroupAdded(group_id=group_id))
+
+
+def test_states_advance_only_from_the_previous_version():
+    model = ProjectModel()
+    group_id = uuid4()
+    model.apply(GroupAdded(group_id=group_id))
+    states = ReachabilityStates(max_projects=2)
+    states.put(model.project_id, model.build_state(version=1))
+
+    states.advance(model.project_id, version=2, changes=[GroupAdded(group_id=uuid4())])
+    assert states.get(model.project_id, version=1) is None
+    assert len(states.get(model.project_id, version=2).unreachable_groups) == 1
+
+    # version 3 was committed without this process seeing it
+    states.advance(model.project_id, version=4, changes=[])
+    assert len(states) == 0
+
+
+def test_states_drop_a_project_on_an_unknown_change():
+    model = ProjectModel()
+    states = ReachabilityStates(max_projects=2)
+    states.put(model.project_id, model.build_state(version=1))
+
+    states.advance(model.project_id, version=2, changes=[EdgeDeleted(edge_id=uuid4())])
+
+    assert len(states) == 0
+
+
+def test_states_keep_the_recently_used_projects():
+    states = ReachabilityStates(max_projects=2)
+    models = [ProjectModel() for _ in range(3)]
+    states.put(models[0].project_id, models[0].build_state(version=1))
+    states.put(models[1].project_id, models[1].build_state(version=1))
+    states.get(models[0].project_id, version=1)
+
+    states.put(models[2].project_id, models[2].build_state(version=1))
+
+    assert states.get(models[1].project_id, version=1) is None
+    assert states.get(models[0].project_id, version=1) is not None
+    states.forget(models[0].project_id)
+    assert len(states) == 1
@@ -0,0 +1,127 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.batches.exceptions.services_exceptions import (
+    BatchOperationError,
+    DuplicateBatchTempIdError,
+    UnknownBatchReferenceError,
+)
+from src.batches.schemas import BatchButtonIdWithSeqNumber, BatchActionIdWithSeqNumber, BatchSchema
+from src.batches.services import BatchService
+from src.buttons.exceptions.services_exceptions import ButtonNotFoundError
+
+
+@pytest.fixture
+def services() -> SimpleNamespace:
+    # stand-ins that hand out fresh ids, the batch only needs the id of what they create
+    return SimpleNamespace(
+        scope_service=mock.AsyncMock(),
+        group_service=mock.AsyncMock(create_group=mock.AsyncMock(
+            side_effect=lambda project_id, group: SimpleNamespace(group_id=uuid4()),
+        )),
+        button_service=mock.AsyncMock(create_button=mock.AsyncMock(
+            side_effect=lambda project_id, group_id, button: SimpleNamespace(button_id=uuid4()),
+        )),
+        input_service=mock.AsyncMock(),
+        action_service=mock.AsyncMock(),
+    )
+
+
+def run_batch(services: SimpleNamespace, operations: list[dict]):
+    batch_service = BatchService(**vars(services))
+    return asyncio.run(batch_service.run_batch(uuid4(), BatchSchema(operations=operations)))
+
+
+def test_temp_ids_resolve_to_created_ids(services: SimpleNamespace):
+    destination_group_id = uuid4()
+
+    result = run_batch(services, [
+        {'op': 'create_group', 'temp_id': 'menu', 'group': {'name': 'menu'}},
+        {'op': 'create_button', 'temp_id': 'start', 'group_id': 'menu', 'button': {'text': 'start', 'payload': 'start'}},
+        {
+            'op': 'set_button_destination',
+            'group_id': 'menu',
+            'button_id': 'start',
+            'destination_group_id': str(destination_group_id),
+        },
+    ])
+
+    menu_group_id, start_button_id = result.temp_ids['menu'], result.temp_ids['start']
+    assert services.button_service.create_button.await_args.kwargs['group_id'] == menu_group_id
+    assert services.button_service.set_button_destination_group.await_args.kwargs == {
+        'project_id': mock.ANY,
+        'group_id': menu_group_id,
+        'button_id': start_button_id,
+        'destination_group_id': destination_group_id,
+    }
+    assert [operation.op for operation in result.results] == ['create_group', 'create_button', 'set_button_destination']
+
+
+def test_temp_ids_resolve_inside_sequences(services: SimpleNamespace):
+    group_id = uuid4()
+
+    result = run_batch(services, [
+        {'op': 'create_button', 'temp_id': 'new', 'group_id': str(group_id), 'button': {'text': 'a', 'payload': 'a'}},
+        {'op': 'change_button_sequence', 'group_id': str(group_id), 'buttons': [{'button_id': 'new', 'sequence_number': 1}]},
+    ])
+
+    sequence = services.button_service.change_button_sequence.await_args.kwargs['button_ids_with_seq_numbers']
+    assert [(button.button_id, button.sequence_number) for button in sequence] == [(result.temp_ids['new'], 1)]
+
+
+@pytest.mark.parametrize('reference', ['unknown', 'later'])
+def test_unknown_reference_fails_its_operation(services: SimpleNamespace, reference: str):
+    with pytest.raises(BatchOperationError) as error:
+        run_batch(services, [
+            {'op': 'create_group', 'group': {'name': 'menu'}},
+            # a temp id is only known after the operation that assigns it
+            {'op': 'delete_group', 'group_id': reference},
+            {'op': 'create_group', 'temp_id': 'later', 'group': {'name': 'later'}},
+        ])
+
+    assert error.value.index == 1
+    assert isinstance(error.value.error, UnknownBatchReferenceError)
+    services.group_service.delete_group.assert_not_awaited()
+
+
+def test_duplicate_temp_id_fails_its_operation(services: SimpleNamespace):
+    with pytest.raises(BatchOperationError) as error:
+        run_batch(services, [
+            {'op': 'create_group', 'temp_id': 'menu', 'group': {'name': 'menu'}},
+            {'op': 'create_group', 'temp_id': 'other', 'group': {'name': 'other'}},
+            {'op': 'create_group', 'temp_id': 'menu', 'group': {'name': 'menu again'}},
+        ])
+
+    assert error.value.index == 2
+    assert isinstance(error.value.error, DuplicateBatchTempIdError)
+
+
+def test_failing_operation_stops_the_batch(services: SimpleNamespace):
+    services.button_service.delete_button.side_effect = ButtonNotFoundError
+    group_id = str(uuid4())
+
+    with pytest.raises(BatchOperationError) as error:
+        run_batch(services, [
+            {'op': 'create_group', 'group': {'name': 'menu'}},
+            {'op': 'delete_button', 'group_id': group_id, 'button_id': str(uuid4())},
+            {'op': 'delete_group', 'group_id': group_id},
+        ])
+
+    assert error.value.index == 1
+    assert isinstance(error.value.error, ButtonNotFoundError)
+    services.group_service.delete_group.assert_not_awaited()
+
+
+@pytest.mark.parametrize('schema, field', [
+    (BatchButtonIdWithSeqNumber, 'button_id'),
+    (BatchActionIdWithSeqNumber, 'action_id'),
+])
+def test_sequence_numbers_start_at_one(schema, field: str):
+    assert schema.model_validate({field: 'new', 'sequence_number': 1}).sequence_number == 1
+    with pytest.raises(ValidationError):
+        schema.model_validate({field: 'new', 'sequence_number': 0})
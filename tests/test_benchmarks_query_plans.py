@@ -0,0 +1,21 @@
+import asyncio
+
+import pytest
+
+from src.core.db import engine
+from benchmarks.query_plans import run_check
+
+pytestmark = pytest.mark.db
+
+
+async def _run_check() -> bool:
+    try:
+        # enough rows for every seeded table to count as large
+        return await run_check(projects_count=200, groups_count=20, min_rows=2_000)
+    finally:
+        # the pooled connections belong to this event loop
+        await engine.dispose()
+
+
+def test_repository_queries_do_not_scan_large_tables():
+    assert asyncio.run(_run_check())
@@ -0,0 +1,66 @@
+from uuid import uuid4
+
+from src.core.cache import ProjectCache, _ENTRY_OVERHEAD
+
+
+def test_entries_are_returned_only_for_their_version():
+    cache = ProjectCache(max_bytes=10_000)
+    project_id = uuid4()
+    cache.put(project_id, 'groups', 'value', size=10, version=2)
+
+    assert cache.get(project_id, 'groups', version=2) == 'value'
+    assert cache.get(project_id, 'groups', version=1) is None
+    assert cache.get(project_id, 'groups', version=3) is None
+    assert cache.get(project_id, 'graph', version=2) is None
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.stale) == (1, 3, 2)
+
+
+def test_older_version_does_not_replace_a_newer_one():
+    cache = ProjectCache(max_bytes=10_000)
+    project_id = uuid4()
+    cache.put(project_id, 'groups', 'new', size=10, version=3)
+    cache.put(project_id, 'groups', 'old', size=10, version=2)
+
+    assert cache.get(project_id, 'groups', version=3) == 'new'
+    assert cache.size == 10 + _ENTRY_OVERHEAD
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ProjectCache(max_bytes=3 * (100 + _ENTRY_OVERHEAD))
+    project_ids = [uuid4() for _ in range(4)]
+    for project_id in project_ids[:3]:
+        cache.put(project_id, 'groups', project_id, size=100, version=1)
+    cache.get(project_ids[0], 'groups', version=1)
+
+    cache.put(project_ids[3], 'groups', project_ids[3], size=100, version=1)
+
+    assert cache.get(project_ids[1], 'groups', version=1) is None
+    assert cache.get(project_ids[0], 'groups', version=1) == project_ids[0]
+    assert cache.stats.evictions == 1
+    assert cache.size <= cache.max_bytes
+
+
+def test_oversize_entries_are_not_cached():
+    cache = ProjectCache(max_bytes=1000)
+    cache.put(uuid4(), 'groups', 'value', size=1000, version=1)
+
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_invalidate_drops_every_key_of_the_project():
+    cache = ProjectCache(max_bytes=10_000)
+    project_id, other_project_id = uuid4(), uuid4()
+    cache.put(project_id, 'groups', 'groups', size=10, version=1)
+    cache.put(project_id, 'graph', 'graph', size=10, version=1)
+    cache.put(other_project_id, 'groups', 'other', size=10, version=1)
+
+    cache.invalidate(project_id)
+
+    assert len(cache) == 1
+    assert cache.get(other_project_id, 'groups', version=1) == 'other'
+    assert cache.size == 10 + _ENTRY_OVERHEAD
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
@@ -0,0 +1,82 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from src.core import replica, settings
+from src.core.db import read_only_session_maker
+
+
+@pytest.mark.parametrize('token, lsn', [
+    ('0/0', 0),
+    ('0/16B3748', 0x16B3748),
+    ('1A/2F', 0x1A << 32 | 0x2F),
+    ('ffffffff/ffffffff', 2 ** 64 - 1),
+])
+def test_parse_lsn(token: str, lsn: int):
+    assert replica.parse_lsn(token) == lsn
+
+
+@pytest.mark.parametrize('token', ['', '16B3748', 'zz/1', '1/zz', '1/2/3', '/', 'null'])
+def test_malformed_token_is_ignored(token: str):
+    assert replica.parse_lsn(token) is None
+
+
+@pytest.fixture
+def replica_session_maker(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+    session_maker = mock.Mock()
+    monkeypatch.setattr(replica, 'replica_session_maker', session_maker)
+    monkeypatch.setattr(replica, '_replayed_lsn', 0)
+    monkeypatch.setattr(replica, 'REPLICA_POLL_INTERVAL', 0.001)
+    monkeypatch.setattr(settings, 'DB_REPLICA_MAX_WAIT', 0.02)
+    return session_maker
+
+
+def stub_replayed_lsn(monkeypatch: pytest.MonkeyPatch, **kwargs) -> mock.AsyncMock:
+    get_replayed_lsn = mock.AsyncMock(**kwargs)
+    monkeypatch.setattr(replica, '_get_replayed_lsn', get_replayed_lsn)
+    return get_replayed_lsn
+
+
+def get_read_session_maker(token):
+    return asyncio.run(replica.get_read_session_maker(token))
+
+
+def test_primary_without_a_replica(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(replica, 'replica_session_maker', None)
+
+    assert get_read_session_maker('0/10') is read_only_session_maker
+
+
+@pytest.mark.parametrize('token', [None, 'garbage', '1/2/3'])
+def test_reads_without_a_usable_token_go_to_the_replica(
+        monkeypatch: pytest.MonkeyPatch,
+        replica_session_maker: mock.Mock,
+        token,
+):
+    get_replayed_lsn = stub_replayed_lsn(monkeypatch, return_value=0)
+
+    assert get_read_session_maker(token) is replica_session_maker
+    get_replayed_lsn.assert_not_awaited()
+
+
+def test_replica_that_caught_up_serves_the_read(monkeypatch: pytest.MonkeyPatch, replica_session_maker: mock.Mock):
+    # the first poll is behind, the second one has replayed the client's write
+    stub_replayed_lsn(monkeypatch, side_effect=[0x10, 0x30])
+
+    assert get_read_session_maker('0/20') is replica_session_maker
+    # a read up to the position already seen replayed needs no poll
+    assert get_read_session_maker('0/30') is replica_session_maker
+
+
+def test_lagging_replica_falls_back_to_the_primary(monkeypatch: pytest.MonkeyPatch, replica_session_maker: mock.Mock):
+    get_replayed_lsn = stub_replayed_lsn(monkeypatch, return_value=0x10)
+
+    assert get_read_session_maker('0/20') is read_only_session_maker
+    assert get_replayed_lsn.await_count > 1
+
+
+def test_unreachable_replica_falls_back_to_the_primary(monkeypatch: pytest.MonkeyPatch, replica_session_maker: mock.Mock):
+    stub_replayed_lsn(monkeypatch, side_effect=ConnectionRefusedError)
+
+    assert get_read_session_maker('0/20') is read_only_session_maker
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from src.core.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_load():
+    async def run():
+        flights = SingleFlight()
+        loads = 0
+
+        async def load():
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return 'value'
+
+        results = await asyncio.gather(*(flights.run('key', load) for _ in range(5)))
+        return flights, loads, results
+
+    flights, loads, results = asyncio.run(run())
+
+    assert results == ['value'] * 5
+    assert loads == 1
+    assert (flights.stats.loads, flights.stats.coalesced) == (1, 4)
+    assert len(flights) == 0
+
+
+def test_different_keys_load_separately():
+    async def run():
+        flights = SingleFlight()
+
+        async def load(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        return flights, await asyncio.gather(flights.run(1, lambda: load(1)), flights.run(2, lambda: load(2)))
+
+    flights, results = asyncio.run(run())
+
+    assert results == [1, 2]
+    assert flights.stats.loads == 2
+
+
+def test_waiting_callers_get_the_error():
+    async def run():
+        flights = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise ValueError('load failed')
+
+        return await asyncio.gather(*(flights.run('key', load) for _ in range(3)), return_exceptions=True)
+
+    errors = asyncio.run(run())
+
+    assert [type(error) for error in errors] == [ValueError] * 3
+
+
+def test_waiting_caller_loads_when_the_first_is_cancelled():
+    async def run():
+        flights = SingleFlight()
+        started = asyncio.Event()
+
+        async def slow_load():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def load():
+            return 'value'
+
+        first = asyncio.create_task(flights.run('key', slow_load))
+        await started.wait()
+        second = asyncio.create_task(flights.run('key', load))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return flights, await second
+
+    flights, result = asyncio.run(run())
+
+    assert result == 'value'
+    assert flights.stats.loads == 2
+    assert len(flights) == 0
@@ -0,0 +1,54 @@
+from unittest import mock
+
+import pytest
+
+from src.core import utils
+from src.core.utils import uuid7
+
+
+@pytest.fixture(autouse=True)
+def last_uuid7(monkeypatch: pytest.MonkeyPatch):
+    # the mocked clocks below must not leak into ids generated by other tests
+    monkeypatch.setattr(utils, '_last_uuid7_timestamp', 0)
+    monkeypatch.setattr(utils, '_last_uuid7_counter', 0)
+
+
+def test_uuid7_has_version_and_variant_bits():
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.int >> 62 & 0b11 == 0b10
+
+
+def test_uuid7_carries_the_unix_milliseconds():
+    with mock.patch('time.time_ns', return_value=1_700_000_000_123_456_789):
+        value = uuid7()
+
+    assert value.int >> 80 >= 1_700_000_000_123
+
+
+def test_uuid7_keeps_increasing_within_one_millisecond():
+    with mock.patch('time.time_ns', return_value=1_800_000_000_000_000_000):
+        values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_uuid7_keeps_increasing_when_the_clock_goes_back():
+    with mock.patch('time.time_ns', return_value=1_900_000_000_000_000_000):
+        before = uuid7()
+    with mock.patch('time.time_ns', return_value=1_000_000_000_000_000_000):
+        after = uuid7()
+
+    assert after > before
+
+
+def test_uuid7_counter_overflow_moves_to_the_next_millisecond():
+    with mock.patch('time.time_ns', return_value=2_000_000_000_000_000_000):
+        before = uuid7()
+        utils._last_uuid7_counter = utils._UUID7_COUNTER_MAX
+        after = uuid7()
+
+    assert after > before
+    assert after.int >> 80 == (before.int >> 80) + 1
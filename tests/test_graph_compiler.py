@@ -0,0 +1,112 @@
+from uuid import uuid4
+
+import pytest
+
+from src.graph.compiler import CompiledGraph, NO_GROUP, compile_graph
+from src.graph.enums import GraphEdgeKind
+from src.inputs.enums import InputType
+
+
+@pytest.fixture
+def group_ids():
+    return [uuid4() for _ in range(3)]
+
+
+def test_edges_are_grouped_by_source_in_display_order(group_ids):
+    first, second, third = uuid4(), uuid4(), uuid4()
+    graph = compile_graph(
+        project_id=uuid4(),
+        group_ids=group_ids,
+        edges=[
+            (first, GraphEdgeKind.BUTTON, group_ids[1], group_ids[0], 'a', None),
+            (second, GraphEdgeKind.BUTTON, group_ids[0], group_ids[2], 'b', None),
+            (third, GraphEdgeKind.BUTTON, group_ids[1], None, 'c', None),
+        ],
+        actions=[],
+    )
+
+    assert graph.edge_offsets.tolist() == [0, 1, 3, 3]
+    assert graph.edge_targets.tolist() == [2, 0, NO_GROUP]
+    assert [graph.get_edge_id(edge_index) for edge_index in graph.get_edge_range(1)] == [first, third]
+    assert graph.start_index == 0
+
+
+def test_destinations_by_payload_and_input_type(group_ids):
+    graph = compile_graph(
+        project_id=uuid4(),
+        group_ids=group_ids,
+        edges=[
+            (uuid4(), GraphEdgeKind.BUTTON, group_ids[0], group_ids[1], 'menu', None),
+            # a reused payload keeps the first button
+            (uuid4(), GraphEdgeKind.BUTTON, group_ids[0], group_ids[2], 'menu', None),
+            (uuid4(), GraphEdgeKind.INPUT, group_ids[0], group_ids[2], None, InputType.INT.value),
+        ],
+        actions=[(group_ids[0], 'text_message', 'hello')],
+    )
+
+    assert graph.get_button_destination(0, 'menu') == 1
+    assert graph.get_button_destination(0, 'unknown') == NO_GROUP
+    assert graph.get_input_destination(0, InputType.INT.value) == 2
+    assert graph.get_edge_kind(2) == GraphEdgeKind.INPUT
+    assert graph.actions == ((('text_message', 'hello'),), (), ())
+
+
+def test_linked_button_takes_a_payload_from_an_unlinked_one(group_ids):
+    graph = compile_graph(
+        project_id=uuid4(),
+        group_ids=group_ids,
+        edges=[
+            (uuid4(), GraphEdgeKind.BUTTON, group_ids[0], None, 'menu', None),
+            (uuid4(), GraphEdgeKind.BUTTON, group_ids[0], group_ids[2], 'menu', None),
+            (uuid4(), GraphEdgeKind.BUTTON, group_ids[0], group_ids[1], 'menu', None),
+            (uuid4(), GraphEdgeKind.BUTTON, group_ids[1], None, 'back', None),
+            (uuid4(), GraphEdgeKind.BUTTON, group_ids[1], None, 'back', None),
+        ],
+        actions=[],
+    )
+
+    assert graph.get_button_destination(0, 'menu') == 2
+    assert graph.get_button_destination(1, 'back') == NO_GROUP
+
+
+def test_rows_of_unknown_groups_are_left_out(group_ids):
+    unknown_group_id = uuid4()
+    graph = compile_graph(
+        project_id=uuid4(),
+        group_ids=group_ids,
+        edges=[
+            (uuid4(), GraphEdgeKind.BUTTON, unknown_group_id, group_ids[0], 'a', None),
+            (uuid4(), GraphEdgeKind.BUTTON, group_ids[0], unknown_group_id, 'b', None),
+        ],
+        actions=[(unknown_group_id, 'text_message', 'hello')],
+    )
+
+    assert graph.edge_offsets.tolist() == [0, 1, 1, 1]
+    assert graph.edge_targets.tolist() == [NO_GROUP]
+    assert graph.actions == ((), (), ())
+
+
+def test_empty_project_has_no_start_group():
+    graph = compile_graph(project_id=uuid4(), group_ids=[], edges=[], actions=[])
+
+    assert len(graph) == 0
+    assert graph.start_index == NO_GROUP
+
+
+def test_dumps_and_loads_round_trip(group_ids):
+    graph = compile_graph(
+        project_id=uuid4(),
+        group_ids=group_ids,
+        edges=[(uuid4(), GraphEdgeKind.BUTTON, group_ids[2], group_ids[1], 'a', None)],
+        actions=[(group_ids[1], 'image_message', '/image.png')],
+    )
+
+    loaded = CompiledGraph.loads(graph.dumps())
+
+    assert loaded.project_id == graph.project_id
+    assert loaded.group_indexes == graph.group_indexes
+    assert loaded.edge_offsets.tolist() == graph.edge_offsets.tolist()
+    assert loaded.edge_targets.tolist() == graph.edge_targets.tolist()
+    assert loaded.edge_ids == graph.edge_ids
+    assert loaded.button_destinations == graph.button_destinations
+    assert loaded.actions == graph.actions
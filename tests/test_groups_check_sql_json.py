@@ -0,0 +1,20 @@
+import asyncio
+
+import pytest
+
+from src.core.db import engine
+from src.groups.check_sql_json import run_check
+
+pytestmark = pytest.mark.db
+
+
+async def _run_check() -> bool:
+    try:
+        return await run_check(all_projects=False)
+    finally:
+        # the pooled connections belong to this event loop
+        await engine.dispose()
+
+
+def test_postgres_rendered_groups_match_pydantic():
+    assert asyncio.run(_run_check())
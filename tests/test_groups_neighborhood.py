@@ -0,0 +1,160 @@
+import random
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import insert, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.buttons.models import ButtonModel
+from src.graph.check_edges import get_drifted_project_ids, rebuild_project_edges
+from src.graph.enums import GraphEdgeKind
+from src.graph.models import GroupEdgeModel
+from src.graph.utils import fill_group_edges
+from src.groups.enums import NeighborhoodDirection
+from src.groups.models import GroupModel
+from src.groups.repositories import GroupRepository
+from src.inputs.enums import InputType
+from src.inputs.models import InputModel
+from src.ordering.utils import RANK_GAP
+from src.projects.models import ProjectModel
+from tests.utils import run_in_rolled_back_session
+
+pytestmark = pytest.mark.db
+
+Edge = tuple[UUID, UUID]
+
+
+async def seed_project(session: AsyncSession, rnd: random.Random, groups_count: int) -> tuple[UUID, list[UUID], list[Edge]]:
+    # buttons and inputs with random destinations, self loops and cycles included
+    project_id = uuid4()
+    group_ids = [uuid4() for _ in range(groups_count)]
+    created_at = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    await session.execute(insert(ProjectModel), [{'project_id': project_id, 'name': 'neighborhood'}])
+    await session.execute(insert(GroupModel), [
+        {'group_id': group_id, 'project_id': project_id, 'name': f'group {i}', 'created_at': created_at + timedelta(seconds=i)}
+        for i, group_id in enumerate(group_ids)
+    ])
+
+    buttons = [
+        {
+            'group_id': group_id,
+            'destination_group_id': rnd.choice(group_ids) if rnd.random() < 0.8 else None,
+            'text': f'button {j}',
+            'payload': f'button_{j}',
+            'sequence_number': (j + 1) * RANK_GAP,
+        }
+        for group_id in group_ids
+        for j in range(rnd.randint(0, 2))
+    ]
+    inputs = [
+        {'group_id': group_id, 'destination_group_id': rnd.choice(group_ids), 'type': input_type}
+        for group_id in group_ids
+        for input_type in rnd.sample(list(InputType), rnd.randint(0, 1))
+    ]
+    if buttons:
+        await session.execute(insert(ButtonModel), buttons)
+    if inputs:
+        await session.execute(insert(InputModel), inputs)
+    await fill_group_edges(session, project_id)
+
+    edges = [
+        (row['group_id'], row['destination_group_id'])
+        for row in buttons + inputs
+        if row['destination_group_id'] is not None
+    ]
+    return project_id, group_ids, edges
+
+
+def find_neighborhood(edges: list[Edge], group_id: UUID, depth: int, direction: NeighborhoodDirection) -> dict[UUID, int]:
+    # breadth first search over the seeded rows, the depth each group is first reached at
+    neighbors: dict[UUID, list[UUID]] = {}
+    for source, target in edges:
+        if direction != NeighborhoodDirection.IN:
+            neighbors.setdefault(source, []).append(target)
+        if direction != NeighborhoodDirection.OUT:
+            neighbors.setdefault(target, []).append(source)
+
+    depths = {group_id: 0}
+    queue = deque([group_id])
+    while queue:
+        current = queue.popleft()
+        if depths[current] == depth:
+            continue
+        for neighbor in neighbors.get(current, ()):
+            if neighbor not in depths:
+                depths[neighbor] = depths[current] + 1
+                queue.append(neighbor)
+    return depths
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_neighborhood_matches_breadth_first_search(seed: int):
+    async def test(session: AsyncSession):
+        rnd = random.Random(seed)
+        project_id, group_ids, edges = await seed_project(session, rnd, groups_count=25)
+        repository = GroupRepository(session)
+
+        for group_id in rnd.sample(group_ids, 4):
+            for direction in NeighborhoodDirection:
+                for depth in range(4):
+                    groups = await repository.get_neighborhood(project_id, group_id, depth, direction, limit=100)
+
+                    expected = find_neighborhood(edges, group_id, depth, direction)
+                    assert {group.group_id for group in groups} == set(expected)
+
+    run_in_rolled_back_session(test)
+
+
+def test_neighborhood_limit_keeps_the_closest_groups():
+    async def test(session: AsyncSession):
+        rnd = random.Random(7)
+        project_id, group_ids, edges = await seed_project(session, rnd, groups_count=40)
+        repository = GroupRepository(session)
+
+        for group_id in rnd.sample(group_ids, 5):
+            expected = find_neighborhood(edges, group_id, 3, NeighborhoodDirection.BOTH)
+            closest = sorted(expected, key=lambda neighbor: (expected[neighbor], neighbor))[:5]
+
+            groups = await repository.get_neighborhood(project_id, group_id, 3, NeighborhoodDirection.BOTH, limit=5)
+
+            assert {group.group_id for group in groups} == set(closest)
+
+    run_in_rolled_back_session(test)
+
+
+def test_rebuild_repairs_drifted_edges():
+    async def test(session: AsyncSession):
+        rnd = random.Random(3)
+        project_id, group_ids, edges = await seed_project(session, rnd, groups_count=10)
+        assert project_id not in await get_drifted_project_ids(session)
+
+        # one edge missing, one pointing to another group, one left by a deleted button
+        stored_edges = (await session.execute(
+            delete(GroupEdgeModel)
+            .where(GroupEdgeModel.project_id == project_id)
+            .returning(GroupEdgeModel.ref_id, GroupEdgeModel.src_group_id, GroupEdgeModel.dst_group_id)
+        )).all()
+        await fill_group_edges(session, project_id)
+        missing, moved = stored_edges[0], stored_edges[1]
+        await session.execute(delete(GroupEdgeModel).where(GroupEdgeModel.ref_id == missing.ref_id))
+        await session.execute(
+            update(GroupEdgeModel)
+            .where(GroupEdgeModel.ref_id == moved.ref_id)
+            .values(dst_group_id=next(group_id for group_id in group_ids if group_id != moved.dst_group_id))
+        )
+        await session.execute(insert(GroupEdgeModel), [{
+            'ref_id': uuid4(),
+            'kind': GraphEdgeKind.BUTTON,
+            'project_id': project_id,
+            'src_group_id': group_ids[0],
+            'dst_group_id': group_ids[1],
+        }])
+        assert project_id in await get_drifted_project_ids(session)
+
+        await rebuild_project_edges(session, project_id)
+
+        assert project_id not in await get_drifted_project_ids(session)
+
+    run_in_rolled_back_session(test)
@@ -0,0 +1,139 @@
+import random
+from unittest import mock
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.buttons.models import ButtonModel
+from src.buttons.repositories import ButtonRepository
+from src.buttons.schemas import ButtonCreateSchema
+from src.groups.repositories import GroupRepository
+from src.groups.schemas import GroupCreateSchema
+from src.ordering import utils
+from src.ordering.enums import MovePosition
+from src.ordering.schemas import MoveSchema
+from src.ordering.utils import RANK_GAP, get_rank_between, get_rank_by_position
+from src.projects.repositories import ProjectRepository
+from src.projects.schemas import ProjectCreateSchema
+from tests.utils import run_in_rolled_back_session
+
+
+def test_rank_between_takes_the_midpoint():
+    assert get_rank_between(0, RANK_GAP) == RANK_GAP // 2
+    assert get_rank_between(RANK_GAP, 2 * RANK_GAP) == RANK_GAP + RANK_GAP // 2
+    assert get_rank_between(4, 7) == 5
+
+
+@pytest.mark.parametrize('lower_rank, upper_rank', [(5, 6), (5, 5), (0, 1)])
+def test_rank_between_exhausted_gap(lower_rank: int, upper_rank: int):
+    assert get_rank_between(lower_rank, upper_rank) is None
+
+
+def test_gap_absorbs_sixteen_moves():
+    lower_rank, upper_rank = get_rank_by_position(1), get_rank_by_position(2)
+    moves = 0
+    # every move into the same gap halves it
+    while (rank := get_rank_between(lower_rank, upper_rank)) is not None:
+        assert lower_rank < rank < upper_rank
+        upper_rank = rank
+        moves += 1
+
+    assert moves == 16
+
+
+async def create_buttons(session: AsyncSession, count: int) -> tuple[ButtonRepository, UUID, UUID, list[UUID]]:
+    project = await ProjectRepository(session).create_project(ProjectCreateSchema(name='ordering'))
+    group = await GroupRepository(session).create_group(project.project_id, GroupCreateSchema(name='group'))
+    repository = ButtonRepository(session)
+    button_ids = []
+    for i in range(count):
+        button = await repository.create_button(
+            project.project_id,
+            group.group_id,
+            ButtonCreateSchema(text=f'button {i}', payload=f'button_{i}'),
+        )
+        button_ids.append(button.button_id)
+    return repository, project.project_id, group.group_id, button_ids
+
+
+async def get_ranks(session: AsyncSession, group_id: UUID) -> dict[UUID, int]:
+    ranks = await session.execute(
+        select(ButtonModel.button_id, ButtonModel.sequence_number)
+        .where(ButtonModel.group_id == group_id)
+    )
+    return dict(ranks.all())
+
+
+@pytest.mark.db
+def test_move_to_the_first_and_last_position():
+    async def test(session: AsyncSession):
+        repository, project_id, group_id, button_ids = await create_buttons(session, 4)
+
+        first = await repository.move_button(project_id, group_id, button_ids[2], MoveSchema(
+            anchor_id=button_ids[0],
+            position=MovePosition.BEFORE,
+        ))
+        last = await repository.move_button(project_id, group_id, button_ids[1], MoveSchema(
+            anchor_id=button_ids[3],
+            position=MovePosition.AFTER,
+        ))
+
+        ranks = await get_ranks(session, group_id)
+        assert 0 < first.sequence_number < ranks[button_ids[0]]
+        # moving after the last button appends, the group counter hands out the next rank
+        assert last.sequence_number == 5 * RANK_GAP
+        buttons = await repository.get_buttons(group_id)
+        assert [button.button_id for button in buttons] == [button_ids[2], button_ids[0], button_ids[3], button_ids[1]]
+        assert [button.sequence_number for button in buttons] == [1, 2, 3, 4]
+
+    run_in_rolled_back_session(test)
+
+
+@pytest.mark.db
+def test_exhausted_gap_is_rebalanced():
+    async def test(session: AsyncSession):
+        repository, project_id, group_id, button_ids = await create_buttons(session, 3)
+        order = list(button_ids)
+
+        with mock.patch.object(utils, 'rebalance_ranks', wraps=utils.rebalance_ranks) as rebalance_ranks:
+            # the last button goes before the first one over and over, halving the gap above zero
+            for _ in range(20):
+                await repository.move_button(project_id, group_id, order[-1], MoveSchema(
+                    anchor_id=order[0],
+                    position=MovePosition.BEFORE,
+                ))
+                order.insert(0, order.pop())
+
+                buttons = await repository.get_buttons(group_id)
+                assert [button.button_id for button in buttons] == order
+                ranks = await get_ranks(session, group_id)
+                assert all(rank > 0 for rank in ranks.values())
+
+        assert rebalance_ranks.call_count >= 1
+
+    run_in_rolled_back_session(test)
+
+
+@pytest.mark.db
+def test_random_moves_keep_the_order():
+    async def test(session: AsyncSession):
+        rnd = random.Random(11)
+        repository, project_id, group_id, order = await create_buttons(session, 5)
+
+        for _ in range(60):
+            button_id, anchor_id = rnd.sample(order, 2)
+            position = rnd.choice(list(MovePosition))
+            await repository.move_button(project_id, group_id, button_id, MoveSchema(
+                anchor_id=anchor_id,
+                position=position,
+            ))
+            order.remove(button_id)
+            order.insert(order.index(anchor_id) + (position == MovePosition.AFTER), button_id)
+
+            buttons = await repository.get_buttons(group_id)
+            assert [button.button_id for button in buttons] == order
+            assert len(set((await get_ranks(session, group_id)).values())) == len(order)
+
+    run_in_rolled_back_session(test)
@@ -0,0 +1,46 @@
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.utils import uuid7
+from src.projects.dependencies.etag_dependencies import _is_etag_matching
+from src.projects.schemas import ProjectReadSchema
+from src.projects.utils import decode_project_cursor, encode_project_cursor
+
+
+@pytest.mark.parametrize('if_none_match, is_matching', [
+    ('"5"', True),
+    ('W/"5"', True),
+    ('"4", "5"', True),
+    (' "4" ,W/"5" ', True),
+    ('*', True),
+    ('"4"', False),
+    ('5', False),
+    ('"55"', False),
+    ('', False),
+])
+def test_etag_matching(if_none_match: str, is_matching: bool):
+    assert _is_etag_matching(if_none_match, '"5"') is is_matching
+
+
+def test_cursor_round_trip():
+    project = ProjectReadSchema(
+        project_id=uuid7(),
+        name='project',
+        created_at=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+    )
+
+    assert decode_project_cursor(encode_project_cursor(project)) == (project.created_at, project.project_id)
+
+
+@pytest.mark.parametrize('cursor', [
+    'not a cursor',
+    base64.urlsafe_b64encode(b'2024-05-01T12:30:15+00:00').decode(),
+    base64.urlsafe_b64encode(b'2024-05-01T12:30:15+00:00|not-a-uuid').decode(),
+    # cursors are only ever made from aware datetimes
+    base64.urlsafe_b64encode(f'2024-05-01T12:30:15|{uuid7()}'.encode()).decode(),
+    base64.urlsafe_b64encode(b'\xff\xfe').decode(),
+])
+def test_bad_cursor_is_rejected(cursor: str):
+    assert decode_project_cursor(cursor) is None
@@ -0,0 +1,190 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import AsyncIterator
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.actions.models import ActionModel
+from src.buttons.models import ButtonModel
+from src.groups.models import GroupModel
+from src.inputs.models import InputModel
+from src.transfers import api
+from src.transfers.exceptions.services_exceptions import InvalidImportRecordError, UnknownImportReferenceError
+from src.transfers.services import IMPORT_COLUMNS, TransferService
+from src.transfers.utils import iter_ndjson_lines
+
+CREATED_AT = datetime(2024, 5, 1, tzinfo=timezone.utc).isoformat()
+
+
+async def iter_chunks(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def read_lines(chunks: list[bytes]) -> list[tuple[int, bytes]]:
+    async def read():
+        return [line async for line in iter_ndjson_lines(iter_chunks(chunks))]
+
+    return asyncio.run(read())
+
+
+def test_lines_split_across_chunks():
+    assert read_lines([b'{"a"', b': 1}\n{"b": 2', b'}\n', b'{"c": 3}\n']) == [
+        (1, b'{"a": 1}'),
+        (2, b'{"b": 2}'),
+        (3, b'{"c": 3}'),
+    ]
+
+
+def test_newline_at_a_chunk_boundary():
+    assert read_lines([b'{"a": 1}', b'\n', b'\n{"b": 2}\n']) == [(1, b'{"a": 1}'), (3, b'{"b": 2}')]
+
+
+def test_last_line_without_newline():
+    assert read_lines([b'{"a": 1}\n{"b"', b': 2}']) == [(1, b'{"a": 1}'), (2, b'{"b": 2}')]
+
+
+def test_blank_lines_are_skipped_but_counted():
+    assert read_lines([b'\n  \n{"a": 1}\r\n', b'', b'\n']) == [(3, b'{"a": 1}\r')]
+
+
+class FakeTransferRepository:
+    # keeps the copied rows by table instead of running COPY
+    def __init__(self):
+        self.rows: dict[type, list[dict]] = {model: [] for model in IMPORT_COLUMNS}
+
+    async def copy_records(self, model: type, columns: tuple[str, ...], records: list[tuple]) -> bool:
+        self.rows[model] += [dict(zip(columns, record)) for record in records]
+        return True
+
+    async def recount_group_counters(self, project_id):
+        pass
+
+    async def fill_group_edges(self, project_id):
+        pass
+
+
+def dump_records(records: list[dict]) -> bytes:
+    return b''.join(json.dumps(record).encode() + b'\n' for record in records)
+
+
+def import_records(repository: FakeTransferRepository, data: bytes, chunk_size: int = 7):
+    service = TransferService(transfer_repository=repository, scope_service=None)
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+    return asyncio.run(service.import_project(iter_chunks(chunks)))
+
+
+def build_export() -> tuple[list[dict], list[str]]:
+    group_ids = [str(uuid4()) for _ in range(2)]
+    return [
+        {'record': 'project', 'format_version': 1, 'project_id': str(uuid4()), 'name': 'bot', 'created_at': CREATED_AT},
+        *(
+            {'record': 'group', 'group_id': group_id, 'name': f'group {i}', 'created_at': CREATED_AT}
+            for i, group_id in enumerate(group_ids)
+        ),
+        {
+            'record': 'button',
+            'button_id': str(uuid4()),
+            'group_id': group_ids[0],
+            'destination_group_id': group_ids[1],
+            'text': 'next',
+            'payload': 'next',
+            'sequence_number': 65536,
+            'created_at': CREATED_AT,
+        },
+        {
+            'record': 'input',
+            'input_id': str(uuid4()),
+            'group_id': group_ids[1],
+            'destination_group_id': group_ids[0],
+            'type': 'any',
+            'created_at': CREATED_AT,
+        },
+        {
+            'record': 'action',
+            'action_id': str(uuid4()),
+            'group_id': group_ids[1],
+            'type': 'text_message',
+            'content': 'hello',
+            'sequence_number': 65536,
+            'created_at': CREATED_AT,
+        },
+    ], group_ids
+
+
+def test_import_remaps_ids_to_new_ones():
+    records, old_group_ids = build_export()
+    repository = FakeTransferRepository()
+
+    project = import_records(repository, dump_records(records))
+
+    groups = repository.rows[GroupModel]
+    new_group_ids = [group['group_id'] for group in groups]
+    assert [group['project_id'] for group in groups] == [project.project_id] * 2
+    assert not {str(group_id) for group_id in new_group_ids} & set(old_group_ids)
+    [button] = repository.rows[ButtonModel]
+    assert (button['group_id'], button['destination_group_id']) == (new_group_ids[0], new_group_ids[1])
+    assert str(button['button_id']) != records[3]['button_id']
+    assert button['sequence_number'] == 65536
+    [input_field] = repository.rows[InputModel]
+    assert (input_field['group_id'], input_field['destination_group_id']) == (new_group_ids[1], new_group_ids[0])
+    [action] = repository.rows[ActionModel]
+    assert action['group_id'] == new_group_ids[1]
+    assert json.loads(action['payload']) == {'text': 'hello'}
+
+
+def test_unlinked_destination_stays_unlinked():
+    records, _ = build_export()
+    records[3]['destination_group_id'] = None
+    repository = FakeTransferRepository()
+
+    import_records(repository, dump_records(records))
+
+    assert repository.rows[ButtonModel][0]['destination_group_id'] is None
+
+
+def test_unknown_destination_is_reported_with_its_line():
+    records, _ = build_export()
+    records[4]['destination_group_id'] = str(uuid4())
+
+    with pytest.raises(UnknownImportReferenceError) as error:
+        import_records(FakeTransferRepository(), dump_records(records))
+
+    assert error.value.line_number == 5
+
+
+@pytest.mark.parametrize('line', [
+    b'not json',
+    b'\xff\xfe',
+    b'[1, 2]',
+    b'{"record": "group", "group_id": "not-a-uuid", "name": "g", "created_at": "2024-05-01T00:00:00Z"}',
+    b'{"record": "unknown"}',
+])
+def test_malformed_line_is_a_client_error(line: bytes):
+    records, _ = build_export()
+    data = dump_records(records[:2]) + line + b'\n' + dump_records(records[2:])
+
+    async def run():
+        await api.import_project(
+            transfer_service=TransferService(transfer_repository=FakeTransferRepository(), scope_service=None),
+            request=SimpleNamespace(stream=lambda: iter_chunks([data])),
+        )
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(run())
+
+    assert error.value.status_code == 422
+    assert error.value.detail == 'Invalid record at line 3'
+
+
+def test_first_record_must_be_the_project():
+    records, _ = build_export()
+
+    with pytest.raises(InvalidImportRecordError) as error:
+        import_records(FakeTransferRepository(), dump_records(records[1:]))
+
+    assert error.value.line_number == 1
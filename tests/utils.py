@@ -0,0 +1,47 @@
+import asyncio
+import random
+from typing import Awaitable, Callable, Optional, TypeVar
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db import async_session_maker, engine
+from src.graph.compiler import CompiledGraph, compile_graph
+from src.graph.enums import GraphEdgeKind
+
+T = TypeVar('T')
+
+Link = tuple[int, Optional[int]]
+
+
+def build_graph(groups_count: int, links: list[Link]) -> CompiledGraph:
+    # links are (source group index, destination group index or None), each one a button
+    group_ids = [uuid4() for _ in range(groups_count)]
+    edges = [
+        (uuid4(), GraphEdgeKind.BUTTON, group_ids[source], None if target is None else group_ids[target], f'button_{i}', None)
+        for i, (source, target) in enumerate(links)
+    ]
+    return compile_graph(project_id=uuid4(), group_ids=group_ids, edges=edges, actions=[])
+
+
+def build_random_links(rnd: random.Random, groups_count: int, links_count: int) -> list[Link]:
+    return [
+        (rnd.randrange(groups_count), rnd.randrange(groups_count) if rnd.random() < 0.9 else None)
+        for _ in range(links_count)
+    ]
+
+
+def run_in_rolled_back_session(test: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    # repositories only flush, so whatever the test writes is gone with the rollback
+    async def run() -> T:
+        try:
+            async with async_session_maker() as session:
+                try:
+                    return await test(session)
+                finally:
+                    await session.rollback()
+        finally:
+            # the pooled connections belong to this event loop
+            await engine.dispose()
+
+    return asyncio.run(run())